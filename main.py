@@ -17,6 +17,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from src.ui.main_window import MainWindow
 from src.config.settings import AppSettings
 from src.utils.data_manager import DataManager
+from src.utils.events import EventBus
 from src.utils.language import LanguageManager
 from src.utils.time_tracker import TimeTracker
 from src.utils.notes_manager import NotesManager
@@ -34,23 +35,29 @@ def main():
         # Initialize language manager
         lang_manager = LanguageManager(settings.get_language())
         
+        # One event bus for all data managers, so the UI gets one batch of changes per idle cycle
+        event_bus = EventBus()
+        
         # Initialize data manager
-        data_manager = DataManager()
+        data_manager = DataManager(events=event_bus)
         
         # Initialize time tracker
-        time_tracker = TimeTracker()
+        time_tracker = TimeTracker(events=event_bus)
+        
+        # Give questions solved before the question log existed a timeline
+        data_manager.backfill_question_log(time_tracker.sessions)
         
         # Initialize notes manager
-        notes_manager = NotesManager()
+        notes_manager = NotesManager(events=event_bus)
         
         # Initialize goal tracker
-        goal_tracker = GoalTracker()
+        goal_tracker = GoalTracker(events=event_bus)
         
         # Initialize analytics
         analytics = Analytics(data_manager, time_tracker, goal_tracker)
         
         # Initialize export manager
-        export_manager = ExportManager(data_manager, time_tracker, notes_manager, goal_tracker)
+        export_manager = ExportManager(data_manager, time_tracker, notes_manager, goal_tracker, analytics)
         
         # Initialize quote manager
         quote_manager = QuoteManager()
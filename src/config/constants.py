@@ -65,6 +65,30 @@ COLORS = {
     "OVERLAY_DARK": "#334155",    # Overlay dark
 }
 
+# =================================================================
+# Theme Color Roles
+# =================================================================
+# (light, dark) pairs for colors that differ per appearance mode. CustomTkinter
+# re-colors tuple colors in place on set_appearance_mode(), so widgets using these
+# roles need no rebuild when the theme is switched.
+THEME_COLORS = {
+    # Header: pink and white in light mode, black, blue and purple in dark mode
+    "HEADER_BG": (COLORS["CARD_LIGHT"], COLORS["CARD_DARK"]),
+    "HEADER_TEXT": ("#1a1a1a", "#ffffff"),
+    "HEADER_ACCENT_TEXT": ("#ec4899", COLORS["ACCENT_2"]),  # Title and quote
+    "HEADER_BORDER": (COLORS["BORDER_LIGHT"], COLORS["BORDER_DARK"]),
+    "HEADER_BUTTON": ("#ffe4e6", "#1a1a3e"),  # Also the stat cards
+    "HEADER_BUTTON_2": ("#fce7f3", "#2d1b4e"),
+    "HEADER_BUTTON_3": ("#fbcfe8", "#3d1a2a"),
+    "HEADER_BUTTON_4": ("#fdf2f8", "#1a2d3e"),
+    "HEADER_HOVER": ("#ec4899", COLORS["PRIMARY"]),
+    "HEADER_HOVER_2": ("#f43f5e", COLORS["SECONDARY"]),
+    "HEADER_HOVER_3": ("#f43f5e", COLORS["ACCENT"]),
+    "HEADER_HOVER_4": ("#f43f5e", COLORS["HOVER_COLOR"]),
+    "HEADER_MENU_HOVER": ("#f43f5e", COLORS["PRIMARY_DARK"]),
+    "HEADER_MENU_HOVER_2": ("#f43f5e", "#7c3aed"),
+}
+
 # =================================================================
 # File Paths
 # =================================================================
@@ -226,5 +250,45 @@ PERFORMANCE_SETTINGS = {
     "debounce_search_ms": 300,  # Search debounce time in milliseconds
     "enable_chart_animations": False,  # Disable chart animations for better performance
     "chart_dpi": 80,  # Lower DPI for faster rendering
-    "max_subjects_display": 50,  # Maximum subjects to display at once
+    "max_analytics_cache_size": 128,  # Maximum memoized analytics results
+    "subject_view_cache_size": 5,  # Built subject views kept hidden for quick switching
+    "lazy_render_delay_ms": 10,  # Pause between deferred subject sections so input is handled
+}
+
+# =================================================================
+# Forecast Settings
+# =================================================================
+FORECAST_SETTINGS = {
+    "window_days": 28,  # Days of recent history used for the rate fit
+    "confidence_z": 1.96,  # z-score of the confidence band (95%)
+    "min_fit_days": 7,  # Minimum days a rate is fitted over
+}
+
+# =================================================================
+# Correlation Settings
+# =================================================================
+CORRELATION_SETTINGS = {
+    "window_days": 90,  # Days of history the day x subject matrix covers
+    "min_active_days": 5,  # Fewer active days than this gives no correlation
+}
+
+# =================================================================
+# Recommendation Settings
+# =================================================================
+RECOMMENDATION_SETTINGS = {
+    "min_weekly_minutes": 300,  # Less study time this week triggers a warning
+    "stalled_subject_days": 7,  # Days without activity before a subject counts as stalled
+    "neglected_topic_days": 14,  # Days a topic may stay in progress before it is flagged
+    "goal_warning_days": 7,  # Goals due within this many days are checked for risk
+}
+
+# =================================================================
+# Pomodoro Settings
+# =================================================================
+POMODORO_SETTINGS = {
+    "work_minutes": 25,  # Length of a work interval
+    "short_break_minutes": 5,  # Break after a work interval
+    "long_break_minutes": 15,  # Break after every long_break_every work intervals
+    "long_break_every": 4,  # Work intervals per long break
+    "resume_within_minutes": 60,  # A saved schedule older than this is dropped at startup
 }
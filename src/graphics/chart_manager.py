@@ -7,6 +7,7 @@ matplotlib.use('Agg')  # Use non-interactive backend for better performance
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import warnings
+import datetime
 import customtkinter as ctk
 from ..config.constants import COLORS, GRAPH_SETTINGS, PERFORMANCE_SETTINGS
 
@@ -237,4 +238,83 @@ class ChartManager:
         canvas_widget = canvas.get_tk_widget()
         canvas_widget.pack(fill='both', expand=True, padx=5, pady=5)
         canvas.draw()
+    
+    def create_time_histogram_chart(self, master_frame, histograms, theme_mode='dark'):
+        """Create hour-of-day and weekday study histograms"""
+        for widget in master_frame.winfo_children():
+            widget.destroy()
+        
+        theme_mode_lower = theme_mode.lower()
+        axis_color = 'black' if theme_mode_lower == 'light' else 'white'
+        bg_color = '#ffffff' if theme_mode_lower == 'light' else '#1e1e1e'
+        
+        fig = plt.Figure(figsize=(8.5, 3.5),
+                        dpi=GRAPH_SETTINGS.get('figure_dpi', 100))
+        hour_ax = fig.add_subplot(1, 2, 1)
+        weekday_ax = fig.add_subplot(1, 2, 2)
+        
+        weekday_names = self.lang.get("analytics.weekday_names", "Mon,Tue,Wed,Thu,Fri,Sat,Sun").split(",")
+        panels = [
+            (hour_ax, list(range(24)), histograms["hour_minutes"],
+             self.lang.get("analytics.by_hour", "Study minutes by hour"), self.colors['HOVER_COLOR']),
+            (weekday_ax, weekday_names, histograms["weekday_minutes"],
+             self.lang.get("analytics.by_weekday", "Study minutes by weekday"), self.colors['PRIMARY'])
+        ]
+        
+        for ax, labels, values, title, color in panels:
+            ax.bar(range(len(values)), values, color=color, alpha=0.9)
+            ax.set_xticks(range(len(values)))
+            ax.set_xticklabels(labels, fontsize=7 if len(values) > 7 else 9)
+            ax.set_title(title, color=axis_color, fontsize=12, weight='bold')
+            ax.tick_params(colors=axis_color, labelsize=8)
+            ax.grid(True, axis='y', alpha=0.3, linestyle='--', color=axis_color)
+            ax.set_axisbelow(True)
+            ax.set_facecolor(bg_color)
+            for spine in ax.spines.values():
+                spine.set_color(axis_color)
+        
+        fig.patch.set_facecolor(bg_color)
+        fig.tight_layout()
+        
+        canvas = FigureCanvasTkAgg(fig, master=master_frame)
+        canvas_widget = canvas.get_tk_widget()
+        canvas_widget.pack(fill='both', expand=True, padx=5, pady=5)
+        canvas.draw()
 
+    
+    def create_productivity_chart(self, master_frame, series, theme_mode='dark'):
+        """Create the daily productivity score line chart"""
+        for widget in master_frame.winfo_children():
+            widget.destroy()
+        
+        theme_mode_lower = theme_mode.lower()
+        axis_color = 'black' if theme_mode_lower == 'light' else 'white'
+        bg_color = '#ffffff' if theme_mode_lower == 'light' else '#1e1e1e'
+        
+        fig = plt.Figure(figsize=(8.5, 3),
+                        dpi=GRAPH_SETTINGS.get('figure_dpi', 100))
+        ax = fig.add_subplot(1, 1, 1)
+        
+        dates = [datetime.date.fromisoformat(point["date"]) for point in series]
+        scores = [point["score"] for point in series]
+        ax.plot(dates, scores, color=self.colors['HOVER_COLOR'], linewidth=2,
+               marker='o' if len(series) <= 31 else None, markersize=3)
+        ax.fill_between(dates, scores, color=self.colors['HOVER_COLOR'], alpha=0.15)
+        ax.set_ylim(0, 100)
+        ax.set_title(self.lang.get("analytics.productivity_history", "Daily Productivity Score"),
+                    color=axis_color, fontsize=12, weight='bold')
+        ax.tick_params(colors=axis_color, labelsize=8)
+        ax.grid(True, alpha=0.3, linestyle='--', color=axis_color)
+        ax.set_axisbelow(True)
+        ax.set_facecolor(bg_color)
+        for spine in ax.spines.values():
+            spine.set_color(axis_color)
+        fig.autofmt_xdate()
+        
+        fig.patch.set_facecolor(bg_color)
+        fig.tight_layout()
+        
+        canvas = FigureCanvasTkAgg(fig, master=master_frame)
+        canvas_widget = canvas.get_tk_widget()
+        canvas_widget.pack(fill='both', expand=True, padx=5, pady=5)
+        canvas.draw()
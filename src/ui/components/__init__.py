@@ -3,6 +3,8 @@ UI Components
 """
 
 from .dashboard import DashboardWidget
+from .timer_wheel import TimerWheel
+from .translated import TextBindings
+from .virtual_list import VirtualList
 
-__all__ = ['DashboardWidget']
-
+__all__ = ['DashboardWidget', 'TextBindings', 'TimerWheel', 'VirtualList']
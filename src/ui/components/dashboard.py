@@ -4,16 +4,34 @@ Dashboard Widget Component - Ultra Modern Design
 
 import customtkinter as ctk
 from ...config.constants import COLORS
+from .fonts import get_font
 
 class DashboardWidget(ctk.CTkFrame):
     """Ultra modern dashboard widget with enhanced visuals"""
     
-    def __init__(self, master, data_manager, time_tracker, analytics, lang_manager, **kwargs):
+    # (value key, title key, default title, emoji, row, column, gradient colors, accent color)
+    CARDS = [
+        ("today_time", "dashboard.today_time", "Today's Time", "⏱️", 0, 0,
+         (COLORS["GRADIENT_3_START"], COLORS["GRADIENT_3_END"]), COLORS["INFO"]),
+        ("today_questions", "dashboard.today_questions", "Today's Questions", "📚", 0, 1,
+         (COLORS["GRADIENT_2_START"], COLORS["GRADIENT_2_END"]), COLORS["ERROR"]),
+        ("productivity", "dashboard.productivity", "Productivity", "📈", 0, 2,
+         (COLORS["GRADIENT_1_START"], COLORS["GRADIENT_1_END"]), COLORS["HOVER_COLOR"]),
+        ("streak", "dashboard.streak", "Study Streak", "🔥", 1, 0,
+         ("#ff6b6b", "#ee5a6f"), COLORS["WARNING"]),
+        ("progress", "dashboard.overall_progress", "Overall Progress", "🎯", 1, 1,
+         ("#51cf66", "#40c057"), COLORS["SUCCESS"]),
+        ("topics", "dashboard.completed_topics", "Completed Topics", "✅", 1, 2,
+         (COLORS["SECONDARY"], "#9b59b6"), "#9b59b6"),
+    ]
+    
+    def __init__(self, master, data_manager, time_tracker, analytics, lang_manager, snapshot=None, **kwargs):
         super().__init__(master, **kwargs)
         self.data_manager = data_manager
         self.time_tracker = time_tracker
         self.analytics = analytics
         self.lang = lang_manager
+        self.snapshot = snapshot  # Shared DashboardSnapshot, computed on demand if not given
         
         # Modern card background colors
         self.card_bg_light = COLORS.get("CARD_LIGHT", "#f8fafc")
@@ -28,17 +46,19 @@ class DashboardWidget(ctk.CTkFrame):
     
     def create_widgets(self):
         """Create ultra modern dashboard widgets"""
+        snapshot = self.snapshot or self.analytics.dashboard_snapshot()
+        
         # Title with gradient effect simulation
         title_frame = ctk.CTkFrame(self, fg_color="transparent")
         title_frame.pack(fill="x", padx=28, pady=(28, 18))
         
-        title = ctk.CTkLabel(
+        self.title_label = ctk.CTkLabel(
             title_frame,
             text=self.lang.get("dashboard.title", "Dashboard"),
-            font=ctk.CTkFont(size=30, weight="bold"),
+            font=get_font(size=30, weight="bold"),
             text_color=(COLORS["PRIMARY"], COLORS["PRIMARY_LIGHT"])
         )
-        title.pack(side="left")
+        self.title_label.pack(side="left")
         
         # Stats grid with ultra modern cards
         stats_frame = ctk.CTkFrame(self, fg_color="transparent")
@@ -48,83 +68,42 @@ class DashboardWidget(ctk.CTkFrame):
         for i in range(3):
             stats_frame.grid_columnconfigure(i, weight=1, uniform="equal")
         
-        # Today's stats
-        today_stats = self.time_tracker.get_today_stats()
-        self.create_ultra_modern_card(
-            stats_frame,
-            self.lang.get("dashboard.today_time", "Today's Time"),
-            f"{int(today_stats['total_time_minutes'])} {self.lang.get('dashboard.minutes', 'min')}",
-            "⏱️",
-            row=0,
-            col=0,
-            gradient_colors=(COLORS["GRADIENT_3_START"], COLORS["GRADIENT_3_END"]),
-            accent_color=COLORS["INFO"]
-        )
-        
-        self.create_ultra_modern_card(
-            stats_frame,
-            self.lang.get("dashboard.today_questions", "Today's Questions"),
-            f"{today_stats['total_questions']}",
-            "📚",
-            row=0,
-            col=1,
-            gradient_colors=(COLORS["GRADIENT_2_START"], COLORS["GRADIENT_2_END"]),
-            accent_color=COLORS["ERROR"]
-        )
-        
-        # Productivity score
-        productivity = self.analytics.get_productivity_score()
-        self.create_ultra_modern_card(
-            stats_frame,
-            self.lang.get("dashboard.productivity", "Productivity"),
-            f"{productivity}%",
-            "📈",
-            row=0,
-            col=2,
-            gradient_colors=(COLORS["GRADIENT_1_START"], COLORS["GRADIENT_1_END"]),
-            accent_color=COLORS["HOVER_COLOR"]
-        )
-        
-        # Study streak
-        streak = self.analytics.get_study_streak()
-        streak_text = f"{streak} {self.lang.get('dashboard.days', 'days')}"
-        self.create_ultra_modern_card(
-            stats_frame,
-            self.lang.get("dashboard.streak", "Study Streak"),
-            streak_text,
-            "🔥",
-            row=1,
-            col=0,
-            gradient_colors=("#ff6b6b", "#ee5a6f"),
-            accent_color=COLORS["WARNING"]
-        )
-        
-        # Overall progress
-        stats = self.data_manager.get_statistics()
-        progress_text = f"{stats['progress']:.1f}%"
-        self.create_ultra_modern_card(
-            stats_frame,
-            self.lang.get("dashboard.overall_progress", "Overall Progress"),
-            progress_text,
-            "🎯",
-            row=1,
-            col=1,
-            gradient_colors=("#51cf66", "#40c057"),
-            accent_color=COLORS["SUCCESS"]
-        )
-        
-        # Completed topics
-        topics_text = f"{stats['completed_topics']}/{stats['total_topics']}"
-        self.create_ultra_modern_card(
-            stats_frame,
-            self.lang.get("dashboard.completed_topics", "Completed Topics"),
-            topics_text,
-            "✅",
-            row=1,
-            col=2,
-            gradient_colors=(COLORS["SECONDARY"], "#9b59b6"),
-            accent_color="#9b59b6"
-        )
+        # Cards are built once; bind_snapshot() later only pushes changed values
+        self.cards = {}
+        self.card_titles = {}
+        self._values = {}
+        for key, title_key, title_default, emoji, row, col, gradient_colors, accent_color in self.CARDS:
+            self.cards[key], self.card_titles[key] = self.create_ultra_modern_card(
+                stats_frame,
+                self.lang.get(title_key, title_default),
+                "",
+                emoji,
+                row=row,
+                col=col,
+                gradient_colors=gradient_colors,
+                accent_color=accent_color
+            )
+        self.bind_snapshot(snapshot)
+    
+    def card_values(self, snapshot):
+        """Format a snapshot into the text of each card"""
+        stats = snapshot.statistics
+        return {
+            "today_time": f"{int(snapshot.today_time_minutes)} {self.lang.get('dashboard.minutes', 'min')}",
+            "today_questions": f"{snapshot.today_questions}",
+            "productivity": f"{snapshot.productivity}%",
+            "streak": f"{snapshot.streak} {self.lang.get('dashboard.days', 'days')}",
+            "progress": f"{stats['progress']:.1f}%",
+            "topics": f"{stats['completed_topics']}/{stats['total_topics']}"
+        }
+    
+    def bind_snapshot(self, snapshot):
+        """Show a snapshot, configuring only the value labels whose text changed"""
+        self.snapshot = snapshot
+        for key, value in self.card_values(snapshot).items():
+            if self._values.get(key) != value:
+                self.cards[key].configure(text=value)
+                self._values[key] = value
     
     def create_ultra_modern_card(self, parent, title, value, emoji, row, col, gradient_colors, accent_color):
         """Create ultra modern statistics card with enhanced visuals and shadows"""
@@ -169,7 +148,7 @@ class DashboardWidget(ctk.CTkFrame):
         emoji_label = ctk.CTkLabel(
             emoji_container,
             text=emoji,
-            font=ctk.CTkFont(size=40)
+            font=get_font(size=40)
         )
         emoji_label.place(relx=0.5, rely=0.5, anchor="center")
         
@@ -179,7 +158,7 @@ class DashboardWidget(ctk.CTkFrame):
         value_label = ctk.CTkLabel(
             value_frame,
             text=value,
-            font=ctk.CTkFont(size=30, weight="bold"),
+            font=get_font(size=30, weight="bold"),
             text_color=accent_color,
             anchor="e"
         )
@@ -201,14 +180,21 @@ class DashboardWidget(ctk.CTkFrame):
         title_label = ctk.CTkLabel(
             inner_frame,
             text=title,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(size=14, weight="bold"),
             text_color=(COLORS.get("TEXT_SECONDARY", "#94a3b8"), "#cbd5e1"),
             anchor="w"
         )
         title_label.pack(fill="x")
+        return value_label, title_label
     
-    def refresh(self):
-        """Refresh dashboard data"""
-        for widget in self.winfo_children():
-            widget.destroy()
-        self.create_widgets()
+    def relabel(self):
+        """Re-translate the titles and value units in place after a language change"""
+        self.title_label.configure(text=self.lang.get("dashboard.title", "Dashboard"))
+        for key, title_key, title_default, *_ in self.CARDS:
+            self.card_titles[key].configure(text=self.lang.get(title_key, title_default))
+        if self.snapshot is not None:
+            self.bind_snapshot(self.snapshot)
+    
+    def refresh(self, snapshot=None):
+        """Refresh dashboard data in place"""
+        self.bind_snapshot(snapshot or self.analytics.dashboard_snapshot())
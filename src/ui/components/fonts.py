@@ -0,0 +1,45 @@
+"""
+Font Registry Component
+Shared CTkFont instances for the whole UI
+"""
+
+import customtkinter as ctk
+
+class FontRegistry:
+    """Hands out one shared CTkFont per (size, weight, slant).
+    
+    Every CTkFont is a Tk named font, so creating one per label made the font
+    table grow with every re-render. Widgets only read their font (and scale it
+    themselves), so a single instance can back any number of them - but a shared
+    font must never be configure()d. clear() forgets the instances after a theme
+    or scaling change: new widgets get fonts built from the current theme, and
+    the old ones are freed once the last widget using them is destroyed.
+    """
+    
+    def __init__(self):
+        self._fonts = {}  # (size, weight, slant) -> CTkFont
+    
+    def get(self, size=None, weight=None, slant="roman"):
+        """Get the shared font for a size/weight/slant, creating it on first use"""
+        key = (size, weight, slant)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = ctk.CTkFont(size=size, weight=weight, slant=slant)
+        return font
+    
+    def clear(self):
+        """Drop all shared fonts so they are recreated on next use"""
+        self._fonts.clear()
+    
+    def __len__(self):
+        return len(self._fonts)
+
+_registry = FontRegistry()
+
+def get_font(size=None, weight=None, slant="roman"):
+    """Get a shared font from the UI-wide registry"""
+    return _registry.get(size, weight, slant)
+
+def clear_fonts():
+    """Release the UI-wide shared fonts (theme or scaling changed)"""
+    _registry.clear()
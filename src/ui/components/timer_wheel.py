@@ -0,0 +1,90 @@
+"""
+Timer Wheel Component
+One after() loop for every timed job in the UI
+"""
+
+import math
+import time
+
+class TimerWheel:
+    """Runs timed UI jobs from a single Tk after() loop.
+    
+    The loop wakes up on whole wall-clock seconds. Per-second jobs run on every
+    tick; one-shot jobs are hashed into one slot per second of a fixed-size wheel,
+    so a tick only looks at the slots of the seconds that have passed.
+    """
+    
+    def __init__(self, widget, size=60):
+        self.widget = widget
+        self.size = size
+        self._slots = [{} for _ in range(size)]  # slot -> {name: (due second, callback)}
+        self._slot_of = {}  # one-shot job name -> slot
+        self._every = {}  # per-second job name -> callback
+        self._job = None
+        self._last_second = None
+    
+    def every_second(self, name, callback):
+        """Run a callback on every tick until cancelled"""
+        self._every[name] = callback
+        self._ensure_running()
+    
+    def call_at(self, name, deadline, callback):
+        """Run a callback once, on the first tick at or after a time.time() deadline"""
+        self.cancel(name)
+        # Past deadlines go in the next second's slot so the next tick still sees them
+        second = max(int(math.ceil(deadline)), int(time.time()) + 1)
+        slot = second % self.size
+        self._slots[slot][name] = (second, callback)
+        self._slot_of[name] = slot
+        self._ensure_running()
+    
+    def cancel(self, name):
+        """Remove a job of either kind"""
+        self._every.pop(name, None)
+        slot = self._slot_of.pop(name, None)
+        if slot is not None:
+            self._slots[slot].pop(name, None)
+    
+    def stop(self):
+        """Stop the loop; registered jobs stay and run once it is restarted"""
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+    
+    def _ensure_running(self):
+        if self._job is None:
+            if self._last_second is None:
+                self._last_second = int(time.time())
+            self._schedule()
+    
+    def _schedule(self):
+        delay = 1000 - int((time.time() % 1) * 1000)
+        self._job = self.widget.after(max(delay, 1), self._tick)
+    
+    def _tick(self):
+        self._job = None
+        now = int(time.time() + 0.001)  # after() may fire a hair early
+        
+        # Visit the slots of every second since the last tick (all of them after a long stall)
+        passed = now - self._last_second
+        slots = range(self.size) if passed >= self.size else (
+            second % self.size for second in range(self._last_second + 1, now + 1)
+        )
+        due = []
+        for slot in slots:
+            jobs = self._slots[slot]
+            for name, (second, callback) in list(jobs.items()):
+                if second <= now:
+                    del jobs[name]
+                    self._slot_of.pop(name, None)
+                    due.append(callback)
+        self._last_second = now
+        
+        for callback in list(self._every.values()) + due:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Timer job error: {e}")
+        
+        if self._every or self._slot_of:
+            self._schedule()
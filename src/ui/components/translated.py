@@ -0,0 +1,59 @@
+"""
+Translated Text Component
+Widget texts bound to translation keys
+"""
+
+class TextBindings:
+    """Keeps widget texts bound to their translation keys.
+    
+    bind() sets a widget option from a translation key and remembers how, so
+    after LanguageManager.set_language() a single refresh() re-applies every
+    live binding instead of the widgets being destroyed and rebuilt. Bindings of
+    destroyed widgets are dropped as they are found.
+    """
+    
+    def __init__(self, lang_manager):
+        self.lang = lang_manager
+        self._bindings = []  # (widget, apply function)
+        self._prune_at = 256  # Binding count at which dead bindings are swept
+    
+    def bind(self, widget, key, default=None, option="text", prefix="", suffix=""):
+        """Set a widget option to a translation and keep it translated; returns the widget"""
+        def apply():
+            widget.configure(**{option: f"{prefix}{self.lang.get(key, default)}{suffix}"})
+        apply()
+        self._add(widget, apply)
+        return widget
+    
+    def bind_callback(self, widget, callback):
+        """Call `callback()` on every language change for as long as the widget lives"""
+        self._add(widget, callback)
+    
+    def _add(self, widget, apply):
+        self._bindings.append((widget, apply))
+        if len(self._bindings) >= self._prune_at:
+            self._bindings = [binding for binding in self._bindings if self._alive(binding[0])]
+            self._prune_at = max(len(self._bindings) * 2, 256)
+    
+    @staticmethod
+    def _alive(widget):
+        try:
+            return bool(widget.winfo_exists())
+        except:
+            return False
+    
+    def refresh(self):
+        """Re-apply every binding in the current language"""
+        alive = []
+        for widget, apply in self._bindings:
+            if not self._alive(widget):
+                continue
+            try:
+                apply()
+            except Exception as e:
+                print(f"Translation binding error: {e}")
+            alive.append((widget, apply))
+        self._bindings = alive
+    
+    def __len__(self):
+        return len(self._bindings)
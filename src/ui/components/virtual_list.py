@@ -0,0 +1,167 @@
+"""
+Virtual List Component
+Scrollable list that only creates widgets for the visible rows
+"""
+
+import math
+import sys
+import customtkinter as ctk
+from ...config.constants import COLORS
+from .fonts import get_font
+
+class VirtualList(ctk.CTkFrame):
+    """Fixed-height-row list backed by a small pool of recycled row widgets.
+    
+    Only enough rows to fill the viewport are ever created (`create_row(parent)`).
+    Scrolling and set_items() re-bind pool rows to other items through
+    `bind_row(row, item, index)` instead of creating or destroying widgets, so the
+    cost stays the same whether the list has ten items or ten thousand.
+    
+    Mouse-wheel events reach every list through one shared bind_all() handler per
+    Tk interpreter, which scrolls the live list whose viewport contains the widget
+    under the event; destroy() takes a list out of that registry.
+    """
+    
+    _by_viewport = {}  # viewport path -> live VirtualList
+    _wheel_bound = set()  # ids of the Tk interpreters the shared handler is bound in
+    
+    def __init__(self, master, row_height, create_row, bind_row, empty_text="", **kwargs):
+        kwargs.setdefault("fg_color", "transparent")
+        super().__init__(master, **kwargs)
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.items = []
+        self._offset = 0  # scroll position in (unscaled) pixels
+        self._pool = []
+        self._bound = []  # item index each pool row shows, None when hidden
+        self._placed = []  # y each pool row is placed at, None when hidden
+        
+        self.grid_propagate(False)  # Size comes from the constructor/configure(), not from the rows
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent", corner_radius=0)
+        self.viewport.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.empty_label = ctk.CTkLabel(self.viewport, text=empty_text, font=get_font(size=12),
+                                        text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0"))
+        
+        self.viewport.bind("<Configure>", lambda e: self._layout())
+        VirtualList._by_viewport[str(self.viewport)] = self
+        if id(self.tk) not in VirtualList._wheel_bound:
+            VirtualList._wheel_bound.add(id(self.tk))
+            if "linux" in sys.platform:
+                self.bind_all("<Button-4>", VirtualList._dispatch_mousewheel, add=True)
+                self.bind_all("<Button-5>", VirtualList._dispatch_mousewheel, add=True)
+            else:
+                self.bind_all("<MouseWheel>", VirtualList._dispatch_mousewheel, add=True)
+    
+    def destroy(self):
+        """Stop routing mouse-wheel events to this list, then destroy it"""
+        VirtualList._by_viewport.pop(str(self.viewport), None)
+        super().destroy()
+    
+    def set_items(self, items):
+        """Show a new item list, keeping the scroll position where possible"""
+        self.items = list(items)
+        self._bound = [None] * len(self._pool)  # Force every visible row to re-bind
+        self._layout()
+    
+    def refresh(self):
+        """Re-bind the visible rows, e.g. after the data behind the items changed"""
+        self._bound = [None] * len(self._pool)
+        self._layout()
+    
+    def refresh_item(self, item):
+        """Re-bind only the visible row showing an item; returns False if it isn't visible"""
+        for slot, index in enumerate(self._bound):
+            if index is not None and self.items[index] == item:
+                self.bind_row(self._pool[slot], item, index)
+                return True
+        return False
+    
+    def scroll_to(self, index):
+        """Scroll just far enough to make an item visible"""
+        top = index * self.row_height
+        height = self._viewport_height()
+        if top < self._offset:
+            self._offset = top
+        elif top + self.row_height > self._offset + height:
+            self._offset = top + self.row_height - height
+        self._layout()
+    
+    def _viewport_height(self):
+        """Viewport height in unscaled pixels, the unit row_height and place() use"""
+        return self.viewport.winfo_height() / self._get_widget_scaling()
+    
+    def _max_offset(self):
+        return max(len(self.items) * self.row_height - self._viewport_height(), 0)
+    
+    def _layout(self):
+        """Place pool rows for the current scroll position, growing the pool if needed"""
+        height = self._viewport_height()
+        self._offset = min(max(self._offset, 0), self._max_offset())
+        
+        if not self.items:
+            self.empty_label.place(relx=0.5, y=20, anchor="n")
+        else:
+            self.empty_label.place_forget()
+        
+        needed = min(math.ceil(height / self.row_height) + 1, len(self.items))
+        while len(self._pool) < needed:
+            self._pool.append(self.create_row(self.viewport))
+            self._bound.append(None)
+            self._placed.append(None)
+        
+        first = int(self._offset // self.row_height)
+        shift = self._offset - first * self.row_height
+        for slot, row in enumerate(self._pool):
+            index = first + slot
+            if slot >= needed or index >= len(self.items):
+                if self._placed[slot] is not None:
+                    row.place_forget()
+                    self._placed[slot] = None
+                self._bound[slot] = None
+                continue
+            if self._bound[slot] != index:
+                self.bind_row(row, self.items[index], index)
+                self._bound[slot] = index
+            y = slot * self.row_height - shift
+            if self._placed[slot] != y:
+                row.place(x=0, y=y, relwidth=1)
+                self._placed[slot] = y
+        
+        total = len(self.items) * self.row_height
+        if total <= height or not total:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self._offset / total, (self._offset + height) / total)
+    
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self._offset = float(value) * len(self.items) * self.row_height
+        elif action == "scroll":
+            step = self._viewport_height() if unit == "pages" else self.row_height
+            self._offset += int(value) * step
+        self._layout()
+    
+    @classmethod
+    def _dispatch_mousewheel(cls, event):
+        """Scroll the innermost list whose viewport is, or is an ancestor of, the event widget"""
+        # Walk up whole path components, so ".!ctkframe" never matches ".!ctkframe2"
+        path = str(event.widget)
+        while path:
+            virtual_list = cls._by_viewport.get(path)
+            if virtual_list is not None:
+                virtual_list._on_mousewheel(event)
+                return
+            path = path.rpartition(".")[0]
+    
+    def _on_mousewheel(self, event):
+        if getattr(event, "num", None) in (4, 5):
+            direction = -1 if event.num == 4 else 1
+        else:
+            direction = -1 if event.delta > 0 else 1
+        self._offset += direction * self.row_height
+        self._layout()
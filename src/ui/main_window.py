@@ -8,13 +8,23 @@ from tkinter import filedialog
 from functools import partial
 import os
 import datetime
+import math
+import queue
+import threading
+from collections import OrderedDict
 from PIL import Image, ImageTk
 
-from ..config.constants import COLORS, UI_SETTINGS, APP_INFO, ICON_FILE, PERFORMANCE_SETTINGS
+from ..config.constants import COLORS, THEME_COLORS, UI_SETTINGS, APP_INFO, ICON_FILE, PERFORMANCE_SETTINGS
 from ..config.settings import AppSettings
 from ..utils.data_manager import DataManager
 from ..utils.language import LanguageManager
 from ..graphics.chart_manager import ChartManager
+from ..utils.recommendations import RecommendationEngine
+from ..utils.pomodoro import PomodoroScheduler
+from .components.timer_wheel import TimerWheel
+from .components.virtual_list import VirtualList
+from .components.fonts import get_font, clear_fonts
+from .components.translated import TextBindings
 
 class MainWindow(ctk.CTk):
     """Main application window"""
@@ -33,26 +43,43 @@ class MainWindow(ctk.CTk):
         self.export_manager = export_manager
         self.quote_manager = quote_manager
         self.chart_manager = ChartManager(lang_manager)
+        self.texts = TextBindings(lang_manager)  # Widget texts re-translated on language change
         
         # UI State
         self.selected_subject = None
-        self.subject_buttons = {}
-        self.subjects_scroll = None  # Will be created in _create_sidebar
+        self.subjects_scroll = None  # VirtualList, created in _create_sidebar
         self.progress_bar = None
         self.target_input = None
-        self.topic_list_frame = None
         self.current_view = "dashboard"  # dashboard, subject, statistics, analytics
         self.active_session_id = None
+        self.timer_wheel = TimerWheel(self)  # Drives the session timer and Pomodoro phases
+        self._last_checkpoint_minute = 0
+        
+        # Pomodoro mode; a run saved before a restart is picked up again here
+        self.pomodoro = PomodoroScheduler(self.time_tracker, self.settings.get("pomodoro"))
+        if self.pomodoro.is_active():
+            self.active_session_id = self.pomodoro.session_id
         
         # Performance optimizations
-        self._dashboard_widget = None  # Cache dashboard widget
-        self._last_stats_hash = None  # Track stats changes
+        self._dashboard_widget = None  # Cached DashboardWidget, refreshed in place
+        self._dashboard_view = None  # Container of the cached dashboard, hidden while other views show
+        self._dashboard_sections = []  # [container, builder, version key, last key] per section
+        self._subject_views = OrderedDict()  # subject -> built view, least recently shown first
+        self._subject_render_job = None  # after() id of the next deferred subject section
+        self._last_stats_hash = None  # Hash of the header stats last shown, to skip unchanged updates
+        self._header_stat_cards = []  # (card, value label, caption label) per header stat
         self._update_pending = False  # Prevent multiple simultaneous updates
         
         # Setup window
         self._setup_window()
         self._create_ui()
         
+        # Data changes reach the UI as change events, batched once per idle cycle
+        buses = {id(source.events): source.events for source in (data_manager, time_tracker, notes_manager, goal_tracker)}
+        for bus in buses.values():
+            bus.scheduler = self.after_idle
+            bus.subscribe(self._on_data_changed)
+        
         # Apply theme
         theme = self.settings.get_theme()
         ctk.set_appearance_mode(theme)
@@ -76,107 +103,112 @@ class MainWindow(ctk.CTk):
         # Set window to accept keyboard input
         self.configure(takefocus=True)
         
+        # A normal close ends the running session; crash recovery is only for crashes
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         # Show dashboard by default
         self._show_dashboard()
+        
+        if self.active_session_id:
+            self._start_session_timer()
+            self._schedule_pomodoro()
+        
+        # Tell the user about sessions closed after a crash
+        if self.time_tracker.recovered_sessions:
+            self.after(500, lambda: messagebox.showinfo(
+                self.lang.get("time.tracking", "Time Tracking"),
+                self.lang.translate("messages.sessions_recovered", count=len(self.time_tracker.recovered_sessions))
+            ))
     
     def _update_subject_buttons(self):
-        """Update subject buttons in sidebar with filtering and performance optimization"""
+        """Re-filter the sidebar subject list; visible rows are re-bound, not rebuilt"""
         if self.subjects_scroll is None:
             return  # Sidebar not created yet
         
-        if self._update_pending:
-            return  # Skip if update is already pending
-        
-        self._update_pending = True
+        # Apply filters
+        all_subjects = list(self.data_manager.data.keys())
+        filtered_subjects = self._apply_filters(all_subjects) if hasattr(self, 'current_filter') else all_subjects
         
-        # Clear existing buttons (optimized)
-        widgets_to_destroy = list(self.subjects_scroll.winfo_children())
-        for widget in widgets_to_destroy:
-            widget.destroy()
-        self.subject_buttons.clear()
+        self.subjects_scroll.set_items(filtered_subjects)
         
-        # Get all subjects (with performance limit)
-        all_subjects = list(self.data_manager.data.keys())
-        max_display = PERFORMANCE_SETTINGS.get("max_subjects_display", 50)
-        if len(all_subjects) > max_display:
-            all_subjects = all_subjects[:max_display]
+        # Views of deleted or renamed subjects can never be shown again
+        for subject_name in list(self._subject_views):
+            if subject_name not in self.data_manager.data:
+                self._drop_subject_view(subject_name)
+    
+    def _create_subject_row(self, parent):
+        """Create one recyclable sidebar row (subject button and menu button)"""
+        row = ctk.CTkFrame(parent, fg_color="transparent", height=52)
+        row.grid_columnconfigure(0, weight=1)
+        row.subject_name = None
+        row.state = {}  # Last values pushed to the widgets, so re-binding only reconfigures changes
+        
+        # Modern subject button with priority indicator
+        row.button = ctk.CTkButton(
+            row,
+            text="",
+            height=50,
+            corner_radius=12,
+            fg_color=(COLORS.get("CARD_LIGHT", "#f8f9fa"), COLORS.get("CARD_DARK", "#2d2d2d")),
+            hover_color=(COLORS["PRIMARY"], COLORS["PRIMARY_DARK"]),
+            border_width=2,
+            command=lambda: self._select_subject(row.subject_name),
+            anchor="w",
+            font=get_font(size=14, weight="bold"),
+            text_color=("gray20", "gray90")
+        )
+        row.button.grid(row=0, column=0, sticky="ew", padx=(5, 8))
         
-        # Apply filters
-        filtered_subjects = self._apply_filters(all_subjects) if hasattr(self, 'current_filter') else all_subjects
+        # Modern menu button
+        ctk.CTkButton(
+            row,
+            text="⋮",
+            width=38,
+            height=52,
+            fg_color=COLORS["SECONDARY"],
+            hover_color="#7c3aed",
+            command=lambda: self._show_subject_menu(row.subject_name),
+            font=get_font(size=18, weight="bold"),
+            corner_radius=12
+        ).grid(row=0, column=1, padx=(0, 5))
+        return row
+    
+    def _bind_subject_row(self, row, subject_name, index):
+        """Show a subject in a recycled sidebar row"""
+        subject_data = self.data_manager.data.get(subject_name, {})
         
-        if not filtered_subjects:
-            no_subjects_label = ctk.CTkLabel(
-                self.subjects_scroll,
-                text=self.lang.get("subject.select", "Select a subject/project"),
-                font=ctk.CTkFont(size=12),
-                text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
-            )
-            no_subjects_label.grid(row=0, column=0, padx=10, pady=20)
-            return
+        # Priority indicator color
+        priority_colors = {
+            "high": COLORS["ERROR"],
+            "medium": COLORS["WARNING"],
+            "low": COLORS["SUCCESS"]
+        }
+        priority_color = priority_colors.get(subject_data.get('priority', 'medium'), COLORS["INFO"])
+        
+        # Status indicator
+        status_indicators = {
+            "active": "●",
+            "completed": "✓",
+            "on_hold": "⏸",
+            "archived": "📦"
+        }
+        status_indicator = status_indicators.get(subject_data.get('status', 'active'), "●")
         
-        # Create subject buttons
-        for i, subject_name in enumerate(filtered_subjects):
-            subject_data = self.data_manager.data.get(subject_name, {})
-            priority = subject_data.get('priority', 'medium')
-            status = subject_data.get('status', 'active')
-            
-            # Subject button frame
-            subject_frame = ctk.CTkFrame(self.subjects_scroll, fg_color="transparent")
-            subject_frame.grid(row=i, column=0, padx=5, pady=5, sticky="ew")
-            subject_frame.grid_columnconfigure(0, weight=1)
-            
-            # Priority indicator color
-            priority_colors = {
-                "high": COLORS["ERROR"],
-                "medium": COLORS["WARNING"],
-                "low": COLORS["SUCCESS"]
-            }
-            priority_color = priority_colors.get(priority, COLORS["INFO"])
-            
-            # Status indicator
-            status_indicators = {
-                "active": "●",
-                "completed": "✓",
-                "on_hold": "⏸",
-                "archived": "📦"
-            }
-            status_indicator = status_indicators.get(status, "●")
-            
-            # Modern subject button with priority indicator
-            btn_text = f"{status_indicator} {subject_name}"
-            btn = ctk.CTkButton(
-                subject_frame,
-                text=btn_text,
-                height=50,
-                corner_radius=12,
-                fg_color=(COLORS.get("CARD_LIGHT", "#f8f9fa"), COLORS.get("CARD_DARK", "#2d2d2d")),
-                hover_color=(COLORS["PRIMARY"], COLORS["PRIMARY_DARK"]),
-                border_width=2,
-                border_color=(priority_color, priority_color),
-                command=partial(self._select_subject, subject_name),
-                anchor="w",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=("gray20", "gray90")
-            )
-            btn.grid(row=0, column=0, sticky="ew", padx=(0, 8))
-            self.subject_buttons[subject_name] = btn
-            
-            # Modern menu button
-            menu_btn = ctk.CTkButton(
-                subject_frame,
-                text="⋮",
-                width=38,
-                height=52,
-                fg_color=COLORS["SECONDARY"],
-                hover_color="#7c3aed",
-                command=partial(self._show_subject_menu, subject_name),
-                font=ctk.CTkFont(size=18, weight="bold"),
-                corner_radius=12
-            )
-            menu_btn.grid(row=0, column=1)
+        if subject_name == self.selected_subject:
+            fg_color = COLORS["PRIMARY"]
+        else:
+            fg_color = (COLORS.get("CARD_LIGHT", "#f8f9fa"), COLORS.get("CARD_DARK", "#2d2d2d"))
         
-        # Reset update flag immediately after buttons are created
-        self._update_pending = False
+        row.subject_name = subject_name
+        state = {
+            "text": f"{status_indicator} {subject_name}",
+            "border_color": (priority_color, priority_color),
+            "fg_color": fg_color
+        }
+        changed = {key: value for key, value in state.items() if row.state.get(key) != value}
+        if changed:
+            row.button.configure(**changed)
+            row.state.update(changed)
     
     def _show_subject_menu(self, subject_name):
         """Show context menu for subject"""
@@ -232,14 +264,14 @@ class MainWindow(ctk.CTk):
         dialog.grab_set()
         
         ctk.CTkLabel(dialog, text=self.lang.get("subject.subject_name", "Subject Name"), 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=10)
+                    font=get_font(size=14, weight="bold")).pack(pady=10)
         
         name_entry = ctk.CTkEntry(dialog, width=300, placeholder_text=self.lang.get("subject.subject_name", "Subject Name"))
         name_entry.pack(pady=5)
         name_entry.focus()
         
         ctk.CTkLabel(dialog, text=self.lang.get("subject.initial_target", "Initial Target"), 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=10)
+                    font=get_font(size=14, weight="bold")).pack(pady=10)
         
         target_entry = ctk.CTkEntry(dialog, width=300, placeholder_text="500")
         target_entry.insert(0, "500")
@@ -259,7 +291,6 @@ class MainWindow(ctk.CTk):
                         self.lang.get("subject.subject_added", "Subject added successfully!")
                     )
                     dialog.destroy()
-                    self._update_subject_buttons()
                     self._show_dashboard()
                 else:
                     if result == "empty_name":
@@ -297,14 +328,14 @@ class MainWindow(ctk.CTk):
         dialog.grab_set()
         
         ctk.CTkLabel(dialog, text=self.lang.get("subject.subject_name", "Subject Name"), 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=10)
+                    font=get_font(size=14, weight="bold")).pack(pady=10)
         
         name_entry = ctk.CTkEntry(dialog, width=300)
         name_entry.insert(0, subject_name)
         name_entry.pack(pady=5)
         
         ctk.CTkLabel(dialog, text=self.lang.get("subject.target", "Target"), 
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=10)
+                    font=get_font(size=14, weight="bold")).pack(pady=10)
         
         target_entry = ctk.CTkEntry(dialog, width=300)
         target_entry.insert(0, str(current_target))
@@ -331,7 +362,6 @@ class MainWindow(ctk.CTk):
                         self.lang.get("subject.subject_updated", "Subject updated successfully!")
                     )
                     dialog.destroy()
-                    self._update_subject_buttons()
                     if self.selected_subject == subject_name:
                         self._select_subject(new_name)
                     else:
@@ -364,11 +394,16 @@ class MainWindow(ctk.CTk):
                     self.lang.get("messages.success", "Success"),
                     self.lang.get("subject.subject_deleted", "Subject deleted successfully!")
                 )
-                self._update_subject_buttons()
                 if self.selected_subject == subject_name:
                     self.selected_subject = None
                 self._show_dashboard()
         
+    def _set_scaling(self, new_widget_scaling, new_window_scaling):
+        """Called by CustomTkinter when the DPI or widget scaling changes"""
+        super()._set_scaling(new_widget_scaling, new_window_scaling)
+        # Existing widgets rescale their own fonts; widgets created from now on get new ones
+        clear_fonts()
+    
     def _setup_window(self):
         """Setup window properties"""
         title = self.lang.get("app.title", APP_INFO["name"])
@@ -408,42 +443,22 @@ class MainWindow(ctk.CTk):
         self._create_main_content()
     
     def _create_header(self):
-        """Create modern header with enhanced styling - website-like design"""
-        # Get theme mode for dynamic colors (only Dark or Light now)
-        theme_mode = ctk.get_appearance_mode()
-        is_dark = theme_mode == "Dark"
-        
-        # Theme-based colors
-        if is_dark:
-            # Dark mode: Black, Blue, Red, Purple (RGB colors) - NO PINK
-            header_bg = COLORS.get("CARD_DARK", "#000000")  # Pure black
-            button_bg_primary = "#1a1a3e"  # Dark blue-black
-            button_bg_secondary = "#2d1b4e"  # Dark purple-black
-            button_bg_accent = "#3d1a2a"  # Dark red-black
-            button_bg_hover = "#1a2d3e"  # Dark cyan-black
-            text_color = "#ffffff"
-            quote_color = (COLORS.get("PRIMARY", "#6366f1"), COLORS.get("ACCENT_2", "#06b6d4"))  # Blue/Cyan for dark
-        else:
-            # Light mode: Pink, White
-            header_bg = COLORS.get("CARD_LIGHT", "#fef2f2")  # Soft pink-white
-            button_bg_primary = "#ffe4e6"  # Light pink
-            button_bg_secondary = "#fce7f3"  # Rose pink
-            button_bg_accent = "#fbcfe8"  # Hot pink
-            button_bg_hover = "#fdf2f8"  # Soft pink
-            text_color = "#1a1a1a"
-            quote_color = ("#ec4899", "#f43f5e")  # Pink for light
-        
-        # Destroy old header if exists (for theme changes)
+        """Create modern header with enhanced styling - website-like design.
+        
+        Colors come from THEME_COLORS (light, dark) roles, so a theme switch
+        re-colors the header in place instead of rebuilding it.
+        """
+        # Destroy old header if exists (for language changes)
         if hasattr(self, 'header_frame'):
             try:
                 self.header_frame.destroy()
             except:
                 pass
         
-        # Store header frame reference - FORCE correct background color
+        # Store header frame reference - black for dark, pink-white for light
         self.header_frame = ctk.CTkFrame(
             self,
-            fg_color=header_bg,  # Explicitly set - black for dark, pink-white for light
+            fg_color=THEME_COLORS["HEADER_BG"],
             corner_radius=0,
             height=150  # Increased height for quote + stats
         )
@@ -461,22 +476,16 @@ class MainWindow(ctk.CTk):
         quote_frame.grid(row=0, column=0, columnspan=2, pady=(0, 8), sticky="ew")
         quote_frame.grid_columnconfigure(0, weight=1)
         
-        # Quote label at the top - FORCE correct colors for dark mode
+        # Quote label at the top - pink in light mode, cyan in dark mode
         initial_quote = self.quote_manager.get_random_quote()
         max_length = 120
         display_quote = initial_quote if len(initial_quote) <= max_length else initial_quote[:max_length-3] + "..."
         
-        # Force correct colors - dark mode MUST be blue/cyan, NOT pink
-        if is_dark:
-            final_quote_color = (COLORS.get("PRIMARY", "#6366f1"), COLORS.get("ACCENT_2", "#06b6d4"))  # Blue/Cyan
-        else:
-            final_quote_color = ("#ec4899", "#f43f5e")  # Pink
-        
         self.quote_label = ctk.CTkLabel(
             quote_frame,
             text=f'💬 "{display_quote}"',
-            font=ctk.CTkFont(size=13, weight="normal"),
-            text_color=final_quote_color,
+            font=get_font(size=13, weight="normal"),
+            text_color=THEME_COLORS["HEADER_ACCENT_TEXT"],
             anchor="center",
             wraplength=900,
             justify="center"
@@ -484,80 +493,40 @@ class MainWindow(ctk.CTk):
         self.quote_label.grid(row=0, column=0, sticky="ew", padx=10)
         
         # Hint text
-        current_lang = self.settings.get_language()
-        hint_text = "⌨️ Herhangi bir tuşa basarak sözü değiştirin" if current_lang == "tr" else "⌨️ Press any key to change quote"
-        hint_label = ctk.CTkLabel(
+        hint_label = self.texts.bind(ctk.CTkLabel(
             quote_frame,
-            text=hint_text,
-            font=ctk.CTkFont(size=9),
+            font=get_font(size=9),
             text_color=(COLORS.get("TEXT_SECONDARY", "#94a3b8"), COLORS.get("TEXT_SECONDARY", "#64748b")),
             anchor="center"
-        )
+        ), "app.quote_hint", "⌨️ Press any key to change quote")
         hint_label.grid(row=1, column=0, pady=(2, 0))
         self.quote_hint_label = hint_label
         
-        # Statistics row - moved from sidebar
+        # Statistics row - moved from sidebar; cards are built and filled by _update_header_stats
         stats_frame = ctk.CTkFrame(inner_header, fg_color="transparent")
         stats_frame.grid(row=1, column=0, columnspan=2, pady=(0, 8), sticky="ew")
-        
-        # Get statistics
-        stats = self.data_manager.get_statistics()
-        
-        # Create compact stat cards
-        stat_items = [
-            (f"💯 {stats['total_solved']:,}", "Çözülen" if current_lang == "tr" else "Solved"),
-            (f"🎯 {stats['total_target']:,}", "Hedef" if current_lang == "tr" else "Target"),
-            (f"📈 %{stats['progress']:.1f}", "İlerleme" if current_lang == "tr" else "Progress"),
-            (f"✅ {stats['completed_topics']}/{stats['total_topics']}", "Konular" if current_lang == "tr" else "Topics")
-        ]
-        
-        for idx, (value, label) in enumerate(stat_items):
-            # Force correct colors - dark mode NO PINK
-            if is_dark:
-                stat_bg = "#1a1a3e"  # Dark blue-black
-                stat_border = COLORS.get("BORDER_DARK", "#1a1a2e")
-            else:
-                stat_bg = "#ffe4e6"  # Light pink
-                stat_border = COLORS.get("BORDER_LIGHT", "#fce7f3")
-            
-            stat_card = ctk.CTkFrame(
-                stats_frame,
-                fg_color=stat_bg,
-                corner_radius=8,
-                border_width=1,
-                border_color=stat_border
-            )
-            stat_card.grid(row=0, column=idx, padx=4, sticky="ew")
-            stats_frame.grid_columnconfigure(idx, weight=1)
-            
-            value_label = ctk.CTkLabel(
-                stat_card,
-                text=value,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=(text_color, text_color)
-            )
-            value_label.pack(pady=(4, 0))
-            
-            label_label = ctk.CTkLabel(
-                stat_card,
-                text=label,
-                font=ctk.CTkFont(size=9),
-                text_color=(COLORS.get("TEXT_SECONDARY", "#94a3b8"), COLORS.get("TEXT_SECONDARY", "#64748b"))
-            )
-            label_label.pack(pady=(0, 4))
+        self.header_stats_frame = stats_frame
+        self._update_header_stats()
         
         # Title and buttons row
-        title_text = self.lang.get("app.title", APP_INFO["name"])
-        title_label = ctk.CTkLabel(
+        title_label = self.texts.bind(ctk.CTkLabel(
             inner_header,
-            text=title_text,
-            font=ctk.CTkFont(size=28, weight="bold"),
-            text_color=(COLORS["PRIMARY"] if is_dark else "#ec4899", 
-                       COLORS["ACCENT_2"] if is_dark else "#f43f5e"),
+            font=get_font(size=28, weight="bold"),
+            text_color=THEME_COLORS["HEADER_ACCENT_TEXT"],
             anchor="w"
-        )
+        ), "app.title", APP_INFO["name"])
         title_label.grid(row=2, column=0, sticky="w")
         
+        # Live session timer (text filled in by _tick_session_timer)
+        self.session_timer_label = ctk.CTkLabel(
+            inner_header,
+            text="",
+            font=get_font(size=14, weight="bold"),
+            text_color=(COLORS["SUCCESS"], COLORS["SUCCESS"]),
+            anchor="e"
+        )
+        self.session_timer_label.grid(row=2, column=0, sticky="e", padx=(0, 10))
+        
         # Buttons frame with transparent style
         buttons_frame = ctk.CTkFrame(inner_header, fg_color="transparent")
         buttons_frame.grid(row=2, column=1, sticky="e", padx=(20, 0))
@@ -567,113 +536,85 @@ class MainWindow(ctk.CTk):
             "width": 105,
             "height": 32,
             "corner_radius": 8,
-            "font": ctk.CTkFont(size=12, weight="bold"),
+            "font": get_font(size=12, weight="bold"),
             "border_width": 1,
-            "fg_color": button_bg_primary,
-            "hover_color": COLORS["PRIMARY"] if is_dark else "#ec4899",
-            "text_color": (text_color, text_color),
-            "border_color": (COLORS.get("BORDER_DARK", "#1a1a2e") if is_dark else COLORS.get("BORDER_LIGHT", "#fce7f3"))
+            "fg_color": THEME_COLORS["HEADER_BUTTON"],
+            "hover_color": THEME_COLORS["HEADER_HOVER"],
+            "text_color": THEME_COLORS["HEADER_TEXT"],
+            "border_color": THEME_COLORS["HEADER_BORDER"]
         }
         
         # Dashboard button
-        ctk.CTkButton(
+        self.texts.bind(ctk.CTkButton(
             buttons_frame,
-            text=self.lang.get("menu.dashboard", "Dashboard"),
             command=self._show_dashboard,
             **button_style
-        ).grid(row=0, column=0, padx=3)
+        ), "menu.dashboard", "Dashboard").grid(row=0, column=0, padx=3)
         
         # Statistics button
         stats_btn_style = button_style.copy()
-        stats_btn_style["fg_color"] = button_bg_secondary
-        stats_btn_style["hover_color"] = COLORS["SECONDARY"] if is_dark else "#f43f5e"
-        ctk.CTkButton(
+        stats_btn_style["fg_color"] = THEME_COLORS["HEADER_BUTTON_2"]
+        stats_btn_style["hover_color"] = THEME_COLORS["HEADER_HOVER_2"]
+        self.texts.bind(ctk.CTkButton(
             buttons_frame,
-            text=self.lang.get("menu.statistics", "Statistics"),
             command=self._show_advanced_statistics,
             **stats_btn_style
-        ).grid(row=0, column=1, padx=3)
+        ), "menu.statistics", "Statistics").grid(row=0, column=1, padx=3)
         
         # Analytics button
         analytics_btn_style = button_style.copy()
-        analytics_btn_style["fg_color"] = button_bg_accent
-        analytics_btn_style["hover_color"] = COLORS["ACCENT"] if is_dark else "#f43f5e"
-        ctk.CTkButton(
+        analytics_btn_style["fg_color"] = THEME_COLORS["HEADER_BUTTON_3"]
+        analytics_btn_style["hover_color"] = THEME_COLORS["HEADER_HOVER_3"]
+        self.texts.bind(ctk.CTkButton(
             buttons_frame,
-            text=self.lang.get("analytics.title", "Analytics"),
             command=self._show_analytics,
             **analytics_btn_style
-        ).grid(row=0, column=2, padx=3)
+        ), "analytics.title", "Analytics").grid(row=0, column=2, padx=3)
         
         # Export button
         export_btn_style = button_style.copy()
-        export_btn_style["fg_color"] = button_bg_hover
-        export_btn_style["hover_color"] = COLORS["HOVER_COLOR"] if is_dark else "#f43f5e"
-        ctk.CTkButton(
+        export_btn_style["fg_color"] = THEME_COLORS["HEADER_BUTTON_4"]
+        export_btn_style["hover_color"] = THEME_COLORS["HEADER_HOVER_4"]
+        self.texts.bind(ctk.CTkButton(
             buttons_frame,
-            text=self.lang.get("menu.export", "Export"),
             command=self._export_data,
             **export_btn_style
-        ).grid(row=0, column=3, padx=3)
+        ), "menu.export", "Export").grid(row=0, column=3, padx=3)
         
-        # Language selector - FORCE correct colors
-        lang_options_map = {
-            "Türkçe": "tr",
-            "Turkish": "tr",
-            "English": "en",
-            "İngilizce": "en"
-        }
+        # Language selector
         lang_display = ["Türkçe", "English"]
-        if is_dark:
-            lang_fg = button_bg_primary  # "#1a1a3e"
-            lang_btn = COLORS["PRIMARY"]  # "#6366f1"
-            lang_hover = COLORS["PRIMARY_DARK"]  # "#4f46e5"
-        else:
-            lang_fg = button_bg_primary  # "#ffe4e6"
-            lang_btn = "#ec4899"  # pink
-            lang_hover = "#f43f5e"  # rose
-        
         self.language_menu = ctk.CTkOptionMenu(
             buttons_frame,
             values=lang_display,
             width=110,
             height=32,
             corner_radius=8,
-            font=ctk.CTkFont(size=11, weight="bold"),
-            fg_color=lang_fg,
-            button_color=lang_btn,
-            button_hover_color=lang_hover,
-            dropdown_fg_color=(header_bg, header_bg),
-            text_color=(text_color, text_color),
+            font=get_font(size=11, weight="bold"),
+            fg_color=THEME_COLORS["HEADER_BUTTON"],
+            button_color=THEME_COLORS["HEADER_HOVER"],
+            button_hover_color=THEME_COLORS["HEADER_MENU_HOVER"],
+            dropdown_fg_color=THEME_COLORS["HEADER_BG"],
+            text_color=THEME_COLORS["HEADER_TEXT"],
             command=self._change_language
         )
         current_lang = self.settings.get_language()
         self.language_menu.set("Türkçe" if current_lang == "tr" else "English")
         self.language_menu.grid(row=0, column=4, padx=3)
         
-        # Theme selector - only Dark and Light (System removed) - FORCE correct colors
+        # Theme selector - only Dark and Light (System removed)
         theme_options = ["Dark", "Light"]
-        if is_dark:
-            theme_fg = button_bg_secondary  # "#2d1b4e"
-            theme_btn = COLORS["SECONDARY"]  # "#8b5cf6"
-            theme_hover = "#7c3aed"  # darker purple
-        else:
-            theme_fg = button_bg_secondary  # "#fce7f3"
-            theme_btn = "#f43f5e"  # rose
-            theme_hover = "#f43f5e"  # rose
-        
         self.theme_menu = ctk.CTkOptionMenu(
             buttons_frame,
             values=theme_options,
             width=85,
             height=32,
             corner_radius=8,
-            font=ctk.CTkFont(size=11, weight="bold"),
-            fg_color=theme_fg,
-            button_color=theme_btn,
-            button_hover_color=theme_hover,
-            dropdown_fg_color=(header_bg, header_bg),
-            text_color=(text_color, text_color),
+            font=get_font(size=11, weight="bold"),
+            fg_color=THEME_COLORS["HEADER_BUTTON_2"],
+            button_color=THEME_COLORS["HEADER_HOVER_2"],
+            button_hover_color=THEME_COLORS["HEADER_MENU_HOVER_2"],
+            dropdown_fg_color=THEME_COLORS["HEADER_BG"],
+            text_color=THEME_COLORS["HEADER_TEXT"],
             command=self._change_theme
         )
         current_theme = self.settings.get_theme()
@@ -683,9 +624,6 @@ class MainWindow(ctk.CTk):
             self.settings.set_theme("Light")
         self.theme_menu.set(current_theme)
         self.theme_menu.grid(row=0, column=5, padx=3)
-        
-        # Store stats frame reference
-        self.header_stats_frame = stats_frame
     
     def _is_system_dark(self):
         """Check if system is in dark mode"""
@@ -695,64 +633,62 @@ class MainWindow(ctk.CTk):
         except:
             return False
     
-    def _update_header_stats(self):
-        """Update statistics in header"""
-        if not self.header_stats_frame:
-            return
-        
-        # Clear existing stats
-        for widget in self.header_stats_frame.winfo_children():
-            widget.destroy()
-        
-        # Get current stats
-        stats = self.data_manager.get_statistics()
-        current_lang = self.settings.get_language()
-        theme_mode = ctk.get_appearance_mode()
-        is_dark = theme_mode == "Dark"  # Only Dark or Light now
-        text_color = "#ffffff" if is_dark else "#1a1a1a"
-        
-        # Recreate stat cards
-        stat_items = [
-            (f"💯 {stats['total_solved']:,}", "Çözülen" if current_lang == "tr" else "Solved"),
-            (f"🎯 {stats['total_target']:,}", "Hedef" if current_lang == "tr" else "Target"),
-            (f"📈 %{stats['progress']:.1f}", "İlerleme" if current_lang == "tr" else "Progress"),
-            (f"✅ {stats['completed_topics']}/{stats['total_topics']}", "Konular" if current_lang == "tr" else "Topics")
-        ]
-        
-        for idx, (value, label) in enumerate(stat_items):
-            # Force correct colors - dark mode NO PINK
-            if is_dark:
-                stat_bg = "#1a1a3e"  # Dark blue-black
-                stat_border = COLORS.get("BORDER_DARK", "#1a1a2e")
-            else:
-                stat_bg = "#ffe4e6"  # Light pink
-                stat_border = COLORS.get("BORDER_LIGHT", "#fce7f3")
-            
+    def _build_header_stats(self):
+        """Create the four header stat cards once per header; updates only reconfigure them"""
+        self._header_stat_cards = []
+        self._last_stats_hash = None
+        fonts = (get_font(size=12, weight="bold"), get_font(size=9))
+        for idx in range(4):
             stat_card = ctk.CTkFrame(
                 self.header_stats_frame,
-                fg_color=stat_bg,
+                fg_color=THEME_COLORS["HEADER_BUTTON"],
                 corner_radius=8,
                 border_width=1,
-                border_color=stat_border
+                border_color=THEME_COLORS["HEADER_BORDER"]
             )
             stat_card.grid(row=0, column=idx, padx=4, sticky="ew")
             self.header_stats_frame.grid_columnconfigure(idx, weight=1)
             
-            value_label = ctk.CTkLabel(
-                stat_card,
-                text=value,
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=(text_color, text_color)
-            )
+            value_label = ctk.CTkLabel(stat_card, text="", font=fonts[0], text_color=THEME_COLORS["HEADER_TEXT"])
             value_label.pack(pady=(4, 0))
             
             label_label = ctk.CTkLabel(
                 stat_card,
-                text=label,
-                font=ctk.CTkFont(size=9),
+                text="",
+                font=fonts[1],
                 text_color=(COLORS.get("TEXT_SECONDARY", "#94a3b8"), COLORS.get("TEXT_SECONDARY", "#64748b"))
             )
             label_label.pack(pady=(0, 4))
+            self._header_stat_cards.append((stat_card, value_label, label_label))
+    
+    def _update_header_stats(self, snapshot=None):
+        """Update statistics in header, skipping the update when nothing shown has changed"""
+        if not self.header_stats_frame:
+            return
+        
+        # The header is recreated on theme/language changes, and its cards with it
+        if not self._header_stat_cards or self._header_stat_cards[0][0].master is not self.header_stats_frame:
+            self._build_header_stats()
+        
+        # Get current stats
+        stats = (snapshot or self.analytics.dashboard_snapshot()).statistics
+        
+        stat_items = (
+            (f"💯 {stats['total_solved']:,}", self.lang.get("subject.solved", "Solved")),
+            (f"🎯 {stats['total_target']:,}", self.lang.get("subject.target", "Target")),
+            (f"📈 %{stats['progress']:.1f}", self.lang.get("subject.progress", "Progress")),
+            (f"✅ {stats['completed_topics']}/{stats['total_topics']}", self.lang.get("topic.topics", "Topics"))
+        )
+        stats_hash = hash(stat_items)
+        if stats_hash == self._last_stats_hash:
+            return
+        self._last_stats_hash = stats_hash
+        
+        for (stat_card, value_label, label_label), (value, label) in zip(self._header_stat_cards, stat_items):
+            if value_label.cget("text") != value:
+                value_label.configure(text=value)
+            if label_label.cget("text") != label:
+                label_label.configure(text=label)
     
     def _on_focus_in(self, event):
         """Handle focus in event"""
@@ -801,17 +737,8 @@ class MainWindow(ctk.CTk):
                 max_length = 120
                 display_quote = new_quote if len(new_quote) <= max_length else new_quote[:max_length-3] + "..."
                 
-                # Update quote color based on theme - FORCE correct colors
-                theme_mode = ctk.get_appearance_mode()
-                is_dark = theme_mode == "Dark"
-                if is_dark:
-                    # Dark mode: Blue/Cyan - ABSOLUTELY NO PINK
-                    quote_color = (COLORS.get("PRIMARY", "#6366f1"), COLORS.get("ACCENT_2", "#06b6d4"))
-                else:
-                    # Light mode: Pink
-                    quote_color = ("#ec4899", "#f43f5e")
-                
-                self.quote_label.configure(text=f'💬 "{display_quote}"', text_color=quote_color)
+                # The label's (light, dark) color follows the theme by itself
+                self.quote_label.configure(text=f'💬 "{display_quote}"')
         except Exception as e:
             print(f"Error updating quote: {e}")
             import traceback
@@ -835,13 +762,11 @@ class MainWindow(ctk.CTk):
         title_frame.grid(row=0, column=0, padx=15, pady=(20, 10), sticky="ew")
         title_frame.grid_columnconfigure(0, weight=1)
         
-        subjects_label = self.lang.get("subject.subjects", "Subjects/Projects")
-        title_label = ctk.CTkLabel(
+        title_label = self.texts.bind(ctk.CTkLabel(
             title_frame,
-            text=subjects_label,
-            font=ctk.CTkFont(size=22, weight="bold"),
+            font=get_font(size=22, weight="bold"),
             text_color=(COLORS["PRIMARY"], COLORS["ACCENT_2"])
-        )
+        ), "subject.subjects", "Subjects/Projects")
         title_label.grid(row=0, column=0, sticky="w")
         
         # Modern add subject button
@@ -853,7 +778,7 @@ class MainWindow(ctk.CTk):
             fg_color=COLORS["PRIMARY"],
             hover_color=COLORS["PRIMARY_DARK"],
             command=self._show_add_subject_dialog,
-            font=ctk.CTkFont(size=26, weight="bold"),
+            font=get_font(size=26, weight="bold"),
             corner_radius=12
         )
         add_subject_btn.grid(row=0, column=1, padx=(10, 0))
@@ -874,11 +799,12 @@ class MainWindow(ctk.CTk):
             corner_radius=10,
             placeholder_text=self.lang.get("subject.search_placeholder", "Search..."),
             textvariable=self.search_var,
-            font=ctk.CTkFont(size=12),
+            font=get_font(size=12),
             border_width=1,
             border_color=(COLORS.get("BORDER_LIGHT", "#e2e8f0"), COLORS.get("BORDER_DARK", "#334155"))
         )
         search_entry.grid(row=0, column=0, sticky="ew", padx=(0, 5))
+        self.texts.bind(search_entry, "subject.search_placeholder", "Search...", option="placeholder_text")
         
         # Filter button
         filter_btn = ctk.CTkButton(
@@ -889,15 +815,21 @@ class MainWindow(ctk.CTk):
             fg_color=COLORS["SECONDARY"],
             hover_color="#7c3aed",
             command=self._show_filter_dialog,
-            font=ctk.CTkFont(size=16),
+            font=get_font(size=16),
             corner_radius=10
         )
         filter_btn.grid(row=0, column=1)
         
-        # Scrollable frame for subjects (statistics moved to navbar)
-        self.subjects_scroll = ctk.CTkScrollableFrame(self.sidebar, fg_color="transparent")
+        # Virtualized subject list: rows are only created for the visible part and recycled
+        self.subjects_scroll = VirtualList(
+            self.sidebar,
+            row_height=62,
+            create_row=self._create_subject_row,
+            bind_row=self._bind_subject_row,
+            empty_text=self.lang.get("subject.select", "Select a subject/project")
+        )
         self.subjects_scroll.grid(row=2, column=0, padx=10, pady=5, sticky="nsew")
-        self.subjects_scroll.grid_columnconfigure(0, weight=1)
+        self.texts.bind(self.subjects_scroll.empty_label, "subject.select", "Select a subject/project")
         self.sidebar.grid_rowconfigure(2, weight=1)
         
         # Filter state
@@ -910,8 +842,7 @@ class MainWindow(ctk.CTk):
         # Current sidebar tab
         self.current_sidebar_tab = "projects"
         
-        # Initialize subject buttons
-        self.subject_buttons = {}
+        # Initialize subject list
         self._update_subject_buttons()
     
     def _create_main_content(self):
@@ -937,162 +868,397 @@ class MainWindow(ctk.CTk):
         """Show home screen when no subject is selected"""
         self._show_dashboard()
     
-    def _show_dashboard(self):
-        """Show dashboard view with caching"""
-        if self._update_pending:
-            return  # Skip if update is already pending
-        
-        self.current_view = "dashboard"
-        self.selected_subject = None  # Clear selection
-        
-        # Reset button colors
-        for btn in self.subject_buttons.values():
-            btn.configure(fg_color=(COLORS.get("CARD_LIGHT", "#f8f9fa"), COLORS.get("CARD_DARK", "#2d2d2d")))
-        
+    def _clear_main_content(self):
+        """Remove the current view from the main area; cached views are only hidden.
+        
+        Cached views live in plain container frames: a CTkScrollableFrame is gridded
+        through an internal parent frame, so it never shows up among these children.
+        """
+        self._cancel_subject_render()
+        cached = [self._dashboard_view] + [view["frame"] for view in self._subject_views.values()]
         for widget in self.main_content.winfo_children():
-            widget.destroy()
-        
-        # Create scrollable dashboard
-        dashboard_scroll = ctk.CTkScrollableFrame(self.main_content)
-        dashboard_scroll.pack(fill="both", expand=True, padx=10, pady=10)
+            if any(widget is view for view in cached):
+                widget.grid_remove()
+            else:
+                widget.destroy()
+    
+    def _build_dashboard(self, snapshot):
+        """Build the dashboard view once; sections are filled in by _show_dashboard"""
+        # Create scrollable dashboard inside the container that is cached and hidden
+        self._dashboard_view = ctk.CTkFrame(self.main_content, fg_color="transparent", corner_radius=0)
+        self._dashboard_view.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+        dashboard_scroll = ctk.CTkScrollableFrame(self._dashboard_view)
+        dashboard_scroll.pack(fill="both", expand=True)
         
         # Dashboard widget
         from .components.dashboard import DashboardWidget
-        dashboard_widget = DashboardWidget(
+        self._dashboard_widget = DashboardWidget(
             dashboard_scroll,
             self.data_manager,
             self.time_tracker,
             self.analytics,
-            self.lang
+            self.lang,
+            snapshot=snapshot
         )
-        dashboard_widget.pack(fill="x", padx=10, pady=10)
+        self._dashboard_widget.pack(fill="x", padx=10, pady=10)
+        self.texts.bind_callback(self._dashboard_widget, self._dashboard_widget.relabel)
+        
+        # Each section gets its own container and is rebuilt only when the data it shows
+        # (or the language) changed: (builder, version key)
+        sections = [
+            # Quick actions
+            (lambda parent, snapshot: self._create_quick_actions_section(parent),
+             lambda: None),
+            # Subjects quick view
+            (lambda parent, snapshot: self._create_subjects_quick_view(parent),
+             lambda: self.data_manager.version),
+            # Upcoming deadlines section
+            (lambda parent, snapshot: self._create_upcoming_deadlines_section(parent),
+             lambda: (self.data_manager.version, datetime.date.today())),
+            # Time tracking section
+            (self._create_time_tracking_section,
+             lambda: (self.data_manager.version, self.time_tracker.version, datetime.date.today(),
+                      self.active_session_id, self.pomodoro.phase)),
+            # Goals section
+            (lambda parent, snapshot: self._create_goals_section(parent),
+             lambda: self.goal_tracker.version),
+            # Recent activity
+            (lambda parent, snapshot: self._create_recent_activity_section(parent),
+             lambda: self.notes_manager.version),
+            # Weekly summary
+            (self._create_weekly_summary_section,
+             lambda: (self.data_manager.version, self.time_tracker.version, datetime.date.today()))
+        ]
+        self._dashboard_sections = []
+        for builder, version_key in sections:
+            container = ctk.CTkFrame(dashboard_scroll, fg_color="transparent")
+            container.pack(fill="x")
+            self._dashboard_sections.append([container, builder, version_key, object()])
+    
+    def _show_dashboard(self):
+        """Show dashboard view; it is built once, then only its changed parts are refreshed"""
+        if self._update_pending:
+            return  # Skip if update is already pending
         
-        # Quick actions section
-        self._create_quick_actions_section(dashboard_scroll)
+        self.current_view = "dashboard"
+        self.selected_subject = None  # Clear selection
         
-        # Subjects quick view
-        self._create_subjects_quick_view(dashboard_scroll)
+        # Reset button colors
+        if self.subjects_scroll is not None:
+            self.subjects_scroll.refresh()
         
-        # Upcoming deadlines section
-        self._create_upcoming_deadlines_section(dashboard_scroll)
+        self._clear_main_content()
         
-        # Time tracking section
-        self._create_time_tracking_section(dashboard_scroll)
+        # One snapshot shared by the dashboard cards, header and weekly summary
+        snapshot = self.analytics.dashboard_snapshot()
+        self._update_header_stats(snapshot)
         
-        # Goals section
-        self._create_goals_section(dashboard_scroll)
+        if self._dashboard_view is None:
+            self._build_dashboard(snapshot)
+        self._dashboard_view.grid()
+        self._dashboard_widget.refresh(snapshot)
         
-        # Recent activity
-        self._create_recent_activity_section(dashboard_scroll)
+        for section in self._dashboard_sections:
+            container, builder, version_key, last_key = section
+            key = (self.lang.language, version_key())
+            if key == last_key:
+                continue
+            for widget in container.winfo_children():
+                widget.destroy()
+            builder(container, snapshot)
+            section[3] = key
+    
+    def _on_data_changed(self, events):
+        """Refresh only what a batch of change events affects"""
+        types = {event.type for event in events}
+        if types & {"subject_added", "subject_updated", "subject_renamed", "subject_deleted"}:
+            self._update_subject_buttons()
         
-        # Weekly summary
-        self._create_weekly_summary_section(dashboard_scroll)
+        if self.current_view == "dashboard":
+            # Refreshes the header and the dashboard sections whose data changed
+            self._show_dashboard()
+            return
+        self._update_header_stats()
         
+        subject_name = self.selected_subject
+        if self.current_view != "subject" or not subject_name:
+            return
+        if subject_name not in self.data_manager.data:
+            self._show_dashboard()  # The shown subject was deleted
+            return
+        
+        topic_events = [event for event in events if event.type.startswith("topic_")]
+        if len(topic_events) < len(events):
+            # Patches the sections whose version changed
+            self._show_subject_details(subject_name)
+            return
+        
+        # Topic changes patch the topic table in place instead of re-filling it
+        view = self._subject_views.get(subject_name)
+        if view is None:
+            return
+        table = view["topic_table"]
+        shown = [event for event in topic_events if event.subject == subject_name]
+        if shown:
+            if table.status_filter or table.sort_key == "status" or any(event.type != "topic_status_changed" for event in shown):
+                self._update_topic_list(subject_name)
+            else:
+                for event in shown:
+                    table.refresh_item(event.item)
+        topic_section = view["topic_section"]
+        topic_section[3] = topic_section[2]()
+        
+        # Sections derived from the topics (completion rate, forecast) are re-filled
+        # like any other section whose version key changed
+        self._refresh_subject_sections(view)
     
     def _select_subject(self, subject_name):
         """Select a subject and show its details"""
         # Update button colors
-        if self.selected_subject and self.selected_subject in self.subject_buttons:
-            self.subject_buttons[self.selected_subject].configure(
-                fg_color=(COLORS.get("CARD_LIGHT", "#f8f9fa"), COLORS.get("CARD_DARK", "#2d2d2d"))
-            )
-        
         self.selected_subject = subject_name
-        if subject_name in self.subject_buttons:
-            self.subject_buttons[subject_name].configure(fg_color=COLORS["PRIMARY"])
+        if self.subjects_scroll is not None:
+            self.subjects_scroll.refresh()
         
         # Show subject details
         self._show_subject_details(subject_name)
         
     
     def _show_subject_details(self, subject_name):
-        """Show detailed view for a subject/project with enhanced info"""
+        """Show detailed view for a subject/project with enhanced info.
+        
+        Built views are kept in a small LRU cache and only hidden when another view
+        is shown; showing one again re-fills just the sections whose data changed.
+        """
         try:
             # Don't skip if update is pending - just reset it
             if self._update_pending:
                 self._update_pending = False
             
-            # Clear with performance optimization
-            widgets_to_destroy = list(self.main_content.winfo_children())
-            for widget in widgets_to_destroy:
-                widget.destroy()
+            self.current_view = "subject"
             
-            subject_data = self.data_manager.data.get(subject_name, {})
-            solved = subject_data.get('cozulen_soru', 0)
-            target = subject_data.get('hedef_soru', 1)
-            progress = min(solved / target if target > 0 else 0, 1.0)
+            # Clear the previous view (the dashboard and cached subject views are kept hidden)
+            self._clear_main_content()
             
-            # Scrollable frame for details - moved to top (row 0)
-            scroll_frame = ctk.CTkScrollableFrame(
+            view = self._subject_views.get(subject_name)
+            if view is None:
+                view = self._build_subject_view(subject_name)
+                self._subject_views[subject_name] = view
+                cache_size = max(PERFORMANCE_SETTINGS.get("subject_view_cache_size", 5), 1)
+                while len(self._subject_views) > cache_size:
+                    _, evicted = self._subject_views.popitem(last=False)
+                    evicted["frame"].destroy()
+            else:
+                self._subject_views.move_to_end(subject_name)
+            view["frame"].grid()
+            self.main_content.grid_rowconfigure(0, weight=1)
+            self._refresh_subject_sections(view)
+        
+        except Exception as e:
+            # A half-built view must not stay cached
+            self._drop_subject_view(subject_name)
+            # Show error message if something goes wrong
+            error_label = ctk.CTkLabel(
                 self.main_content,
-                label_text=f"{subject_name} - {self.lang.get('subject.progress', 'Details')}",
-                label_font=ctk.CTkFont(size=20, weight="bold")
+                text=f"{self.lang.get('messages.error', 'Error')}: {str(e)}",
+                font=get_font(size=14),
+                text_color=COLORS["ERROR"]
             )
-            scroll_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=5)
-            scroll_frame.grid_columnconfigure(0, weight=1)
-            self.main_content.grid_rowconfigure(0, weight=1)
-            
-            # Forms frame
-            forms_frame = ctk.CTkFrame(scroll_frame)
-            forms_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
-            forms_frame.grid_columnconfigure((0, 1, 2), weight=1)
-            
-            # Create forms
-            self._create_question_form(forms_frame, subject_name, solved)
-            self._create_target_form(forms_frame, subject_name, target, subject_data.get('son_calisma_tarihi', ''))
-            self._create_topic_form(forms_frame, subject_name)
-            
-            # Topic list
-            self.topic_list_frame = ctk.CTkFrame(scroll_frame)
-            self.topic_list_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(10, 5))
-            self.topic_list_frame.grid_columnconfigure(0, weight=1)
-            self._update_topic_list(subject_name)
-            
-            # Notes section for subject
-            notes_frame = ctk.CTkFrame(scroll_frame)
-            notes_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=(5, 10))
-            notes_frame.grid_columnconfigure(0, weight=1)
-            self._create_subject_notes_section(notes_frame, subject_name)
-            
-            # Subject comparison chart
-            chart_frame = ctk.CTkFrame(scroll_frame, height=350)
-            chart_frame.grid(row=3, column=0, sticky="ew", padx=10, pady=(5, 10))
-            theme_mode = ctk.get_appearance_mode()
+            error_label.grid(row=0, column=0, pady=50)
+            import traceback
+            traceback.print_exc()
+    
+    def _build_subject_view(self, subject_name):
+        """Build the frame and section containers of a subject view; sections are filled by _show_subject_details"""
+        # Scrollable frame for details - moved to top (row 0), inside the container
+        # that is cached and hidden
+        view_frame = ctk.CTkFrame(self.main_content, fg_color="transparent", corner_radius=0)
+        view_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=5)
+        scroll_frame = ctk.CTkScrollableFrame(
+            view_frame,
+            label_font=get_font(size=20, weight="bold")
+        )
+        self.texts.bind(scroll_frame, "subject.progress", "Details", option="label_text", prefix=f"{subject_name} - ")
+        scroll_frame.pack(fill="both", expand=True)
+        scroll_frame.grid_columnconfigure(0, weight=1)
+        view = {"frame": view_frame, "sections": [], "topic_table": None}
+        
+        def rebuild(builder):
+            def fill(container):
+                for widget in container.winfo_children():
+                    widget.destroy()
+                builder(container)
+            return fill
+        
+        def build_forms(parent):
+            subject_data = self.data_manager.data.get(subject_name, {})
+            self._create_question_form(parent, subject_name, subject_data.get('cozulen_soru', 0))
+            self._create_target_form(parent, subject_name, subject_data.get('hedef_soru', 1),
+                                     subject_data.get('son_calisma_tarihi', ''))
+            self._create_topic_form(parent, subject_name)
+        
+        def build_chart(parent):
             self.chart_manager.create_subject_comparison_chart(
-                chart_frame,
+                parent,
                 self.data_manager,
                 subject_name,
-                theme_mode
-            )
-            
-            # Performance metrics
-            performance_frame = ctk.CTkFrame(scroll_frame)
-            performance_frame.grid(row=4, column=0, sticky="ew", padx=10, pady=(5, 10))
-            self._create_performance_section(performance_frame, subject_name)
-            
-            # Last Position section (optional bookmark) - moved to bottom, compact design
-            last_position_frame = ctk.CTkFrame(
-                scroll_frame,
-                corner_radius=10,
-                fg_color=(COLORS.get("CARD_LIGHT", "#f8f9fa"), COLORS.get("CARD_DARK", "#2d2d2d")),
-                border_width=1,
-                border_color=(COLORS.get("BORDER_LIGHT", "#e0e0e0"), COLORS.get("BORDER_DARK", "#404040"))
+                ctk.get_appearance_mode()
             )
-            last_position_frame.grid(row=5, column=0, sticky="ew", padx=10, pady=(5, 10))
-            last_position_frame.grid_columnconfigure(0, weight=1)
-            self._create_last_position_section(last_position_frame, subject_name)
         
+        # Forms frame
+        forms_frame = ctk.CTkFrame(scroll_frame)
+        forms_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
+        forms_frame.grid_columnconfigure((0, 1, 2), weight=1)
+        
+        # Topic list; the table is built once and re-sorted in place
+        topic_list_frame = ctk.CTkFrame(scroll_frame)
+        topic_list_frame.grid(row=1, column=0, sticky="ew", padx=10, pady=(10, 5))
+        topic_list_frame.grid_columnconfigure(0, weight=1)
+        view["topic_table"] = self._create_topic_table(topic_list_frame, subject_name)
+        
+        # Notes section for subject
+        notes_frame = ctk.CTkFrame(scroll_frame)
+        notes_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=(5, 10))
+        notes_frame.grid_columnconfigure(0, weight=1)
+        
+        # Subject comparison chart
+        chart_frame = ctk.CTkFrame(scroll_frame, height=350)
+        chart_frame.grid(row=3, column=0, sticky="ew", padx=10, pady=(5, 10))
+        
+        # Performance metrics
+        performance_frame = ctk.CTkFrame(scroll_frame)
+        performance_frame.grid(row=4, column=0, sticky="ew", padx=10, pady=(5, 10))
+        
+        # Completion forecast
+        forecast_frame = ctk.CTkFrame(scroll_frame)
+        forecast_frame.grid(row=5, column=0, sticky="ew", padx=10, pady=(5, 10))
+        
+        # Last Position section (optional bookmark) - moved to bottom, compact design
+        last_position_frame = ctk.CTkFrame(
+            scroll_frame,
+            corner_radius=10,
+            fg_color=(COLORS.get("CARD_LIGHT", "#f8f9fa"), COLORS.get("CARD_DARK", "#2d2d2d")),
+            border_width=1,
+            border_color=(COLORS.get("BORDER_LIGHT", "#e0e0e0"), COLORS.get("BORDER_DARK", "#404040"))
+        )
+        last_position_frame.grid(row=6, column=0, sticky="ew", padx=10, pady=(5, 10))
+        last_position_frame.grid_columnconfigure(0, weight=1)
+        
+        # (container, fill, version key, lazy) per section; a section is re-filled only when
+        # its key changed, and lazy ones are filled after the view is already shown. Sections
+        # rebuilt from scratch carry the language in their key; the topic table's own texts
+        # are bound through self.texts and only re-translated
+        subject_key = lambda: (self.data_manager.get_subject_version(subject_name), self.lang.language)
+        notes_key = lambda: (self.notes_manager.get_subject_version(subject_name), self.lang.language)
+        
+        def forms_key():
+            # Only what the forms show, so topic changes don't wipe half-typed input
+            subject_data = self.data_manager.data.get(subject_name, {})
+            return (subject_data.get('cozulen_soru', 0), subject_data.get('hedef_soru', 1),
+                    subject_data.get('son_calisma_tarihi', ''), self.lang.language)
+        
+        sections = [
+            (forms_frame, rebuild(build_forms), forms_key, False),
+            (topic_list_frame, lambda parent: self._update_topic_list(subject_name),
+             lambda: self.data_manager.get_subject_version(subject_name), False),
+            (notes_frame, rebuild(lambda parent: self._create_subject_notes_section(parent, subject_name)),
+             notes_key, True),
+            # The comparison chart shows every subject and is drawn for the current theme
+            (chart_frame, rebuild(build_chart),
+             lambda: (self.data_manager.version, ctk.get_appearance_mode(), self.lang.language), True),
+            (performance_frame, rebuild(lambda parent: self._create_performance_section(parent, subject_name)),
+             lambda: (subject_key(), self.time_tracker.get_subject_version(subject_name), datetime.date.today()), True),
+            (forecast_frame, rebuild(lambda parent: self._create_forecast_section(parent, subject_name)),
+             lambda: (subject_key(), self.time_tracker.get_subject_version(subject_name), datetime.date.today()), True),
+            (last_position_frame, rebuild(lambda parent: self._create_last_position_section(parent, subject_name)),
+             notes_key, True)
+        ]
+        view["sections"] = [[container, fill, version_key, object(), lazy]
+                            for container, fill, version_key, lazy in sections]
+        view["topic_section"] = view["sections"][1]  # Patched in place by _on_data_changed
+        return view
+    
+    def _refresh_subject_sections(self, view):
+        """Re-fill the sections of a shown subject view whose version key changed.
+        
+        Above-the-fold sections are filled right away; the rest get a placeholder
+        and are filled one per callback so the view shows up immediately.
+        """
+        self._cancel_subject_render()  # Sections it had left are still stale and queued again
+        lazy_load = PERFORMANCE_SETTINGS.get("lazy_load_charts", True)
+        pending = []
+        for section in view["sections"]:
+            container, fill, version_key, last_key, lazy = section
+            if version_key() == last_key:
+                continue
+            if lazy and lazy_load:
+                self._show_section_placeholder(container)
+                pending.append(section)
+            else:
+                self._fill_subject_section(section)
+        if pending:
+            self._subject_render_job = self.after_idle(lambda: self._render_pending_sections(pending))
+    
+    def _fill_subject_section(self, section):
+        """Fill a subject view section and remember the data version it shows"""
+        container, fill, version_key, last_key, lazy = section
+        key = version_key()
+        fill(container)
+        section[3] = key
+    
+    def _show_section_placeholder(self, container):
+        """Replace a section's content with a loading label until it is filled"""
+        for widget in container.winfo_children():
+            widget.destroy()
+        ctk.CTkLabel(
+            container,
+            text=self.lang.get("messages.loading", "Loading..."),
+            font=get_font(size=12),
+            text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
+        ).pack(pady=20)
+    
+    def _render_pending_sections(self, pending):
+        """Fill the next deferred section, then schedule the one after it"""
+        self._subject_render_job = None
+        section = pending.pop(0)
+        try:
+            self._fill_subject_section(section)
         except Exception as e:
-            # Show error message if something goes wrong
-            error_label = ctk.CTkLabel(
-                self.main_content,
+            # Its version key stays stale, so the section is retried the next time the view shows
+            for widget in section[0].winfo_children():
+                widget.destroy()
+            ctk.CTkLabel(
+                section[0],
                 text=f"{self.lang.get('messages.error', 'Error')}: {str(e)}",
-                font=ctk.CTkFont(size=14),
+                font=get_font(size=12),
                 text_color=COLORS["ERROR"]
-            )
-            error_label.pack(pady=50)
+            ).pack(pady=20)
             import traceback
             traceback.print_exc()
+        if pending:
+            self._subject_render_job = self.after(
+                PERFORMANCE_SETTINGS.get("lazy_render_delay_ms", 10),
+                lambda: self._render_pending_sections(pending)
+            )
+    
+    def _cancel_subject_render(self):
+        """Stop filling deferred sections, e.g. because another view is being shown"""
+        if self._subject_render_job is not None:
+            self.after_cancel(self._subject_render_job)
+            self._subject_render_job = None
+    
+    def _drop_subject_view(self, subject_name):
+        """Destroy a cached subject view, if there is one"""
+        view = self._subject_views.pop(subject_name, None)
+        if view is not None:
+            try:
+                view["frame"].destroy()
+            except:
+                pass
+    
+    def _topic_table_for(self, subject_name):
+        """Topic table of a subject's cached view, or None if it isn't built"""
+        view = self._subject_views.get(subject_name)
+        return view["topic_table"] if view else None
     
     def _create_question_form(self, master_frame, subject_name, current_solved):
         """Create question adding form - modern design"""
@@ -1110,7 +1276,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             form_frame, 
             text=label_text, 
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(size=14, weight="bold"),
             text_color=(COLORS["PRIMARY"], COLORS["PRIMARY_LIGHT"])
         ).grid(row=0, column=0, columnspan=2, pady=(12, 8))
         
@@ -1120,7 +1286,7 @@ class MainWindow(ctk.CTk):
             height=36,
             corner_radius=10,
             placeholder_text=self.lang.get("subject.questions", "Questions"),
-            font=ctk.CTkFont(size=13),
+            font=get_font(size=13),
             border_width=1,
             border_color=(COLORS.get("BORDER_LIGHT", "#e2e8f0"), COLORS.get("BORDER_DARK", "#334155"))
         )
@@ -1139,15 +1305,14 @@ class MainWindow(ctk.CTk):
                 target = subject_data.get('hedef_soru', 1)
                 progress = (solved / target * 100) if target > 0 else 0
                 
+                # Cleared first: the form is rebuilt while the dialog is open
+                question_input.delete(0, "end")
                 messagebox.showinfo(
                     self.lang.get("messages.success", "Success"),
                     self.lang.translate("messages.question_added", count=count) + f"\n\n"
                     f"{self.lang.get('subject.solved', 'Solved')}: {solved}/{target}\n"
                     f"{self.lang.get('subject.progress', 'Progress')}: %{progress:.1f}"
                 )
-                
-                question_input.delete(0, "end")
-                self._show_subject_details(subject_name)
             except ValueError:
                 messagebox.showerror(
                     self.lang.get("messages.error", "Error"),
@@ -1166,7 +1331,7 @@ class MainWindow(ctk.CTk):
             fg_color=COLORS["PRIMARY"],
             hover_color=COLORS["PRIMARY_DARK"],
             command=add_questions_and_clear,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(size=13, weight="bold"),
             border_width=0
         ).grid(row=1, column=1, padx=(0, 8), pady=(0, 8))
         
@@ -1174,7 +1339,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             form_frame, 
             text=solved_text, 
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(size=12, weight="bold"),
             text_color=(COLORS.get("TEXT_SECONDARY", "#94a3b8"), "#cbd5e1")
         ).grid(row=2, column=0, columnspan=2, pady=(0, 8))
         form_frame.grid_columnconfigure(0, weight=1)
@@ -1195,7 +1360,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             form_frame, 
             text=label_text, 
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(size=14, weight="bold"),
             text_color=(COLORS["SECONDARY"], COLORS["ACCENT"])
         ).grid(row=0, column=0, columnspan=2, pady=(12, 8))
         
@@ -1205,7 +1370,7 @@ class MainWindow(ctk.CTk):
             height=36,
             corner_radius=10,
             placeholder_text=self.lang.get("subject.target", "Target"),
-            font=ctk.CTkFont(size=13),
+            font=get_font(size=13),
             border_width=1,
             border_color=(COLORS.get("BORDER_LIGHT", "#e2e8f0"), COLORS.get("BORDER_DARK", "#334155"))
         )
@@ -1229,8 +1394,6 @@ class MainWindow(ctk.CTk):
                     self.lang.translate("messages.target_set", target=target) + f"\n\n"
                     f"{self.lang.get('messages.current_progress', 'Current Progress')}: {solved}/{target} (%{progress:.1f})"
                 )
-                
-                self._show_subject_details(subject_name)
             except ValueError:
                 messagebox.showerror(
                     self.lang.get("messages.error", "Error"),
@@ -1249,7 +1412,7 @@ class MainWindow(ctk.CTk):
             fg_color=COLORS["SECONDARY"],
             hover_color="#7c3aed",
             command=set_target_and_update,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(size=13, weight="bold"),
             border_width=0
         ).grid(row=1, column=1, padx=(0, 8), pady=(0, 8))
         
@@ -1261,7 +1424,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             form_frame, 
             text=study_label, 
-            font=ctk.CTkFont(size=12),
+            font=get_font(size=12),
             text_color=(COLORS.get("TEXT_SECONDARY", "#94a3b8"), "#cbd5e1")
         ).grid(row=2, column=0, columnspan=2, pady=(0, 8))
         form_frame.grid_columnconfigure(0, weight=1)
@@ -1282,7 +1445,7 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             form_frame, 
             text=label_text, 
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(size=14, weight="bold"),
             text_color=(COLORS["ACCENT_2"], COLORS["INFO"])
         ).grid(row=0, column=0, columnspan=2, pady=(12, 8))
         
@@ -1291,7 +1454,7 @@ class MainWindow(ctk.CTk):
             height=36,
             corner_radius=10,
             placeholder_text=self.lang.get("topic.name", "Topic Name"),
-            font=ctk.CTkFont(size=13),
+            font=get_font(size=13),
             border_width=1,
             border_color=(COLORS.get("BORDER_LIGHT", "#e2e8f0"), COLORS.get("BORDER_DARK", "#334155"))
         )
@@ -1312,7 +1475,6 @@ class MainWindow(ctk.CTk):
                     self.lang.get("messages.topic_added", "Topic added.")
                 )
                 topic_input.delete(0, "end")
-                self._update_topic_list(subject_name)
             else:
                 messagebox.showerror(
                     self.lang.get("messages.error", "Error"),
@@ -1331,131 +1493,227 @@ class MainWindow(ctk.CTk):
             fg_color=COLORS["ACCENT_2"],
             hover_color="#0891b2",
             command=add_topic_and_clear,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(size=13, weight="bold"),
             border_width=0
         ).grid(row=1, column=1, padx=(0, 8), pady=(0, 8))
         form_frame.grid_columnconfigure(0, weight=1)
     
-    def _update_topic_list(self, subject_name):
-        """Update topic list display"""
-        for widget in self.topic_list_frame.winfo_children():
-            widget.destroy()
-        
-        tracking_text = self.lang.get("topic.tracking", "Topic Tracking")
-        ctk.CTkLabel(
-            self.topic_list_frame, 
-            text=tracking_text, 
-            font=ctk.CTkFont(size=18, weight="bold"),
+    def _topic_status_labels(self):
+        """Map stored topic statuses to their translated labels"""
+        return {
+            "Yapılacak": self.lang.get("topic.todo", "Todo"),
+            "Devam Ediyor": self.lang.get("topic.in_progress", "In Progress"),
+            "Tamamlandı": self.lang.get("topic.completed", "Completed")
+        }
+    
+    def _create_topic_table(self, parent, subject_name):
+        """Create the topic table once per subject view; rows are virtualized and recycled.
+        
+        Sort order, status filter and the topic lookup live on the returned table, so
+        every cached subject view keeps its own. Its texts are bound through self.texts,
+        so a language change re-translates them without touching the rows' state.
+        """
+        self.texts.bind(ctk.CTkLabel(
+            parent, 
+            font=get_font(size=18, weight="bold"),
             text_color=(COLORS["PRIMARY"], COLORS["PRIMARY_LIGHT"])
-        ).grid(row=0, column=0, padx=12, pady=(12, 8), sticky="w", columnspan=5)
+        ), "topic.tracking", "Topic Tracking").grid(row=0, column=0, padx=12, pady=(12, 8), sticky="w")
+        
+        # Sort and status filter only change the row order, never the widgets. Labels are
+        # looked up on use, since the language can change while the table is cached
+        controls = ctk.CTkFrame(parent, fg_color="transparent")
+        controls.grid(row=0, column=1, padx=12, pady=(12, 8), sticky="e")
+        
+        def sort_labels():
+            return {
+                "order": self.lang.get("topic.sort_order", "Order added"),
+                "name": self.lang.get("topic.name", "Topic Name"),
+                "status": self.lang.get("topic.status", "Status")
+            }
         
-        # Headers - modernized
-        headers = [
-            self.lang.get("topic.name", "Topic Name"),
-            self.lang.get("topic.status", "Status"),
-            self.lang.get("topic.start_date", "Start"),
-            self.lang.get("topic.end_date", "End"),
-            self.lang.get("actions.delete", "Delete")
-        ]
-        for col, header in enumerate(headers):
-            ctk.CTkLabel(
-                self.topic_list_frame, 
-                text=header, 
-                font=ctk.CTkFont(size=13, weight="bold"),
-                text_color=(COLORS.get("TEXT_SECONDARY", "#94a3b8"), "#cbd5e1")
-            ).grid(row=1, column=col, padx=8, pady=8)
-        self.topic_list_frame.grid_columnconfigure(0, weight=1)
+        def filter_labels():
+            return {None: self.lang.get("topic.all_statuses", "All statuses"), **self._topic_status_labels()}
         
-        topics = self.data_manager.data.get(subject_name, {}).get('konular', [])
+        def set_sort(label):
+            table.sort_key = next(key for key, value in sort_labels().items() if value == label)
+            self._update_topic_list(subject_name)
         
-        if not topics:
-            no_topics_text = self.lang.get("topic.no_topics", "No topics in this subject.")
-            ctk.CTkLabel(self.topic_list_frame, text=no_topics_text, 
-                        font=ctk.CTkFont(size=14)).grid(row=2, column=0, columnspan=5, padx=10, pady=10)
-            return
+        def set_filter(label):
+            table.status_filter = next(key for key, value in filter_labels().items() if value == label)
+            self._update_topic_list(subject_name)
         
-        status_options = [
-            self.lang.get("topic.todo", "Todo"),
-            self.lang.get("topic.in_progress", "In Progress"),
-            self.lang.get("topic.completed", "Completed")
+        def relabel():
+            # Keeps the chosen sort and filter; visible rows pick up their new status labels
+            sort_menu.configure(values=list(sort_labels().values()))
+            sort_menu.set(sort_labels()[table.sort_key])
+            filter_menu.configure(values=list(filter_labels().values()))
+            filter_menu.set(filter_labels()[table.status_filter])
+            table.refresh()
+        
+        sort_menu = ctk.CTkOptionMenu(controls, values=list(sort_labels().values()), command=set_sort,
+                                      width=130, height=28, font=get_font(size=11))
+        sort_menu.set(sort_labels()["order"])
+        sort_menu.pack(side="left", padx=4)
+        filter_menu = ctk.CTkOptionMenu(controls, values=list(filter_labels().values()), command=set_filter,
+                                        width=130, height=28, font=get_font(size=11))
+        filter_menu.set(filter_labels()[None])
+        filter_menu.pack(side="left", padx=4)
+        
+        # Headers - modernized, with the same column widths as the rows
+        header_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        header_frame.grid(row=1, column=0, columnspan=2, sticky="ew", padx=(0, 16))
+        header_frame.grid_columnconfigure(0, weight=1)
+        headers = [
+            ("topic.name", "Topic Name", 0),
+            ("topic.status", "Status", 120),
+            ("topic.start_date", "Start", 100),
+            ("topic.end_date", "End", 100),
+            ("actions.delete", "Delete", 70)
         ]
-        
-        status_map = {
-            self.lang.get("topic.todo", "Todo"): "Yapılacak",
-            self.lang.get("topic.in_progress", "In Progress"): "Devam Ediyor",
-            self.lang.get("topic.completed", "Completed"): "Tamamlandı"
+        for col, (key, default, width) in enumerate(headers):
+            self.texts.bind(ctk.CTkLabel(
+                header_frame, 
+                width=width,
+                font=get_font(size=13, weight="bold"),
+                text_color=(COLORS.get("TEXT_SECONDARY", "#94a3b8"), "#cbd5e1")
+            ), key, default).grid(row=0, column=col, padx=8, pady=8, sticky="w" if col == 0 else "")
+        
+        # Shared fonts for all rows; completed topics switch to the italic one
+        fonts = {
+            "name": get_font(weight="bold"),
+            "name_done": get_font(slant="italic", weight="bold"),
+            "small": get_font(size=11),
+            "small_bold": get_font(size=11, weight="bold")
         }
+        table = VirtualList(
+            parent,
+            row_height=44,
+            create_row=lambda row_parent: self._create_topic_row(table, row_parent),
+            bind_row=lambda row, topic_name, index: self._bind_topic_row(table, row, topic_name, index),
+            height=44
+        )
+        self.texts.bind(table.empty_label, "topic.no_topics", "No topics in this subject.")
+        self.texts.bind_callback(table, relabel)
+        table.subject_name = subject_name
+        table.fonts = fonts
+        table.sort_key = "order"  # order, name, status
+        table.status_filter = None  # stored status to show, or None for all
+        table.topics_by_name = {}
+        table.grid(row=2, column=0, columnspan=2, sticky="ew", padx=(5, 0), pady=(0, 8))
+        parent.grid_columnconfigure(0, weight=1)
+        return table
+    
+    def _create_topic_row(self, table, parent):
+        """Create one recyclable topic row"""
+        row = ctk.CTkFrame(parent, fg_color="transparent", height=44)
+        row.grid_columnconfigure(0, weight=1)
+        row.topic_name = None
+        row.state = {}
+        
+        row.name_label = ctk.CTkLabel(row, text="", anchor="w", font=table.fonts["name"])
+        row.name_label.grid(row=0, column=0, padx=10, pady=3, sticky="ew")
+        
+        # The menu's values are set by _bind_topic_row in the current language
+        def set_status(label):
+            status_map = {status_label: status for status, status_label in self._topic_status_labels().items()}
+            self._update_topic_status(table.subject_name, row.topic_name, status_map.get(label, "Yapılacak"))
+        
+        row.status_menu = ctk.CTkOptionMenu(
+            row,
+            width=120,
+            height=32,
+            corner_radius=8,
+            font=table.fonts["small"],
+            fg_color=(COLORS.get("CARD_LIGHT", "#f8fafc"), COLORS.get("CARD_DARK", "#1e293b")),
+            command=set_status
+        )
+        row.status_menu.grid(row=0, column=1, padx=8, pady=6)
         
-        reverse_status_map = {v: k for k, v in status_map.items()}
+        date_style = {
+            "width": 100,
+            "font": table.fonts["small"],
+            "text_color": (COLORS.get("TEXT_SECONDARY", "#94a3b8"), "#cbd5e1")
+        }
+        row.start_label = ctk.CTkLabel(row, text="", **date_style)
+        row.start_label.grid(row=0, column=2, padx=8, pady=6)
+        row.end_label = ctk.CTkLabel(row, text="", **date_style)
+        row.end_label.grid(row=0, column=3, padx=8, pady=6)
+        
+        self.texts.bind(ctk.CTkButton(
+            row, 
+            width=70,
+            height=32,
+            corner_radius=8,
+            fg_color=COLORS["ERROR"],
+            hover_color="#dc2626",
+            font=table.fonts["small_bold"],
+            command=lambda: self._delete_topic(table.subject_name, row.topic_name)
+        ), "actions.delete", "Delete").grid(row=0, column=4, padx=8, pady=6)
+        return row
+    
+    def _bind_topic_row(self, table, row, topic_name, index):
+        """Show a topic in a recycled row, reconfiguring only what differs"""
+        topic = table.topics_by_name.get(topic_name, {})
+        status = topic.get('durum', "Yapılacak")
+        color_map = {
+            "Yapılacak": "red",
+            "Devam Ediyor": "orange",
+            "Tamamlandı": "green"
+        }
+        row.topic_name = topic_name
+        status_labels = self._topic_status_labels()
+        
+        values = {
+            "name": topic_name,
+            "done": status == "Tamamlandı",
+            "status": status,
+            "labels": tuple(status_labels.values()),  # Changes with the language
+            "start": topic.get('baslangic_tarihi', '-'),
+            "end": topic.get('bitirme_tarihi', '-')
+        }
+        changed = {key for key, value in values.items() if row.state.get(key) != value}
+        if not changed:
+            return
+        if "name" in changed:
+            row.name_label.configure(text=topic_name)
+        if "done" in changed:
+            row.name_label.configure(font=table.fonts["name_done" if values["done"] else "name"])
+        if "labels" in changed:
+            row.status_menu.configure(values=list(values["labels"]))
+        if changed & {"status", "labels"}:
+            row.status_menu.set(status_labels.get(status, self.lang.get("topic.todo", "Todo")))
+        if "status" in changed:
+            row.status_menu.configure(button_color=color_map.get(status, COLORS["BUTTON_COLOR"]))
+        if "start" in changed:
+            row.start_label.configure(text=values["start"])
+        if "end" in changed:
+            row.end_label.configure(text=values["end"])
+        row.state.update(values)
+    
+    def _update_topic_list(self, subject_name):
+        """Re-sort and re-filter the topic table; visible rows are re-bound, not rebuilt"""
+        table = self._topic_table_for(subject_name)
+        if table is None:
+            return
         
-        for i, topic in enumerate(topics):
-            row_num = i + 2
-            
-            topic_label = ctk.CTkLabel(
-                self.topic_list_frame,
-                text=topic['ad'],
-                anchor="w",
-                font=ctk.CTkFont(weight="bold") if topic['durum'] != "Tamamlandı" else ctk.CTkFont(slant="italic", weight="bold")
-            )
-            topic_label.grid(row=row_num, column=0, padx=10, pady=3, sticky="w")
-            
-            color_map = {
-                "Yapılacak": "red",
-                "Devam Ediyor": "orange",
-                "Tamamlandı": "green"
-            }
-            
-            current_status_display = reverse_status_map.get(topic['durum'], status_options[0])
-            
-            status_menu = ctk.CTkOptionMenu(
-                self.topic_list_frame,
-                values=status_options,
-                width=120,
-                height=32,
-                corner_radius=8,
-                font=ctk.CTkFont(size=11),
-                button_color=color_map.get(topic['durum'], COLORS["BUTTON_COLOR"]),
-                fg_color=(COLORS.get("CARD_LIGHT", "#f8fafc"), COLORS.get("CARD_DARK", "#1e293b")),
-                command=lambda status, sn=subject_name, tn=topic['ad']: self._update_topic_status(sn, tn, status_map.get(status, "Yapılacak"))
-            )
-            status_menu.set(current_status_display)
-            status_menu.grid(row=row_num, column=1, padx=8, pady=6)
-            
-            start_date = topic.get('baslangic_tarihi', '-')
-            end_date = topic.get('bitirme_tarihi', '-')
-            
-            ctk.CTkLabel(
-                self.topic_list_frame, 
-                text=start_date, 
-                width=100,
-                font=ctk.CTkFont(size=11),
-                text_color=(COLORS.get("TEXT_SECONDARY", "#94a3b8"), "#cbd5e1")
-            ).grid(row=row_num, column=2, padx=8, pady=6)
-            ctk.CTkLabel(
-                self.topic_list_frame, 
-                text=end_date, 
-                width=100,
-                font=ctk.CTkFont(size=11),
-                text_color=(COLORS.get("TEXT_SECONDARY", "#94a3b8"), "#cbd5e1")
-            ).grid(row=row_num, column=3, padx=8, pady=6)
-            
-            delete_text = self.lang.get("actions.delete", "Delete")
-            ctk.CTkButton(
-                self.topic_list_frame, 
-                text=delete_text, 
-                width=70,
-                height=32,
-                corner_radius=8,
-                fg_color=COLORS["ERROR"],
-                hover_color="#dc2626",
-                font=ctk.CTkFont(size=11, weight="bold"),
-                command=lambda sn=subject_name, tn=topic['ad']: self._delete_topic(sn, tn)
-            ).grid(row=row_num, column=4, padx=8, pady=6)
+        topics = self.data_manager.data.get(subject_name, {}).get('konular', [])
+        table.topics_by_name = {topic['ad']: topic for topic in topics}
+        
+        if table.status_filter:
+            topics = [topic for topic in topics if topic.get('durum') == table.status_filter]
+        if table.sort_key == "name":
+            topics = sorted(topics, key=lambda topic: topic['ad'].casefold())
+        elif table.sort_key == "status":
+            status_order = {"Devam Ediyor": 0, "Yapılacak": 1, "Tamamlandı": 2}
+            topics = sorted(topics, key=lambda topic: status_order.get(topic.get('durum'), len(status_order)))
+        
+        # Show up to 10 rows and scroll the rest
+        table.configure(height=max(min(len(topics), 10), 1) * table.row_height)
+        table.set_items([topic['ad'] for topic in topics])
     
     def _update_topic_status(self, subject_name, topic_name, status):
-        """Update topic status"""
-        if self.data_manager.update_topic_status(subject_name, topic_name, status):
-            self._update_topic_list(subject_name)
+        """Update topic status; the row is re-bound by _on_data_changed"""
+        self.data_manager.update_topic_status(subject_name, topic_name, status)
     
     def _delete_topic(self, subject_name, topic_name):
         """Delete a topic"""
@@ -1466,7 +1724,6 @@ class MainWindow(ctk.CTk):
                     self.lang.get("messages.success", "Success"),
                     self.lang.get("messages.topic_deleted", "Topic deleted.")
                 )
-                self._update_topic_list(subject_name)
     
     
     def _show_statistics(self):
@@ -1485,7 +1742,7 @@ class MainWindow(ctk.CTk):
         # Title
         title_text = self.lang.get("statistics.general", "General Statistics")
         ctk.CTkLabel(scroll_frame, text=title_text, 
-                    font=ctk.CTkFont(size=24, weight="bold")).pack(pady=(0, 20))
+                    font=get_font(size=24, weight="bold")).pack(pady=(0, 20))
         
         # Statistics cards
         stats_data = [
@@ -1501,16 +1758,17 @@ class MainWindow(ctk.CTk):
             card = ctk.CTkFrame(scroll_frame)
             card.pack(fill="x", pady=5, padx=10)
             ctk.CTkLabel(card, text=f"{emoji} {label}", 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(side="left", padx=15, pady=10)
+                        font=get_font(size=14, weight="bold")).pack(side="left", padx=15, pady=10)
             ctk.CTkLabel(card, text=value, 
-                        font=ctk.CTkFont(size=16, weight="bold"),
+                        font=get_font(size=16, weight="bold"),
                         text_color=COLORS["HOVER_COLOR"]).pack(side="right", padx=15, pady=10)
         
         # Subject-based statistics
         by_subject_text = self.lang.get("statistics.by_subject", "Subject-based Statistics")
         ctk.CTkLabel(scroll_frame, text=f"\n{by_subject_text}", 
-                    font=ctk.CTkFont(size=20, weight="bold")).pack(pady=(20, 10))
+                    font=get_font(size=20, weight="bold")).pack(pady=(20, 10))
         
+        performance = self.analytics.get_all_subject_performance()
         for subject_name in sorted(self.data_manager.data.keys()):
             subject_data = self.data_manager.data[subject_name]
             solved = subject_data.get('cozulen_soru', 0)
@@ -1524,10 +1782,19 @@ class MainWindow(ctk.CTk):
             left_frame = ctk.CTkFrame(subject_card, fg_color="transparent")
             left_frame.pack(side="left", fill="both", expand=True, padx=10, pady=5)
             ctk.CTkLabel(left_frame, text=subject_name, 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(anchor="w")
+                        font=get_font(size=14, weight="bold")).pack(anchor="w")
             questions_text = f"{solved}/{target} {self.lang.get('subject.questions', 'questions')} (%{progress:.1f})"
             ctk.CTkLabel(left_frame, text=questions_text, 
-                        font=ctk.CTkFont(size=12)).pack(anchor="w")
+                        font=get_font(size=12)).pack(anchor="w")
+            subject_performance = performance.get(subject_name)
+            if subject_performance:
+                performance_text = (
+                    f"⏱️ {subject_performance['total_time_hours']} {self.lang.get('analytics.hours', 'hours')} · "
+                    f"⚡ {subject_performance['efficiency']} {self.lang.get('analytics.questions_per_hour', 'q/h')} · "
+                    f"📅 %{subject_performance['consistency_score']}"
+                )
+                ctk.CTkLabel(left_frame, text=performance_text, font=get_font(size=11),
+                            text_color=COLORS["TEXT_SECONDARY"]).pack(anchor="w")
             
             progress_bar = ctk.CTkProgressBar(subject_card, width=150, height=20)
             progress_bar.pack(side="right", padx=10, pady=5)
@@ -1535,7 +1802,7 @@ class MainWindow(ctk.CTk):
             
             topics_text = f"📝 {topic_count} {self.lang.get('statistics.topics', 'topics')}"
             ctk.CTkLabel(subject_card, text=topics_text, 
-                        font=ctk.CTkFont(size=11)).pack(side="right", padx=10, pady=5)
+                        font=get_font(size=11)).pack(side="right", padx=10, pady=5)
         
         close_text = self.lang.get("actions.close", "Close")
         ctk.CTkButton(stats_window, text=close_text, command=stats_window.destroy,
@@ -1545,12 +1812,12 @@ class MainWindow(ctk.CTk):
         """Export data dialog with format selection"""
         export_dialog = ctk.CTkToplevel(self)
         export_dialog.title(self.lang.get("export.title", "Export Data"))
-        export_dialog.geometry("300x250")
+        export_dialog.geometry("300x300")
         export_dialog.transient(self)
         export_dialog.grab_set()
         
         ctk.CTkLabel(export_dialog, text=self.lang.get("export.select_format", "Select Export Format"), 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=20)
+                    font=get_font(size=16, weight="bold")).pack(pady=20)
         
         def export_json():
             export_dialog.destroy()
@@ -1630,8 +1897,91 @@ class MainWindow(ctk.CTk):
                      fg_color=COLORS["HOVER_COLOR"], width=200).pack(pady=5)
         ctk.CTkButton(export_dialog, text=self.lang.get("export.export_pdf", "Export to PDF"), command=export_pdf, 
                      fg_color=COLORS["HOVER_COLOR"], width=200).pack(pady=5)
+        
+        def import_sessions():
+            export_dialog.destroy()
+            self._import_sessions()
+        
+        ctk.CTkButton(export_dialog, text=self.lang.get("export.import_sessions", "Import Sessions"), command=import_sessions, 
+                     fg_color=COLORS["SUCCESS"], width=200).pack(pady=5)
         ctk.CTkButton(export_dialog, text=self.lang.get("export.cancel", "Cancel"), command=export_dialog.destroy).pack(pady=10)
     
+    def _import_sessions(self):
+        """Import study sessions from a CSV/NDJSON file on a worker thread"""
+        file_path = filedialog.askopenfilename(
+            filetypes=[("CSV / NDJSON", "*.csv *.ndjson *.jsonl"), ("All files", "*.*")],
+            title=self.lang.get("export.import_sessions", "Import Sessions")
+        )
+        if not file_path:
+            return
+        
+        progress_dialog = ctk.CTkToplevel(self)
+        progress_dialog.title(self.lang.get("export.import_sessions", "Import Sessions"))
+        progress_dialog.geometry("320x120")
+        progress_dialog.transient(self)
+        progress_dialog.grab_set()
+        progress_label = ctk.CTkLabel(progress_dialog, text=self.lang.get("export.import_reading", "Reading file..."))
+        progress_label.pack(pady=(20, 10))
+        progress_bar = ctk.CTkProgressBar(progress_dialog, mode="indeterminate", width=260)
+        progress_bar.pack(pady=5)
+        progress_bar.start()
+        
+        # The worker only parses and validates; the batch is applied here on the Tk thread
+        updates = queue.Queue()
+        subjects = list(self.data_manager.data)
+        
+        def worker():
+            try:
+                batch = self.time_tracker.prepare_import(
+                    file_path, subjects,
+                    progress_callback=lambda *counts: updates.put(("progress", counts))
+                )
+                updates.put(("done", batch))
+            except Exception as e:
+                updates.put(("error", e))
+        
+        def poll():
+            try:
+                while True:
+                    kind, payload = updates.get_nowait()
+                    if kind == "progress":
+                        processed, imported, skipped = payload
+                        progress_label.configure(text=self.lang.translate(
+                            "export.import_progress", processed=processed, imported=imported, skipped=skipped
+                        ))
+                    else:
+                        progress_dialog.destroy()
+                        self._finish_session_import(kind, payload)
+                        return
+            except queue.Empty:
+                pass
+            self.after(100, poll)
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self.after(100, poll)
+    
+    def _finish_session_import(self, kind, payload):
+        """Apply a parsed import batch and report the result"""
+        if kind == "error":
+            messagebox.showerror(
+                self.lang.get("messages.error", "Error"),
+                f"{self.lang.get('messages.import_error', 'Import error')}: {str(payload)}"
+            )
+            return
+        
+        self.time_tracker.commit_import(payload)
+        self.data_manager.add_question_events(payload["questions"])
+        
+        message = self.lang.translate(
+            "messages.import_success", imported=payload["imported"], skipped=payload["skipped"]
+        )
+        if payload["errors"]:
+            message += "\n\n" + "\n".join(
+                f"{self.lang.get('export.import_row', 'Row')} {row}: {reason}" for row, reason in payload["errors"][:5]
+            )
+        messagebox.showinfo(self.lang.get("messages.success", "Success"), message)
+        self._show_dashboard()
+    
     def _change_language(self, language_label):
         """Change application language"""
         lang_map = {
@@ -1645,66 +1995,46 @@ class MainWindow(ctk.CTk):
         
         if new_lang != self.settings.get_language():
             self.settings.set_language(new_lang)
-            self.lang.set_language(new_lang)
-            
-            # Update quote hint text
-            if hasattr(self, 'quote_hint_label') and self.quote_hint_label:
-                hint_text = "⌨️ Herhangi bir tuşa basarak sözü değiştirin" if new_lang == "tr" else "⌨️ Press any key to change quote"
-                self.quote_hint_label.configure(text=hint_text)
+            self.lang.set_language(new_lang)  # Both catalogs are preloaded, so this does no IO
             
             # Update window title
             title = self.lang.get("app.title", APP_INFO["name"])
             self.title(f"{title} - {APP_INFO['team']} | {APP_INFO['developer']}")
             # Refresh UI
             self._refresh_ui_for_language()
-            # Show message
-            messagebox.showinfo(
-                self.lang.get("messages.success", "Success"),
-                self.lang.get("messages.language_changed", "Language changed. Some changes may require restart.")
-            )
     
     def _refresh_ui_for_language(self):
-        """Refresh UI elements when language changes"""
-        # Store current state
-        current_subject = self.selected_subject
-        current_view = self.current_view
+        """Re-translate the UI in place.
         
-        # Clear header and recreate
-        for widget in self.grid_slaves(row=0):
-            widget.destroy()
-        self._create_header()
-        
-        # Clear sidebar and recreate
-        if hasattr(self, 'sidebar'):
-            self.sidebar.destroy()
-        self._create_sidebar()
+        Nothing is destroyed: bound widget texts are reconfigured, and the shown view
+        re-fills only its sections whose version key includes the language, so scroll
+        positions, the selected subject and topic table sort/filter all survive.
+        """
+        self.texts.refresh()
+        self._update_header_stats()
         
-        # Refresh current view
-        if current_view == "dashboard":
+        if self.current_view == "dashboard":
             self._show_dashboard()
-        elif current_subject:
-            self._select_subject(current_subject)
-        
+        elif self.current_view == "subject" and self.selected_subject:
+            self._show_subject_details(self.selected_subject)
     
     def _change_theme(self, theme):
-        """Change application theme"""
+        """Change application theme.
+        
+        Widgets use (light, dark) colors, which CustomTkinter re-colors in place, so
+        nothing is rebuilt; only a shown subject's matplotlib chart is redrawn.
+        """
         # Theme is already in English format (Dark or Light)
         if theme != ctk.get_appearance_mode():
             ctk.set_appearance_mode(theme)
             self.settings.set_theme(theme)
             
-            # Destroy old header and recreate with new colors
-            if hasattr(self, 'header_frame'):
-                self.header_frame.destroy()
-            
-            # Recreate header with new theme colors
-            self._create_header()
+            # Widgets created from now on get fonts built for the new theme
+            clear_fonts()
             
-            # Refresh current view
-            if self.selected_subject:
+            # Charts are rendered for one mode; their section is keyed on it
+            if self.current_view == "subject" and self.selected_subject:
                 self._show_subject_details(self.selected_subject)
-            else:
-                self._show_dashboard()
     
     def _create_quick_actions_section(self, parent):
         """Create quick actions section with modern buttons"""
@@ -1720,7 +2050,7 @@ class MainWindow(ctk.CTk):
         title = ctk.CTkLabel(
             actions_frame,
             text=f"⚡ {self.lang.get('dashboard.quick_actions', 'Quick Actions')}",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=get_font(size=18, weight="bold"),
             text_color=(COLORS["PRIMARY"], COLORS["ACCENT_2"])
         )
         title.pack(pady=(15, 10))
@@ -1745,7 +2075,7 @@ class MainWindow(ctk.CTk):
                 hover_color=color,
                 command=command,
                 corner_radius=10,
-                font=ctk.CTkFont(size=13, weight="bold")
+                font=get_font(size=13, weight="bold")
             )
             btn.pack(side="left", padx=8)
     
@@ -1766,7 +2096,7 @@ class MainWindow(ctk.CTk):
         title = ctk.CTkLabel(
             title_frame,
             text=f"📚 {self.lang.get('subject.subjects', 'Subjects')} - {self.lang.get('dashboard.quick_view', 'Quick View')}",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=get_font(size=18, weight="bold"),
             text_color=(COLORS["PRIMARY"], COLORS["ACCENT_2"])
         )
         title.pack(side="left")
@@ -1776,7 +2106,7 @@ class MainWindow(ctk.CTk):
             no_subjects_label = ctk.CTkLabel(
                 subjects_frame,
                 text=self.lang.get("subject.select", "Select a subject"),
-                font=ctk.CTkFont(size=12),
+                font=get_font(size=12),
                 text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
             )
             no_subjects_label.pack(pady=15)
@@ -1817,7 +2147,7 @@ class MainWindow(ctk.CTk):
             name_label = ctk.CTkLabel(
                 inner_card,
                 text=subject_name,
-                font=ctk.CTkFont(size=14, weight="bold"),
+                font=get_font(size=14, weight="bold"),
                 anchor="w"
             )
             name_label.pack(fill="x", pady=(0, 8))
@@ -1827,7 +2157,7 @@ class MainWindow(ctk.CTk):
             progress_label = ctk.CTkLabel(
                 inner_card,
                 text=progress_text,
-                font=ctk.CTkFont(size=12),
+                font=get_font(size=12),
                 text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
             )
             progress_label.pack(fill="x", pady=(0, 5))
@@ -1856,12 +2186,13 @@ class MainWindow(ctk.CTk):
                 hover_color=COLORS["PRIMARY_DARK"],
                 command=make_click_handler(subject_name),
                 corner_radius=8,
-                font=ctk.CTkFont(size=11, weight="bold")
+                font=get_font(size=11, weight="bold")
             )
             view_btn.pack()
     
-    def _create_time_tracking_section(self, parent):
+    def _create_time_tracking_section(self, parent, snapshot=None):
         """Create time tracking section in dashboard"""
+        snapshot = snapshot or self.analytics.dashboard_snapshot()
         time_frame = ctk.CTkFrame(
             parent,
             corner_radius=15,
@@ -1874,19 +2205,46 @@ class MainWindow(ctk.CTk):
         title = ctk.CTkLabel(
             time_frame,
             text=self.lang.get("time.tracking", "Time Tracking"),
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(size=18, weight="bold")
         )
         title.pack(pady=(10, 10))
         
         # Today's stats
-        today_stats = self.time_tracker.get_today_stats()
-        stats_text = f"{self.lang.get('time.total_today', 'Total Today')}: {int(today_stats['total_time_minutes'])} min | {today_stats['total_questions']} {self.lang.get('subject.questions', 'questions')}"
-        ctk.CTkLabel(time_frame, text=stats_text, font=ctk.CTkFont(size=14)).pack(pady=5)
+        stats_text = f"{self.lang.get('time.total_today', 'Total Today')}: {int(snapshot.today_time_minutes)} min | {snapshot.today_questions} {self.lang.get('subject.questions', 'questions')}"
+        ctk.CTkLabel(time_frame, text=stats_text, font=get_font(size=14)).pack(pady=5)
         
         # Session controls
         controls_frame = ctk.CTkFrame(time_frame, fg_color="transparent")
         controls_frame.pack(pady=10)
         
+        if self.active_session_id and self.pomodoro.is_active():
+            # Pomodoro pauses and resumes the session itself
+            ctk.CTkLabel(
+                time_frame,
+                text=self.lang.translate(
+                    "pomodoro.status", phase=self.lang.get(f"pomodoro.{self.pomodoro.phase}", self.pomodoro.phase),
+                    completed=self.pomodoro.state["completed"]
+                ),
+                font=get_font(size=13)
+            ).pack(before=controls_frame)
+            ctk.CTkButton(
+                controls_frame,
+                text=self.lang.get("pomodoro.skip", "Skip"),
+                fg_color=COLORS["WARNING"],
+                hover_color="#d97706",
+                command=self._skip_pomodoro_phase
+            ).pack(side="left", padx=5)
+        elif self.active_session_id:
+            paused = self.time_tracker.is_paused(self.active_session_id)
+            pause_button = ctk.CTkButton(
+                controls_frame,
+                text=self.lang.get("time.resume_session", "Resume") if paused else self.lang.get("time.pause_session", "Pause"),
+                fg_color=COLORS["WARNING"],
+                hover_color="#d97706"
+            )
+            pause_button.configure(command=partial(self._toggle_session_pause, pause_button))
+            pause_button.pack(side="left", padx=5)
+        
         if self.active_session_id:
             ctk.CTkButton(
                 controls_frame,
@@ -1914,6 +2272,24 @@ class MainWindow(ctk.CTk):
                     fg_color=COLORS["HOVER_COLOR"],
                     command=lambda: self._start_study_session(session_subject_var.get())
                 ).pack(side="left", padx=5)
+                
+                ctk.CTkButton(
+                    controls_frame,
+                    text="🍅 " + self.lang.get("pomodoro.title", "Pomodoro"),
+                    fg_color=COLORS["SUCCESS"],
+                    width=110,
+                    command=lambda: self._start_pomodoro(session_subject_var.get())
+                ).pack(side="left", padx=5)
+                
+                ctk.CTkButton(
+                    controls_frame,
+                    text="⚙️",
+                    width=32,
+                    fg_color="transparent",
+                    border_width=1,
+                    text_color=(COLORS["PRIMARY"], COLORS["PRIMARY"]),
+                    command=self._show_pomodoro_settings
+                ).pack(side="left", padx=(0, 5))
     
     def _create_goals_section(self, parent):
         """Create goals section in dashboard"""
@@ -1932,7 +2308,7 @@ class MainWindow(ctk.CTk):
         title = ctk.CTkLabel(
             title_frame,
             text=self.lang.get("goals.title", "Goals"),
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(size=18, weight="bold")
         )
         title.pack(side="left")
         
@@ -1953,7 +2329,7 @@ class MainWindow(ctk.CTk):
                 goal_card.pack(fill="x", padx=10, pady=5)
                 
                 goal_text = f"{goal['subject']} - {goal['type']}: {goal['current_value']}/{goal['target_value']}"
-                ctk.CTkLabel(goal_card, text=goal_text, font=ctk.CTkFont(size=12)).pack(side="left", padx=10, pady=5)
+                ctk.CTkLabel(goal_card, text=goal_text, font=get_font(size=12)).pack(side="left", padx=10, pady=5)
                 
                 progress = min(goal['current_value'] / goal['target_value'], 1.0) if goal['target_value'] > 0 else 0
                 progress_bar = ctk.CTkProgressBar(goal_card, width=200)
@@ -1963,7 +2339,7 @@ class MainWindow(ctk.CTk):
             ctk.CTkLabel(
                 goals_frame,
                 text=self.lang.get("goals.no_goals", "No active goals. Add one to get started!"),
-                font=ctk.CTkFont(size=12),
+                font=get_font(size=12),
                 text_color="gray"
             ).pack(pady=10)
     
@@ -1981,7 +2357,7 @@ class MainWindow(ctk.CTk):
         title = ctk.CTkLabel(
             activity_frame,
             text=self.lang.get("recent_activity.title", "Recent Activity"),
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=get_font(size=18, weight="bold"),
             text_color=(COLORS["PRIMARY"], COLORS["ACCENT_2"])
         )
         title.pack(pady=(15, 10))
@@ -1994,19 +2370,20 @@ class MainWindow(ctk.CTk):
                 ctk.CTkLabel(
                     activity_frame,
                     text=note_text,
-                    font=ctk.CTkFont(size=11),
+                    font=get_font(size=11),
                     anchor="w"
                 ).pack(fill="x", padx=15, pady=2)
         else:
             ctk.CTkLabel(
                 activity_frame,
                 text=self.lang.get("recent_activity.no_activity", "No recent activity"),
-                font=ctk.CTkFont(size=12),
+                font=get_font(size=12),
                 text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
             ).pack(pady=15)
     
-    def _create_weekly_summary_section(self, parent):
+    def _create_weekly_summary_section(self, parent, snapshot=None):
         """Create weekly summary section"""
+        snapshot = snapshot or self.analytics.dashboard_snapshot()
         weekly_frame = ctk.CTkFrame(
             parent,
             corner_radius=15,
@@ -2019,13 +2396,11 @@ class MainWindow(ctk.CTk):
         title = ctk.CTkLabel(
             weekly_frame,
             text=f"📅 {self.lang.get('dashboard.weekly_summary', 'Weekly Summary')}",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=get_font(size=18, weight="bold"),
             text_color=(COLORS["PRIMARY"], COLORS["ACCENT_2"])
         )
         title.pack(pady=(15, 10))
         
-        week_stats = self.time_tracker.get_week_stats()
-        
         # Stats grid
         stats_grid = ctk.CTkFrame(weekly_frame, fg_color="transparent")
         stats_grid.pack(fill="x", padx=15, pady=(0, 15))
@@ -2045,23 +2420,23 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             time_card,
             text="⏱️",
-            font=ctk.CTkFont(size=24)
+            font=get_font(size=24)
         ).pack(pady=(10, 5))
         
-        total_hours = int(week_stats['total_time_minutes'] / 60)
-        total_mins = int(week_stats['total_time_minutes'] % 60)
+        total_hours = int(snapshot.week_time_minutes / 60)
+        total_mins = int(snapshot.week_time_minutes % 60)
         time_text = f"{total_hours}h {total_mins}m"
         ctk.CTkLabel(
             time_card,
             text=time_text,
-            font=ctk.CTkFont(size=16, weight="bold"),
+            font=get_font(size=16, weight="bold"),
             text_color=COLORS["INFO"]
         ).pack(pady=(0, 5))
         
         ctk.CTkLabel(
             time_card,
             text=self.lang.get("analytics.total_time", "Total Time"),
-            font=ctk.CTkFont(size=11),
+            font=get_font(size=11),
             text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
         ).pack(pady=(0, 10))
         
@@ -2077,20 +2452,20 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             questions_card,
             text="📚",
-            font=ctk.CTkFont(size=24)
+            font=get_font(size=24)
         ).pack(pady=(10, 5))
         
         ctk.CTkLabel(
             questions_card,
-            text=f"{week_stats['total_questions']}",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            text=f"{snapshot.week_questions}",
+            font=get_font(size=16, weight="bold"),
             text_color=COLORS["ERROR"]
         ).pack(pady=(0, 5))
         
         ctk.CTkLabel(
             questions_card,
             text=self.lang.get("subject.questions", "Questions"),
-            font=ctk.CTkFont(size=11),
+            font=get_font(size=11),
             text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
         ).pack(pady=(0, 10))
         
@@ -2106,20 +2481,20 @@ class MainWindow(ctk.CTk):
         ctk.CTkLabel(
             sessions_card,
             text="🎯",
-            font=ctk.CTkFont(size=24)
+            font=get_font(size=24)
         ).pack(pady=(10, 5))
         
         ctk.CTkLabel(
             sessions_card,
-            text=f"{week_stats['session_count']}",
-            font=ctk.CTkFont(size=16, weight="bold"),
+            text=f"{snapshot.week_sessions}",
+            font=get_font(size=16, weight="bold"),
             text_color=COLORS["SUCCESS"]
         ).pack(pady=(0, 5))
         
         ctk.CTkLabel(
             sessions_card,
             text=self.lang.get("dashboard.sessions", "Sessions"),
-            font=ctk.CTkFont(size=11),
+            font=get_font(size=11),
             text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
         ).pack(pady=(0, 10))
     
@@ -2141,7 +2516,7 @@ class MainWindow(ctk.CTk):
         title = ctk.CTkLabel(
             deadlines_frame,
             text=f"⏰ {self.lang.get('subject.upcoming_deadlines', 'Upcoming Deadlines')}",
-            font=ctk.CTkFont(size=18, weight="bold"),
+            font=get_font(size=18, weight="bold"),
             text_color=(COLORS["WARNING"], COLORS["WARNING"])
         )
         title.pack(pady=(15, 10))
@@ -2173,7 +2548,7 @@ class MainWindow(ctk.CTk):
                 ctk.CTkLabel(
                     deadline_card,
                     text=deadline_text,
-                    font=ctk.CTkFont(size=13, weight="bold"),
+                    font=get_font(size=13, weight="bold"),
                     text_color=deadline_color
                 ).pack(side="left", padx=10, pady=8)
                 
@@ -2186,20 +2561,152 @@ class MainWindow(ctk.CTk):
                     hover_color=COLORS["PRIMARY_DARK"],
                     command=partial(self._select_subject, subject_name),
                     corner_radius=8,
-                    font=ctk.CTkFont(size=11, weight="bold")
+                    font=get_font(size=11, weight="bold")
                 ).pack(side="right", padx=10, pady=8)
             except:
                 continue
     
+    def _start_session_timer(self):
+        """(Re)start the live session timer in the header"""
+        self._last_checkpoint_minute = 0
+        self.timer_wheel.every_second("session_timer", self._tick_session_timer)
+        self._tick_session_timer()
+    
+    def _tick_session_timer(self):
+        """Refresh the header timer (every timer wheel tick) and checkpoint the session every minute"""
+        session = self.time_tracker.sessions.get(self.active_session_id) if self.active_session_id else None
+        if not session or session.get("end_time"):
+            self.session_timer_label.configure(text="")
+            self.timer_wheel.cancel("session_timer")
+            return
+        
+        elapsed = self.time_tracker.get_elapsed_seconds(self.active_session_id)
+        if self.pomodoro.is_active():
+            # Count down the current Pomodoro phase
+            minutes, seconds = divmod(int(math.ceil(self.pomodoro.remaining_seconds())), 60)
+            phase = self.lang.get(f"pomodoro.{self.pomodoro.phase}", self.pomodoro.phase)
+            text = f"🍅 {phase} {minutes:02d}:{seconds:02d}  {session.get('subject', '')}"
+        else:
+            hours, remainder = divmod(int(elapsed), 3600)
+            minutes, seconds = divmod(remainder, 60)
+            icon = "⏸️" if self.time_tracker.is_paused(self.active_session_id) else "⏱️"
+            text = f"{icon} {session.get('subject', '')}  {hours:02d}:{minutes:02d}:{seconds:02d}"
+        self.session_timer_label.configure(text=text)
+        
+        if int(elapsed) // 60 > self._last_checkpoint_minute:
+            self._last_checkpoint_minute = int(elapsed) // 60
+            self.time_tracker.checkpoint(self.active_session_id)
+    
+    def _schedule_pomodoro(self):
+        """Arm the timer wheel for the end of the current Pomodoro phase"""
+        if self.pomodoro.is_active():
+            self.timer_wheel.call_at("pomodoro", self.pomodoro.phase_end, self._on_pomodoro_phase_end)
+        else:
+            self.timer_wheel.cancel("pomodoro")
+    
+    def _on_pomodoro_phase_end(self):
+        """Switch between work and break when a Pomodoro phase is over"""
+        if self.pomodoro.advance():
+            self.bell()
+            if self.current_view == "dashboard":
+                self._show_dashboard()
+        self._schedule_pomodoro()
+    
+    def _start_pomodoro(self, subject_name):
+        """Start a Pomodoro run; its work intervals are logged as one study session"""
+        self.active_session_id = self.pomodoro.start(subject_name)
+        self._start_session_timer()
+        self._schedule_pomodoro()
+        self._show_dashboard()
+    
+    def _skip_pomodoro_phase(self):
+        """End the current Pomodoro phase early"""
+        self.pomodoro.skip()
+        self._schedule_pomodoro()
+        self._tick_session_timer()
+        self._show_dashboard()
+    
+    def _show_pomodoro_settings(self):
+        """Edit the Pomodoro work and break lengths"""
+        dialog = ctk.CTkToplevel(self)
+        dialog.title(self.lang.get("pomodoro.settings", "Pomodoro Settings"))
+        dialog.geometry("320x330")
+        dialog.transient(self)
+        dialog.grab_set()
+        
+        fields = [
+            ("work_minutes", self.lang.get("pomodoro.work_minutes", "Work (minutes)")),
+            ("short_break_minutes", self.lang.get("pomodoro.short_break_minutes", "Short break (minutes)")),
+            ("long_break_minutes", self.lang.get("pomodoro.long_break_minutes", "Long break (minutes)")),
+            ("long_break_every", self.lang.get("pomodoro.long_break_every", "Long break every (work intervals)"))
+        ]
+        entries = {}
+        for key, label in fields:
+            ctk.CTkLabel(dialog, text=label).pack(pady=(8, 2))
+            entry = ctk.CTkEntry(dialog, width=120)
+            entry.insert(0, str(self.pomodoro.settings[key]))
+            entry.pack()
+            entries[key] = entry
+        
+        def save():
+            try:
+                values = {key: int(entry.get()) for key, entry in entries.items()}
+                if min(values.values()) <= 0:
+                    raise ValueError
+            except ValueError:
+                messagebox.showerror(
+                    self.lang.get("messages.error", "Error"),
+                    self.lang.get("messages.invalid_number", "Invalid number!")
+                )
+                return
+            # New lengths apply from the next phase on
+            self.pomodoro.settings.update(values)
+            self.settings.set("pomodoro", values)
+            dialog.destroy()
+        
+        ctk.CTkButton(dialog, text=self.lang.get("actions.save", "Save"), command=save, 
+                     fg_color=COLORS["HOVER_COLOR"]).pack(pady=(15, 5))
+    
+    def _toggle_session_pause(self, button=None):
+        """Pause or resume the active study session"""
+        if not self.active_session_id:
+            return
+        if self.time_tracker.is_paused(self.active_session_id):
+            self.time_tracker.resume_session(self.active_session_id)
+            text = self.lang.get("time.pause_session", "Pause")
+        else:
+            self.time_tracker.pause_session(self.active_session_id)
+            text = self.lang.get("time.resume_session", "Resume")
+        if button is not None:
+            button.configure(text=text)
+        self._start_session_timer()
+    
     def _start_study_session(self, subject_name):
         """Start a study session"""
         self.active_session_id = self.time_tracker.start_session(subject_name)
+        self._start_session_timer()
         messagebox.showinfo(
             self.lang.get("messages.success", "Success"),
             self.lang.translate("messages.session_started", subject=subject_name)
         )
         self._show_dashboard()
     
+    def _on_close(self):
+        """End the running session with its exact length, then close the window.
+        
+        A Pomodoro run keeps its saved schedule and continues in a new session on the
+        next start, as it does after a crash.
+        """
+        if self.active_session_id:
+            try:
+                self.time_tracker.end_session(self.active_session_id)
+            except Exception as e:
+                print(f"Session end error: {e}")
+            self.active_session_id = None
+        self._cancel_subject_render()
+        self.timer_wheel.stop()
+        self.destroy()
+    
     def _end_study_session(self):
         """End current study session"""
         if self.active_session_id:
@@ -2211,7 +2718,7 @@ class MainWindow(ctk.CTk):
             dialog.grab_set()
             
             ctk.CTkLabel(dialog, text=self.lang.get("time.end_session_question", "Do you want to end the study session?"), 
-                        font=ctk.CTkFont(size=14, weight="bold")).pack(pady=10)
+                        font=get_font(size=14, weight="bold")).pack(pady=10)
             
             ctk.CTkLabel(dialog, text=self.lang.get("time.questions_solved", "Questions Solved")).pack(pady=5)
             questions_entry = ctk.CTkEntry(dialog, placeholder_text="0")
@@ -2227,12 +2734,16 @@ class MainWindow(ctk.CTk):
                     questions = int(questions_entry.get() or "0")
                     notes = notes_entry.get() or ""
                     session = self.time_tracker.end_session(self.active_session_id, questions, notes)
+                    if self.pomodoro.is_active():
+                        self.pomodoro.stop()
+                        self._schedule_pomodoro()
                     if session and questions > 0:
                         # Update data manager if questions were solved
                         session_subject = session.get("subject", "")
                         if session_subject:
                             self.data_manager.add_questions(session_subject, questions)
                     self.active_session_id = None
+                    self._start_session_timer()  # Clears the header timer
                     dialog.destroy()
                     messagebox.showinfo(
                         self.lang.get("messages.success", "Success"),
@@ -2301,7 +2812,6 @@ class MainWindow(ctk.CTk):
                     self.lang.get("goals.goal_added", "Goal added successfully!")
                 )
                 dialog.destroy()
-                self._show_dashboard()
             except ValueError:
                 messagebox.showerror(
                     self.lang.get("messages.error", "Error"),
@@ -2329,31 +2839,56 @@ class MainWindow(ctk.CTk):
         score_frame = ctk.CTkFrame(scroll_frame)
         score_frame.pack(fill="x", pady=10)
         ctk.CTkLabel(score_frame, text=self.lang.get("analytics.productivity_score", "Productivity Score"), 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+                    font=get_font(size=16, weight="bold")).pack(pady=10)
         ctk.CTkLabel(score_frame, text=f"{productivity}%", 
-                    font=ctk.CTkFont(size=32, weight="bold"),
+                    font=get_font(size=32, weight="bold"),
                     text_color=COLORS["HOVER_COLOR"]).pack(pady=10)
+        productivity_chart_frame = ctk.CTkFrame(score_frame, height=260)
+        productivity_chart_frame.pack(fill="x", padx=10, pady=(0, 10))
+        self.chart_manager.create_productivity_chart(
+            productivity_chart_frame,
+            self.analytics.get_productivity_history(),
+            ctk.get_appearance_mode()
+        )
         
         # Study streak
         streak = self.analytics.get_study_streak()
         streak_frame = ctk.CTkFrame(scroll_frame)
         streak_frame.pack(fill="x", pady=10)
         ctk.CTkLabel(streak_frame, text=self.lang.get("analytics.study_streak", "Study Streak"), 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+                    font=get_font(size=16, weight="bold")).pack(pady=10)
         streak_text = f"{streak} {self.lang.get('dashboard.days', 'days')}"
         ctk.CTkLabel(streak_frame, text=streak_text, 
-                    font=ctk.CTkFont(size=24, weight="bold")).pack(pady=10)
+                    font=get_font(size=24, weight="bold")).pack(pady=10)
         
         # Weekly trend
         weekly_trend = self.analytics.get_weekly_trend()
         trend_frame = ctk.CTkFrame(scroll_frame)
         trend_frame.pack(fill="x", pady=10)
         ctk.CTkLabel(trend_frame, text=self.lang.get("analytics.weekly_trend", "Weekly Trend"), 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+                    font=get_font(size=16, weight="bold")).pack(pady=10)
         
         for week in weekly_trend:
             week_text = f"{week['week']}: {int(week['total_time'])} {self.lang.get('dashboard.minutes', 'min')}, {week['total_questions']} {self.lang.get('subject.questions', 'questions')}"
-            ctk.CTkLabel(trend_frame, text=week_text, font=ctk.CTkFont(size=12)).pack(pady=2)
+            ctk.CTkLabel(trend_frame, text=week_text, font=get_font(size=12)).pack(pady=2)
+        
+        # Time of day / weekday histograms
+        histogram_frame = ctk.CTkFrame(scroll_frame)
+        histogram_frame.pack(fill="x", pady=10)
+        ctk.CTkLabel(histogram_frame, text=self.lang.get("analytics.time_of_day", "Time of Day & Weekday"), 
+                    font=get_font(size=16, weight="bold")).pack(pady=10)
+        histogram_chart_frame = ctk.CTkFrame(histogram_frame, height=300)
+        histogram_chart_frame.pack(fill="x", padx=10, pady=(0, 10))
+        self.chart_manager.create_time_histogram_chart(
+            histogram_chart_frame,
+            self.analytics.get_time_histograms(),
+            ctk.get_appearance_mode()
+        )
+        
+        # Cross-subject correlation matrix
+        correlation_frame = ctk.CTkFrame(scroll_frame)
+        correlation_frame.pack(fill="x", pady=10)
+        self._create_correlation_section(correlation_frame)
         
         # Recommendations
         recommendations = self.analytics.get_recommendations()
@@ -2361,21 +2896,85 @@ class MainWindow(ctk.CTk):
             rec_frame = ctk.CTkFrame(scroll_frame)
             rec_frame.pack(fill="x", pady=10)
             ctk.CTkLabel(rec_frame, text=self.lang.get("analytics.recommendations", "Recommendations"), 
-                        font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10)
+                        font=get_font(size=16, weight="bold")).pack(pady=10)
             
             for rec in recommendations:
-                rec_text = rec.get("message", "")
+                rec_text = RecommendationEngine.format(rec, self.lang)
                 color = COLORS.get(rec.get("type", "info").upper(), COLORS["INFO"])
-                ctk.CTkLabel(rec_frame, text=rec_text, font=ctk.CTkFont(size=12),
+                ctk.CTkLabel(rec_frame, text=rec_text, font=get_font(size=12),
                            text_color=color).pack(pady=2, anchor="w", padx=10)
         
         ctk.CTkButton(analytics_window, text=self.lang.get("actions.close", "Close"),
                      command=analytics_window.destroy).pack(pady=10)
     
+    def _create_correlation_section(self, parent):
+        """Create the cross-subject correlation matrix view"""
+        ctk.CTkLabel(parent, text=self.lang.get("analytics.correlation", "Subject Correlation"), 
+                    font=get_font(size=16, weight="bold")).pack(pady=10)
+        ctk.CTkLabel(parent, text=self.lang.get("analytics.correlation_hint", "Rows: minutes studied, columns: questions solved the same day (last column: topics completed)"),
+                    font=get_font(size=11), text_color=COLORS["TEXT_SECONDARY"]).pack(pady=(0, 5))
+        
+        methods = {
+            self.lang.get("analytics.pearson", "Pearson"): "pearson",
+            self.lang.get("analytics.spearman", "Spearman"): "spearman"
+        }
+        matrix_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        
+        def cell_color(value):
+            # Blend from neutral grey towards green (positive) or red (negative)
+            if value is None:
+                return "transparent"
+            target = COLORS["SUCCESS"] if value >= 0 else COLORS["ERROR"]
+            base = (0x64, 0x74, 0x8b)
+            strength = min(abs(value), 1.0)
+            rgb = [
+                round(b + (int(target[1 + 2 * i:3 + 2 * i], 16) - b) * strength)
+                for i, b in enumerate(base)
+            ]
+            return "#{:02x}{:02x}{:02x}".format(*rgb)
+        
+        def render(choice):
+            for child in matrix_frame.winfo_children():
+                child.destroy()
+            
+            result = self.analytics.get_subject_correlations(methods.get(choice, "pearson"))
+            names = result["subjects"]
+            if result["days"] < self.analytics.correlation.min_active_days or len(names) < 2:
+                ctk.CTkLabel(matrix_frame, text=self.lang.get("analytics.correlation_no_data", "Not enough study days yet"),
+                            font=get_font(size=12), text_color=COLORS["TEXT_SECONDARY"]).grid(row=0, column=0, pady=5)
+                return
+            
+            for j, name in enumerate(names):
+                ctk.CTkLabel(matrix_frame, text=name[:10], font=get_font(size=11, weight="bold")).grid(
+                    row=0, column=j + 1, padx=2, pady=2)
+            ctk.CTkLabel(matrix_frame, text=self.lang.get("analytics.topics_done", "Topics"),
+                        font=get_font(size=11, weight="bold")).grid(row=0, column=len(names) + 1, padx=(8, 2), pady=2)
+            
+            completions = result["effort_vs_completions"]
+            for i, (name, row) in enumerate(zip(names, result["effort_vs_questions"])):
+                ctk.CTkLabel(matrix_frame, text=name[:10], font=get_font(size=11, weight="bold")).grid(
+                    row=i + 1, column=0, padx=(2, 6), pady=2, sticky="e")
+                for j, value in enumerate(row + [completions.get(name)]):
+                    ctk.CTkLabel(
+                        matrix_frame,
+                        text="-" if value is None else f"{value:+.2f}",
+                        width=56,
+                        height=26,
+                        corner_radius=6,
+                        fg_color=cell_color(value),
+                        font=get_font(size=11)
+                    ).grid(row=i + 1, column=j + 1, padx=(8 if j == len(names) else 2, 2), pady=2)
+        
+        method_selector = ctk.CTkSegmentedButton(parent, values=list(methods), command=render)
+        method_selector.set(list(methods)[0])
+        method_selector.pack(pady=(0, 5))
+        matrix_frame.pack(padx=10, pady=(0, 10))
+        render(list(methods)[0])
+    
     def _create_subject_notes_section(self, parent, subject_name):
         """Create notes section for subject"""
         ctk.CTkLabel(parent, text=self.lang.get("notes.title", "Notes"), 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10, anchor="w", padx=10)
+                    font=get_font(size=16, weight="bold")).pack(pady=10, anchor="w", padx=10)
         
         # Notes list
         notes_list_frame = ctk.CTkFrame(parent)
@@ -2392,10 +2991,10 @@ class MainWindow(ctk.CTk):
                 note_text = note.get("text", "")[:100]
                 note_date = note.get("date", "")[:10]
                 ctk.CTkLabel(note_frame, text=f"{note_date}: {note_text}", 
-                            font=ctk.CTkFont(size=11), anchor="w").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+                            font=get_font(size=11), anchor="w").grid(row=0, column=0, sticky="w", padx=5, pady=2)
         else:
             ctk.CTkLabel(notes_list_frame, text=self.lang.get("notes.no_notes", "No notes yet"),
-                        font=ctk.CTkFont(size=12), text_color="gray").grid(row=0, column=0, padx=5, pady=5)
+                        font=get_font(size=12), text_color="gray").grid(row=0, column=0, padx=5, pady=5)
         
         # Add note button
         def add_note_dialog():
@@ -2414,7 +3013,6 @@ class MainWindow(ctk.CTk):
                 if note_text:
                     self.notes_manager.add_note(subject_name, None, note_text)
                     note_dialog.destroy()
-                    self._show_subject_details(subject_name)
             
             ctk.CTkButton(note_dialog, text=self.lang.get("notes.save", "Save"), command=save_note).pack(pady=10)
         
@@ -2431,7 +3029,7 @@ class MainWindow(ctk.CTk):
         title_label = ctk.CTkLabel(
             title_row,
             text=f"📍 {self.lang.get('last_position.title', 'Last Position')}",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(size=12, weight="bold"),
             text_color=(COLORS["PRIMARY"], COLORS["ACCENT_2"])
         )
         title_label.grid(row=0, column=0, sticky="w")
@@ -2452,7 +3050,7 @@ class MainWindow(ctk.CTk):
             text_label = ctk.CTkLabel(
                 content_frame,
                 text=position_text,
-                font=ctk.CTkFont(size=11),
+                font=get_font(size=11),
                 anchor="w",
                 wraplength=600
             )
@@ -2462,7 +3060,7 @@ class MainWindow(ctk.CTk):
             date_label = ctk.CTkLabel(
                 content_frame,
                 text=f"📅 {position_date}",
-                font=ctk.CTkFont(size=9),
+                font=get_font(size=9),
                 text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
             )
             date_label.grid(row=1, column=0, sticky="w", pady=(3, 0))
@@ -2485,7 +3083,6 @@ class MainWindow(ctk.CTk):
                             self.lang.get("messages.success", "Success"),
                             self.lang.get("last_position.deleted", "Last position deleted!")
                         )
-                        self._show_subject_details(subject_name)
             
             ctk.CTkButton(
                 buttons_frame,
@@ -2496,7 +3093,7 @@ class MainWindow(ctk.CTk):
                 hover_color=COLORS["PRIMARY_DARK"],
                 command=edit_position,
                 corner_radius=8,
-                font=ctk.CTkFont(size=11, weight="bold")
+                font=get_font(size=11, weight="bold")
             ).pack(side="left", padx=5)
             
             ctk.CTkButton(
@@ -2508,14 +3105,14 @@ class MainWindow(ctk.CTk):
                 hover_color="#c0392b",
                 command=delete_position,
                 corner_radius=8,
-                font=ctk.CTkFont(size=11, weight="bold")
+                font=get_font(size=11, weight="bold")
             ).pack(side="left", padx=5)
         else:
             # Show add button - compact
             no_position_label = ctk.CTkLabel(
                 parent,
                 text=self.lang.get("last_position.no_position", "No last position saved yet"),
-                font=ctk.CTkFont(size=10),
+                font=get_font(size=10),
                 text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
             )
             no_position_label.pack(pady=(0, 6))
@@ -2532,7 +3129,7 @@ class MainWindow(ctk.CTk):
                 hover_color=COLORS["PRIMARY_DARK"],
                 command=add_position,
                 corner_radius=8,
-                font=ctk.CTkFont(size=11, weight="bold")
+                font=get_font(size=11, weight="bold")
             ).pack(pady=(0, 6))
     
     def _show_last_position_dialog(self, subject_name, current_text=""):
@@ -2547,7 +3144,7 @@ class MainWindow(ctk.CTk):
         title_label = ctk.CTkLabel(
             dialog,
             text=self.lang.get("last_position.title", "Last Position"),
-            font=ctk.CTkFont(size=18, weight="bold")
+            font=get_font(size=18, weight="bold")
         )
         title_label.pack(pady=(15, 10))
         
@@ -2555,7 +3152,7 @@ class MainWindow(ctk.CTk):
         desc_label = ctk.CTkLabel(
             dialog,
             text=self.lang.get("last_position.position_text", "Last position (e.g., Page 45, Topic 3.2, etc.)"),
-            font=ctk.CTkFont(size=12),
+            font=get_font(size=12),
             text_color=(COLORS.get("TEXT_SECONDARY", "#95a5a6"), "#b0b0b0")
         )
         desc_label.pack(pady=(0, 10))
@@ -2595,7 +3192,6 @@ class MainWindow(ctk.CTk):
                 )
             
             dialog.destroy()
-            self._show_subject_details(subject_name)
         
         ctk.CTkButton(
             buttons_frame,
@@ -2606,7 +3202,7 @@ class MainWindow(ctk.CTk):
             hover_color=COLORS["PRIMARY_DARK"],
             command=save_position,
             corner_radius=10,
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=get_font(size=13, weight="bold")
         ).pack(side="left", padx=10)
         
         ctk.CTkButton(
@@ -2616,7 +3212,7 @@ class MainWindow(ctk.CTk):
             height=35,
             command=dialog.destroy,
             corner_radius=10,
-            font=ctk.CTkFont(size=13)
+            font=get_font(size=13)
         ).pack(side="left", padx=10)
         
         # Enter key binding
@@ -2677,7 +3273,7 @@ class MainWindow(ctk.CTk):
         
         # Category filter
         ctk.CTkLabel(filter_dialog, text=self.lang.get("subject.filter_by_category", "Filter by Category"),
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 5))
+                    font=get_font(size=14, weight="bold")).pack(pady=(15, 5))
         categories = [self.lang.get("subject.all_categories", "All Categories")] + self.data_manager.get_all_categories()
         category_var = ctk.StringVar(value=self.lang.get("subject.all_categories", "All Categories"))
         if hasattr(self, 'current_filter') and self.current_filter.get("category"):
@@ -2687,7 +3283,7 @@ class MainWindow(ctk.CTk):
         
         # Priority filter
         ctk.CTkLabel(filter_dialog, text=self.lang.get("subject.filter_by_priority", "Filter by Priority"),
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 5))
+                    font=get_font(size=14, weight="bold")).pack(pady=(15, 5))
         priorities = [
             self.lang.get("subject.all_priorities", "All Priorities"),
             self.lang.get("subject.high_priority", "High Priority"),
@@ -2709,7 +3305,7 @@ class MainWindow(ctk.CTk):
         
         # Status filter
         ctk.CTkLabel(filter_dialog, text=self.lang.get("subject.filter_by_status", "Filter by Status"),
-                    font=ctk.CTkFont(size=14, weight="bold")).pack(pady=(15, 5))
+                    font=get_font(size=14, weight="bold")).pack(pady=(15, 5))
         statuses = [
             self.lang.get("subject.all_statuses", "All Statuses"),
             self.lang.get("subject.status_active", "Active"),
@@ -2760,7 +3356,7 @@ class MainWindow(ctk.CTk):
             width=120,
             height=35,
             corner_radius=10,
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=get_font(size=13, weight="bold")
         ).pack(side="left", padx=10)
         
         ctk.CTkButton(
@@ -2770,13 +3366,13 @@ class MainWindow(ctk.CTk):
             width=120,
             height=35,
             corner_radius=10,
-            font=ctk.CTkFont(size=13)
+            font=get_font(size=13)
         ).pack(side="left", padx=10)
     
     def _create_performance_section(self, parent, subject_name):
         """Create performance metrics section"""
         ctk.CTkLabel(parent, text=self.lang.get("analytics.performance", "Performance Metrics"), 
-                    font=ctk.CTkFont(size=16, weight="bold")).pack(pady=10, anchor="w", padx=10)
+                    font=get_font(size=16, weight="bold")).pack(pady=10, anchor="w", padx=10)
         
         performance = self.analytics.get_subject_performance(subject_name)
         
@@ -2787,7 +3383,11 @@ class MainWindow(ctk.CTk):
             (self.lang.get("analytics.efficiency", "Efficiency"), f"{performance['efficiency']} {self.lang.get('analytics.questions_per_hour', 'q/h')}"),
             (self.lang.get("analytics.consistency", "Consistency"), f"{performance['consistency_score']}%"),
             (self.lang.get("analytics.total_time", "Total Time"), f"{performance['total_time_hours']} {self.lang.get('analytics.hours', 'hours')}"),
-            (self.lang.get("analytics.avg_session", "Avg Session"), f"{performance['average_session_time']} {self.lang.get('dashboard.minutes', 'min')}")
+            (self.lang.get("analytics.avg_session", "Avg Session"), f"{performance['average_session_time']} {self.lang.get('dashboard.minutes', 'min')}"),
+            (self.lang.get("analytics.median_session", "Median Session"), f"{performance['median_session_time']} {self.lang.get('dashboard.minutes', 'min')}"),
+            (self.lang.get("analytics.p90_session", "90th Percentile Session"), f"{performance['p90_session_time']} {self.lang.get('dashboard.minutes', 'min')}"),
+            (self.lang.get("analytics.longest_session", "Longest Session"), f"{performance['max_session_time']} {self.lang.get('dashboard.minutes', 'min')}"),
+            (self.lang.get("analytics.median_pace", "Median Pace"), f"{performance['median_questions_per_hour']} {self.lang.get('analytics.questions_per_hour', 'q/h')}")
         ]
         
         for i, (label, value) in enumerate(metrics):
@@ -2795,7 +3395,56 @@ class MainWindow(ctk.CTk):
             metric_frame.grid(row=i//2, column=i%2, padx=5, pady=5, sticky="ew")
             metrics_frame.grid_columnconfigure(i%2, weight=1)
             
-            ctk.CTkLabel(metric_frame, text=label, font=ctk.CTkFont(size=12)).pack(pady=2)
-            ctk.CTkLabel(metric_frame, text=value, font=ctk.CTkFont(size=14, weight="bold"),
+            ctk.CTkLabel(metric_frame, text=label, font=get_font(size=12)).pack(pady=2)
+            ctk.CTkLabel(metric_frame, text=value, font=get_font(size=14, weight="bold"),
                         text_color=COLORS["HOVER_COLOR"]).pack(pady=2)
+    
+    def _create_forecast_section(self, parent, subject_name):
+        """Create completion forecast section"""
+        ctk.CTkLabel(parent, text=self.lang.get("forecast.title", "Completion Forecast"), 
+                    font=get_font(size=16, weight="bold")).pack(pady=10, anchor="w", padx=10)
+        
+        forecast = self.analytics.get_completion_forecast(subject_name)
+        if not forecast:
+            return
+        
+        if forecast["completed"]:
+            ctk.CTkLabel(parent, text=f"✅ {self.lang.get('forecast.completed', 'Target reached')}",
+                        font=get_font(size=13, weight="bold"),
+                        text_color=COLORS["SUCCESS"]).pack(pady=(0, 10), anchor="w", padx=15)
+            return
+        
+        if not forecast["eta"]:
+            ctk.CTkLabel(parent, text=self.lang.get("forecast.no_estimate", "Not enough recent activity to estimate"),
+                        font=get_font(size=12), text_color="gray").pack(pady=(0, 10), anchor="w", padx=15)
+        else:
+            metrics_frame = ctk.CTkFrame(parent, fg_color="transparent")
+            metrics_frame.pack(fill="x", padx=10, pady=5)
+            
+            late = forecast["eta_late"] or "∞"
+            metrics = [
+                (self.lang.get("forecast.eta", "Estimated Completion"), forecast["eta"]),
+                (self.lang.get("forecast.range", "Likely Range"), f"{forecast['eta_early']} – {late}"),
+                (self.lang.get("forecast.daily_rate", "Daily Rate"), f"{forecast['daily_rate']} {self.lang.get('forecast.per_day', 'q/day')}")
+            ]
+            
+            for i, (label, value) in enumerate(metrics):
+                metric_frame = ctk.CTkFrame(metrics_frame)
+                metric_frame.grid(row=0, column=i, padx=5, pady=5, sticky="ew")
+                metrics_frame.grid_columnconfigure(i, weight=1)
+                
+                ctk.CTkLabel(metric_frame, text=label, font=get_font(size=12)).pack(pady=2)
+                ctk.CTkLabel(metric_frame, text=value, font=get_font(size=14, weight="bold"),
+                            text_color=COLORS["HOVER_COLOR"]).pack(pady=2)
+        
+        deadline = forecast.get("deadline")
+        if deadline:
+            if forecast["will_miss_deadline"]:
+                text = f"⚠️ {self.lang.translate('forecast.deadline_risk', deadline=deadline)}"
+                color = COLORS["ERROR"]
+            else:
+                text = f"📅 {self.lang.translate('forecast.on_track', deadline=deadline)}"
+                color = COLORS["SUCCESS"]
+            ctk.CTkLabel(parent, text=text, font=get_font(size=12, weight="bold"),
+                        text_color=color).pack(pady=(0, 10), anchor="w", padx=15)
 
@@ -4,7 +4,107 @@ Provides advanced analytics and insights
 """
 
 import datetime
-from collections import defaultdict
+import functools
+from types import MappingProxyType
+from collections import defaultdict, OrderedDict, namedtuple
+from ..config.constants import PERFORMANCE_SETTINGS
+from .forecasting import CompletionForecaster
+from .correlation import SubjectCorrelation
+from .recommendations import RecommendationEngine
+from .productivity import ProductivityHistory, productivity_scores
+from .caching import detached
+
+# Immutable bundle of every metric shown on the dashboard
+DashboardSnapshot = namedtuple("DashboardSnapshot", [
+    "today_time_minutes",
+    "today_questions",
+    "today_sessions",
+    "week_time_minutes",
+    "week_questions",
+    "week_sessions",
+    "week_by_subject",
+    "streak",
+    "productivity",
+    "statistics",
+])
+
+def memoized(*stores):
+    """Cache an Analytics method on its arguments and the versions of the given stores.
+    
+    Results are also keyed on today's date, since most metrics are relative to it.
+    Every caller gets its own copy of the mutable containers in a result, so sorting
+    or annotating it never changes what later cache hits return.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (
+                method.__name__,
+                args,
+                tuple(sorted(kwargs.items())),
+                tuple(getattr(self, store).version for store in stores),
+                datetime.date.today()
+            )
+            try:
+                self._cache.move_to_end(key)
+                return detached(self._cache[key])
+            except KeyError:
+                pass
+            result = method(self, *args, **kwargs)
+            self._cache[key] = result
+            if len(self._cache) > self._cache_max_size:
+                self._cache.popitem(last=False)  # Evict least recently used
+            return detached(result)
+        return wrapper
+    return decorator
+
+def _consistency(study_days, today, days=30):
+    """Share of calendar days studied in the last N days.
+    
+    The window starts at the first study day if the subject was picked up more recently.
+    """
+    if not study_days:
+        return 0
+    
+    window_start = max(
+        today - datetime.timedelta(days=days - 1),
+        datetime.date.fromisoformat(min(study_days))
+    )
+    window_start_str = window_start.isoformat()
+    total_days = (today - window_start).days + 1
+    active_days = len([d for d in study_days if window_start_str <= d <= today.isoformat()])
+    
+    consistency = (active_days / total_days * 100) if total_days > 0 else 0
+    return round(consistency, 1)
+
+def _compute_subject_performance(job):
+    """Compute one subject's performance metrics from pre-partitioned plain data"""
+    solved, target, topic_statuses, recent_durations, study_days, distribution, today = job
+    progress = (solved / target * 100) if target > 0 else 0
+    
+    # Calculate efficiency (questions per hour)
+    total_minutes = sum(recent_durations)
+    total_hours = total_minutes / 60
+    efficiency = solved / total_hours if total_hours > 0 else 0
+    average_session = total_minutes / len(recent_durations) if recent_durations else 0
+    
+    # Calculate completion rate
+    completed_topics = len([status for status in topic_statuses if status == 'Tamamlandı'])
+    completion_rate = (completed_topics / len(topic_statuses) * 100) if topic_statuses else 0
+    
+    return {
+        "progress_percentage": progress,
+        "efficiency": round(efficiency, 2),  # questions per hour
+        "completion_rate": completion_rate,
+        "total_time_hours": round(total_hours, 2),
+        "average_session_time": round(average_session, 2),
+        "consistency_score": _consistency(study_days, today),
+        "median_session_time": distribution["median_minutes"],
+        "p90_session_time": distribution["p90_minutes"],
+        "max_session_time": distribution["max_minutes"],
+        "median_questions_per_hour": distribution["median_questions_per_hour"],
+        "p90_questions_per_hour": distribution["p90_questions_per_hour"]
+    }
 
 class Analytics:
     """Provides advanced analytics"""
@@ -13,36 +113,54 @@ class Analytics:
         self.data_manager = data_manager
         self.time_tracker = time_tracker
         self.goal_tracker = goal_tracker
+        
+        # LRU cache of memoized results
+        self._cache = OrderedDict()
+        self._cache_max_size = PERFORMANCE_SETTINGS.get("max_analytics_cache_size", 128)
+        
+        # Completion forecasts keep their own per-subject cache
+        self.forecaster = CompletionForecaster(data_manager, time_tracker)
+        # So does the cross-subject correlation (one day x subject matrix per data version)
+        self.correlation = SubjectCorrelation(data_manager, time_tracker)
+        # Recommendation rules cache their own results per input version
+        self.recommender = RecommendationEngine(data_manager, time_tracker, goal_tracker, self.forecaster)
+        # Daily productivity scores, materialized to disk
+        self.productivity_history = ProductivityHistory(data_manager, time_tracker)
+    
+    def clear_cache(self):
+        """Drop all memoized results"""
+        self._cache.clear()
     
+    @memoized("data_manager", "time_tracker")
     def get_productivity_score(self, days=7):
         """Calculate productivity score based on multiple factors"""
         week_stats = self.time_tracker.get_week_stats()
         data_stats = self.data_manager.get_statistics()
-        
-        # Factors
-        time_factor = min(week_stats["total_time_minutes"] / (7 * 60), 1.0)  # Normalize to 7 hours/day
-        questions_factor = min(data_stats["total_solved"] / 1000, 1.0)  # Normalize to 1000 questions
-        progress_factor = data_stats["progress"] / 100
-        completion_factor = data_stats["completed_topics"] / max(data_stats["total_topics"], 1)
-        
-        # Weighted score
-        score = (
-            time_factor * 0.25 +
-            questions_factor * 0.25 +
-            progress_factor * 0.25 +
-            completion_factor * 0.25
-        ) * 100
-        
-        return round(score, 1)
+        return self._score(week_stats["total_time_minutes"], data_stats)
+    
+    @staticmethod
+    def _score(week_time_minutes, data_stats):
+        """Weighted productivity score from this week's study time and general statistics"""
+        return float(productivity_scores(
+            week_time_minutes,
+            data_stats["total_solved"],
+            data_stats["total_target"],
+            data_stats["completed_topics"],
+            data_stats["total_topics"]
+        ))
     
+    @memoized("data_manager", "time_tracker")
+    def get_productivity_history(self):
+        """Get the daily productivity score series, ending with today's score"""
+        return self.productivity_history.get_series(self.get_productivity_score())
+    
+    @memoized("data_manager", "time_tracker")
     def get_study_streak(self):
         """Calculate current study streak"""
         sessions = self.time_tracker.sessions
-        if not sessions:
-            return 0
         
-        # Get all unique dates with sessions
-        dates = set()
+        # Get all unique dates with sessions or logged questions
+        dates = set(self.data_manager.daily_questions)
         for session in sessions.values():
             if session.get("start_time"):
                 try:
@@ -51,6 +169,11 @@ class Analytics:
                 except:
                     continue
         
+        return self._streak_from_dates(dates)
+    
+    @staticmethod
+    def _streak_from_dates(dates):
+        """Count consecutive study days ending today from a set of ISO date strings"""
         if not dates:
             return 0
         
@@ -72,6 +195,105 @@ class Analytics:
         
         return streak
     
+    @memoized("data_manager", "time_tracker")
+    def dashboard_snapshot(self):
+        """Compute every dashboard metric in a single pass over sessions and subjects"""
+        today = datetime.date.today()
+        today_str = today.isoformat()
+        week_start_str = (today - datetime.timedelta(days=today.weekday())).isoformat()
+        
+        today_time = today_questions = today_sessions = 0
+        week_time = week_questions = week_sessions = 0
+        by_subject = {}
+        dates = set(self.data_manager.daily_questions)
+        
+        for session in self.time_tracker.sessions.values():
+            start_time = session.get("start_time", "")
+            if not start_time:
+                continue
+            date_str = start_time[:10]
+            dates.add(date_str)
+            
+            if date_str == today_str:
+                today_sessions += 1
+            
+            if date_str >= week_start_str:
+                week_sessions += 1
+                subject = session.get("subject", "Unknown")
+                if subject not in by_subject:
+                    by_subject[subject] = {
+                        "time": 0,
+                        "questions": 0,
+                        "sessions": 0
+                    }
+                by_subject[subject]["sessions"] += 1
+        
+        # Minutes come from the date buckets (split at midnight) and questions from the
+        # question log, so questions entered outside sessions count too
+        for day in range(today.weekday() + 1):
+            date_str = (today - datetime.timedelta(days=day)).isoformat()
+            day_minutes = self.time_tracker.get_daily_minutes_by_subject(date_str)
+            day_questions = self.data_manager.daily_questions.get(date_str, {})
+            for subject in set(day_minutes) | set(day_questions):
+                if subject not in by_subject:
+                    by_subject[subject] = {
+                        "time": 0,
+                        "questions": 0,
+                        "sessions": 0
+                    }
+                minutes = day_minutes.get(subject, 0)
+                questions = day_questions.get(subject, 0)
+                by_subject[subject]["time"] += minutes
+                by_subject[subject]["questions"] += questions
+                week_time += minutes
+                week_questions += questions
+                if date_str == today_str:
+                    today_time += minutes
+                    today_questions += questions
+        
+        total_solved = total_target = total_topics = completed_topics = 0
+        for subject in self.data_manager.data.values():
+            total_solved += subject.get('cozulen_soru', 0)
+            total_target += subject.get('hedef_soru', 1)
+            topics = subject.get('konular', [])
+            total_topics += len(topics)
+            completed_topics += sum(1 for t in topics if t.get('durum') == 'Tamamlandı')
+        
+        statistics = {
+            "total_solved": total_solved,
+            "total_target": total_target,
+            "progress": (total_solved / total_target * 100) if total_target > 0 else 0,
+            "total_topics": total_topics,
+            "completed_topics": completed_topics,
+            "remaining": max(0, total_target - total_solved)
+        }
+        
+        return DashboardSnapshot(
+            today_time_minutes=today_time,
+            today_questions=today_questions,
+            today_sessions=today_sessions,
+            week_time_minutes=week_time,
+            week_questions=week_questions,
+            week_sessions=week_sessions,
+            week_by_subject=MappingProxyType({k: MappingProxyType(v) for k, v in by_subject.items()}),
+            streak=self._streak_from_dates(dates),
+            productivity=self._score(week_time, statistics),
+            statistics=MappingProxyType(statistics)
+        )
+    
+    def get_completion_forecasts(self):
+        """Get completion forecasts for all subjects and the overall target"""
+        return self.forecaster.get_forecasts()
+    
+    def get_completion_forecast(self, subject_name):
+        """Get the completion forecast for a subject"""
+        return self.forecaster.get_forecast(subject_name)
+    
+    def get_subject_correlations(self, method="pearson"):
+        """Get cross-subject effort/outcome correlations ("pearson" or "spearman")"""
+        return self.correlation.get_correlations(method)
+    
+    @memoized("data_manager", "time_tracker")
     def get_weekly_trend(self):
         """Get weekly study trend"""
         today = datetime.date.today()
@@ -92,7 +314,10 @@ class Analytics:
                         continue
             
             total_time = sum(s.get("duration_minutes", 0) for s in week_sessions)
-            total_questions = sum(s.get("questions_solved", 0) for s in week_sessions)
+            total_questions = sum(
+                self.data_manager.get_questions_on((week_start + datetime.timedelta(days=d)).isoformat())
+                for d in range(7)
+            )
             
             weeks.append({
                 "week": f"Week {4-i}",
@@ -105,80 +330,57 @@ class Analytics:
         
         return list(reversed(weeks))
     
+    def _performance_jobs(self, subject_names, days=30):
+        """Partition sessions by subject in one pass and build a metrics job per subject"""
+        wanted = set(subject_names)
+        cutoff = (datetime.date.today() - datetime.timedelta(days=days)).isoformat()
+        recent_durations = {name: [] for name in subject_names}
+        for session in self.time_tracker.sessions.values():
+            subject = session.get("subject")
+            if subject in wanted and session.get("start_time", "")[:10] >= cutoff:
+                recent_durations[subject].append(session.get("duration_minutes", 0))
+        
+        today = datetime.date.today()
+        jobs = {}
+        for name in subject_names:
+            subject_data = self.data_manager.data.get(name, {})
+            jobs[name] = (
+                subject_data.get('cozulen_soru', 0),
+                subject_data.get('hedef_soru', 1),
+                [t.get('durum') for t in subject_data.get('konular', [])],
+                recent_durations[name],
+                sorted(self.time_tracker.get_study_days(name)),
+                # Session length and pace distribution (all-time, from streaming sketches)
+                self.time_tracker.get_session_distribution(name),
+                today
+            )
+        return jobs
+    
+    @memoized("data_manager", "time_tracker")
     def get_subject_performance(self, subject_name):
         """Get performance metrics for a subject"""
-        subject_data = self.data_manager.data.get(subject_name, {})
-        subject_stats = self.time_tracker.get_subject_stats(subject_name, days=30)
-        
-        solved = subject_data.get('cozulen_soru', 0)
-        target = subject_data.get('hedef_soru', 1)
-        progress = (solved / target * 100) if target > 0 else 0
-        
-        # Calculate efficiency (questions per hour)
-        total_hours = subject_stats["total_time_minutes"] / 60
-        efficiency = solved / total_hours if total_hours > 0 else 0
-        
-        # Calculate completion rate
-        topics = subject_data.get('konular', [])
-        completed_topics = len([t for t in topics if t.get('durum') == 'Tamamlandı'])
-        completion_rate = (completed_topics / len(topics) * 100) if topics else 0
-        
-        return {
-            "progress_percentage": progress,
-            "efficiency": round(efficiency, 2),  # questions per hour
-            "completion_rate": completion_rate,
-            "total_time_hours": round(total_hours, 2),
-            "average_session_time": round(subject_stats.get("average_time_per_session", 0), 2),
-            "consistency_score": self._calculate_consistency(subject_stats.get("daily_stats", {}))
-        }
+        return _compute_subject_performance(self._performance_jobs([subject_name])[subject_name])
     
-    def _calculate_consistency(self, daily_stats):
-        """Calculate consistency score based on daily study patterns"""
-        if not daily_stats:
-            return 0
-        
-        # Count days with study
-        study_days = len([d for d in daily_stats.values() if d.get("time", 0) > 0])
-        total_days = len(daily_stats)
+    @memoized("data_manager", "time_tracker")
+    def get_all_subject_performance(self):
+        """Get performance metrics for every subject.
         
-        consistency = (study_days / total_days * 100) if total_days > 0 else 0
-        return round(consistency, 1)
+        Sessions are partitioned by subject in a single pass and the per-subject
+        metrics are computed serially; they are a few sums each, so the batch stays
+        far cheaper than handing it to worker processes would be.
+        """
+        jobs = self._performance_jobs(list(self.data_manager.data))
+        return {name: _compute_subject_performance(job) for name, job in jobs.items()}
+    
+    @memoized("time_tracker")
+    def get_time_histograms(self, subject_name=None):
+        """Get hour-of-day and weekday histograms of study minutes and questions"""
+        return self.time_tracker.get_time_histograms(subject_name)
     
     def get_recommendations(self):
-        """Get study recommendations"""
-        recommendations = []
-        stats = self.data_manager.get_statistics()
-        week_stats = self.time_tracker.get_week_stats()
-        
-        # Check for low activity
-        if week_stats["total_time_minutes"] < 300:  # Less than 5 hours
-            recommendations.append({
-                "type": "warning",
-                "message": "Bu hafta çalışma süreniz düşük. Daha fazla zaman ayırmayı düşünün.",
-                "priority": "high"
-            })
+        """Get study recommendations, most important first.
         
-        # Check for incomplete goals
-        upcoming_goals = self.goal_tracker.get_upcoming_goals(days=7)
-        if upcoming_goals:
-            recommendations.append({
-                "type": "info",
-                "message": f"{len(upcoming_goals)} hedefiniz yaklaşıyor. Hızlandırın!",
-                "priority": "medium"
-            })
-        
-        # Check for low progress subjects
-        for subject_name, subject_data in self.data_manager.data.items():
-            solved = subject_data.get('cozulen_soru', 0)
-            target = subject_data.get('hedef_soru', 1)
-            progress = (solved / target * 100) if target > 0 else 0
-            
-            if progress < 20 and target > 0:
-                recommendations.append({
-                    "type": "suggestion",
-                    "message": f"{subject_name} dersinde ilerleme düşük. Daha fazla çalışma yapın.",
-                    "priority": "low",
-                    "subject": subject_name
-                })
-        
-        return recommendations
+        Each recommendation carries a `message_key` and `params` to be translated
+        with `RecommendationEngine.format` when displayed.
+        """
+        return self.recommender.evaluate()
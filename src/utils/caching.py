@@ -0,0 +1,15 @@
+"""
+Caching Module
+Helpers shared by the version-keyed result caches
+"""
+
+def detached(value):
+    """Copy the dicts and lists of a cached result so callers can't mutate the cache.
+    
+    Immutable parts (tuples, MappingProxyType views, scalars) are shared as they are.
+    """
+    if isinstance(value, dict):
+        return {key: detached(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [detached(item) for item in value]
+    return value
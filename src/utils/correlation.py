@@ -0,0 +1,145 @@
+"""
+Correlation Module
+Cross-subject correlation of daily study effort, questions and topic completions
+"""
+
+import datetime
+import numpy as np
+from ..config.constants import CORRELATION_SETTINGS
+from .caching import detached
+
+class SubjectCorrelation:
+    """Correlates what was studied on a day with what got done that day"""
+    
+    METHODS = ("pearson", "spearman")
+    
+    def __init__(self, data_manager, time_tracker):
+        self.data_manager = data_manager
+        self.time_tracker = time_tracker
+        self.window_days = CORRELATION_SETTINGS.get("window_days", 90)
+        self.min_active_days = CORRELATION_SETTINGS.get("min_active_days", 5)
+        
+        # The day x subject matrices are shared by both methods
+        self._matrices = (None, None)  # (version key, matrices)
+        self._results = {}  # method -> (version key, result)
+    
+    def _version_key(self):
+        """Cache key that changes whenever sessions or subject data change"""
+        return (self.data_manager.version, self.time_tracker.version, datetime.date.today())
+    
+    def _build_matrices(self):
+        """Build (active days x subjects) matrices of minutes, questions and completed topics.
+        
+        Days without any activity are dropped, otherwise the shared idle days would
+        make every pair of subjects look positively correlated.
+        """
+        today = datetime.date.today()
+        days = [(today - datetime.timedelta(days=i)).isoformat() for i in range(self.window_days - 1, -1, -1)]
+        day_index = {day: i for i, day in enumerate(days)}
+        names = list(self.data_manager.data)
+        index = {name: i for i, name in enumerate(names)}
+        
+        minutes = np.zeros((len(days), len(names)))
+        questions = np.zeros((len(days), len(names)))
+        completions = np.zeros((len(days), len(names)))
+        
+        for row, day in enumerate(days):
+            for subject_name, subject_minutes in self.time_tracker.get_daily_minutes_by_subject(day).items():
+                col = index.get(subject_name)
+                if col is not None:
+                    minutes[row, col] += subject_minutes
+            for subject_name, count in self.data_manager.daily_questions.get(day, {}).items():
+                col = index.get(subject_name)
+                if col is not None:
+                    questions[row, col] += count
+        
+        for name, data in self.data_manager.data.items():
+            for topic in data.get('konular', []):
+                if topic.get('durum') != 'Tamamlandı':
+                    continue
+                row = day_index.get(topic.get('bitirme_tarihi', '-'))
+                if row is not None:
+                    completions[row, index[name]] += 1
+        
+        active = (minutes.sum(axis=1) + questions.sum(axis=1) + completions.sum(axis=1)) > 0
+        return names, minutes[active], questions[active], completions[active]
+    
+    def _get_matrices(self):
+        """Get the day x subject matrices, rebuilding them only when the data changed"""
+        key = self._version_key()
+        if self._matrices[0] != key:
+            self._matrices = (key, self._build_matrices())
+        return self._matrices[1]
+    
+    @staticmethod
+    def _rank(matrix):
+        """Rank every column, giving ties their average rank"""
+        ranks = np.empty(matrix.shape)
+        for j in range(matrix.shape[1]):
+            _, inverse, counts = np.unique(matrix[:, j], return_inverse=True, return_counts=True)
+            ends = np.cumsum(counts)
+            ranks[:, j] = (ends - (counts - 1) / 2)[inverse]
+        return ranks
+    
+    @staticmethod
+    def _correlate(x, y):
+        """Pearson correlation of every column of x with every column of y.
+        
+        Pairs involving a constant column come out as NaN.
+        """
+        x_centered = x - x.mean(axis=0)
+        y_centered = y - y.mean(axis=0)
+        x_norm = np.sqrt((x_centered * x_centered).sum(axis=0))
+        y_norm = np.sqrt((y_centered * y_centered).sum(axis=0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (x_centered.T @ y_centered) / np.outer(x_norm, y_norm)
+    
+    @staticmethod
+    def _to_list(values):
+        """Round correlations for display, mapping NaN to None"""
+        return [None if np.isnan(v) else round(float(v), 2) for v in values]
+    
+    def get_correlations(self, method="pearson"):
+        """Get the correlation matrices for the given method ("pearson" or "spearman").
+        
+        "effort_vs_questions"[i][j] correlates minutes studied on subject i with
+        questions solved in subject j on the same day; negative off-diagonal values
+        hint at interference. "effort_vs_completions" correlates each subject's
+        minutes with its own topic completions. The result is a copy of the cached one.
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown correlation method: {method}")
+        
+        key = self._version_key()
+        cached = self._results.get(method)
+        if cached and cached[0] == key:
+            return detached(cached[1])
+        
+        names, minutes, questions, completions = self._get_matrices()
+        active_days = minutes.shape[0]
+        
+        if active_days < self.min_active_days or not names:
+            result = {
+                "method": method,
+                "subjects": names,
+                "days": active_days,
+                "effort_vs_questions": [[None] * len(names) for _ in names],
+                "effort_vs_completions": {name: None for name in names}
+            }
+        else:
+            if method == "spearman":
+                minutes, questions, completions = (
+                    self._rank(minutes), self._rank(questions), self._rank(completions)
+                )
+            effort_vs_questions = self._correlate(minutes, questions)
+            effort_vs_completions = self._to_list(np.diag(self._correlate(minutes, completions)))
+            result = {
+                "method": method,
+                "subjects": names,
+                "days": active_days,
+                "effort_vs_questions": [self._to_list(row) for row in effort_vs_questions],
+                "effort_vs_completions": dict(zip(names, effort_vs_completions))
+            }
+        
+        self._results[method] = (key, result)
+        return detached(result)
@@ -6,15 +6,28 @@ import json
 import os
 import datetime
 from ..config.constants import get_data_file, DEFAULT_SUBJECTS
+from .events import EventBus
 
 class DataManager:
     """Manages study data operations"""
     
-    def __init__(self, data_file=None):
+    def __init__(self, data_file=None, events=None):
         # Always get fresh path in case we're running from EXE
         self.data_file = data_file or get_data_file()
+        # Version counters - bumped by every mutator so callers can cache derived results
+        self.version = 0
+        self.subject_versions = {}
+        # Change events for the UI; may be shared with the other managers
+        self.events = events or EventBus()
         self.data = self.load_data()
         self._ensure_data_integrity()
+        
+        # Append-only log of (day, subject, count) question events, kept next to the data file,
+        # with daily per-subject rollups: day -> {subject: count}
+        self.question_log_file = os.path.join(os.path.dirname(self.data_file), "question_log.jsonl")
+        self.daily_questions = {}
+        self._daily_question_totals = {}
+        self._load_question_log()
     
     def load_data(self):
         """Load data from file"""
@@ -40,6 +53,79 @@ class DataManager:
             print(f"Data save error: {e}")
             return False
     
+    def _load_question_log(self):
+        """Replay the question event log into the daily rollups"""
+        if not os.path.exists(self.question_log_file):
+            return
+        try:
+            with open(self.question_log_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        day, subject_name, count = json.loads(line)
+                    except (ValueError, TypeError):
+                        continue  # Skip a torn or malformed line
+                    self._roll_up_questions(day, subject_name, count)
+        except Exception as e:
+            print(f"Question log load error: {e}")
+    
+    def _roll_up_questions(self, day, subject_name, count):
+        """Add a question event to the daily rollups"""
+        by_subject = self.daily_questions.setdefault(day, {})
+        by_subject[subject_name] = by_subject.get(subject_name, 0) + count
+        self._daily_question_totals[day] = self._daily_question_totals.get(day, 0) + count
+    
+    def _log_questions(self, events):
+        """Append (day, subject, count) events to the log and roll them up"""
+        try:
+            os.makedirs(os.path.dirname(self.question_log_file), exist_ok=True)
+            with open(self.question_log_file, 'a', encoding='utf-8') as f:
+                for event in events:
+                    f.write(json.dumps(list(event), ensure_ascii=False) + "\n")
+        except Exception as e:
+            print(f"Question log save error: {e}")
+        for day, subject_name, count in events:
+            self._roll_up_questions(day, subject_name, count)
+    
+    def backfill_question_log(self, sessions):
+        """Seed a missing question log from study sessions' solved counts"""
+        if os.path.exists(self.question_log_file):
+            return False
+        events = [
+            (session["start_time"][:10], session.get("subject", "Unknown"), session["questions_solved"])
+            for session in sessions.values()
+            if session.get("questions_solved", 0) > 0 and session.get("start_time")
+        ]
+        self._log_questions(sorted(events))
+        self._bump_version()
+        self.events.emit("questions_added")
+        return True
+    
+    def get_daily_questions(self, subject_name=None):
+        """Get questions solved per day ({ISO date: count}), overall or for one subject"""
+        if subject_name is None:
+            return dict(self._daily_question_totals)
+        return {
+            day: by_subject[subject_name]
+            for day, by_subject in self.daily_questions.items()
+            if subject_name in by_subject
+        }
+    
+    def get_questions_on(self, day, subject_name=None):
+        """Get questions solved on an ISO date, overall or for one subject"""
+        if subject_name is None:
+            return self._daily_question_totals.get(day, 0)
+        return self.daily_questions.get(day, {}).get(subject_name, 0)
+    
+    def _bump_version(self, *subject_names):
+        """Mark data as changed, optionally for specific subjects"""
+        self.version += 1
+        for subject_name in subject_names:
+            self.subject_versions[subject_name] = self.version
+    
+    def get_subject_version(self, subject_name):
+        """Get the data version of the last change to a subject"""
+        return self.subject_versions.get(subject_name, 0)
+    
     def _create_default_data(self):
         """Create default data structure"""
         default_data = DEFAULT_SUBJECTS.copy()
@@ -108,6 +194,8 @@ class DataManager:
                 self.data[subject_name]['tags'] = []
             if tag not in self.data[subject_name]['tags']:
                 self.data[subject_name]['tags'].append(tag)
+                self._bump_version(subject_name)
+                self.events.emit("subject_updated", subject_name)
                 self.save_data()
                 return True
         return False
@@ -117,6 +205,8 @@ class DataManager:
         if subject_name in self.data and 'tags' in self.data[subject_name]:
             if tag in self.data[subject_name]['tags']:
                 self.data[subject_name]['tags'].remove(tag)
+                self._bump_version(subject_name)
+                self.events.emit("subject_updated", subject_name)
                 self.save_data()
                 return True
         return False
@@ -191,6 +281,8 @@ class DataManager:
             "created_date": datetime.date.today().isoformat(),
             "tags": []
         }
+        self._bump_version(subject_name)
+        self.events.emit("subject_added", subject_name)
         self.save_data()
         return True, "success"
     
@@ -198,6 +290,8 @@ class DataManager:
         """Delete a subject"""
         if subject_name in self.data:
             del self.data[subject_name]
+            self._bump_version(subject_name)
+            self.events.emit("subject_deleted", subject_name)
             self.save_data()
             return True
         return False
@@ -245,6 +339,10 @@ class DataManager:
                 subject_data['tags'] = []
             
             self.data[new_name] = subject_data
+            self._bump_version(old_name, new_name)
+            if old_name != new_name:
+                self.events.emit("subject_renamed", old_name, new_name)
+            self.events.emit("subject_updated", new_name)
             self.save_data()
             return True, None
         return False, "not_found"
@@ -254,14 +352,41 @@ class DataManager:
         if subject_name in self.data:
             self.data[subject_name]['cozulen_soru'] += count
             self.data[subject_name]['son_calisma_tarihi'] = datetime.date.today().strftime("%Y-%m-%d")
+            self._log_questions([(datetime.date.today().isoformat(), subject_name, count)])
+            self._bump_version(subject_name)
+            self.events.emit("questions_added", subject_name)
             self.save_data()
             return True
         return False
     
+    def add_question_events(self, events):
+        """Log a batch of (day, subject, count) events, e.g. from imported sessions.
+    
+        Counts are added to the matching subjects and everything is saved once.
+        """
+        events = [event for event in events if event[2] > 0]
+        if not events:
+            return False
+        self._log_questions(events)
+        changed = set()
+        for day, subject_name, count in events:
+            if subject_name in self.data:
+                self.data[subject_name]['cozulen_soru'] += count
+                if day > self.data[subject_name].get('son_calisma_tarihi', ''):
+                    self.data[subject_name]['son_calisma_tarihi'] = day
+                changed.add(subject_name)
+        self._bump_version(*changed)
+        for subject_name in changed:
+            self.events.emit("questions_added", subject_name)
+        self.save_data()
+        return True
+    
     def set_target(self, subject_name, target):
         """Set target questions for a subject"""
         if subject_name in self.data:
             self.data[subject_name]['hedef_soru'] = target
+            self._bump_version(subject_name)
+            self.events.emit("target_changed", subject_name)
             self.save_data()
             return True
         return False
@@ -287,6 +412,8 @@ class DataManager:
             "bitirme_tarihi": "-"
         }
         self.data[subject_name]['konular'].append(new_topic)
+        self._bump_version(subject_name)
+        self.events.emit("topic_added", subject_name, topic_name)
         self.save_data()
         return True
     
@@ -312,6 +439,8 @@ class DataManager:
                     topic['baslangic_tarihi'] = "-"
                     topic['bitirme_tarihi'] = "-"
                 
+                self._bump_version(subject_name)
+                self.events.emit("topic_status_changed", subject_name, topic_name)
                 self.save_data()
                 return True
         return False
@@ -328,6 +457,8 @@ class DataManager:
         ]
         
         if len(self.data[subject_name]['konular']) < initial_count:
+            self._bump_version(subject_name)
+            self.events.emit("topic_deleted", subject_name, topic_name)
             self.save_data()
             return True
         return False
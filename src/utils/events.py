@@ -0,0 +1,77 @@
+"""
+Events Module
+Typed change events published by the data managers
+"""
+
+from collections import namedtuple
+
+# Event types and who emits them; `subject` is the subject name and `item` the
+# topic, session, note or goal the change is about (None when not applicable)
+EVENT_TYPES = (
+    # DataManager
+    "subject_added", "subject_updated", "subject_renamed", "subject_deleted",
+    "questions_added", "target_changed",
+    "topic_added", "topic_status_changed", "topic_deleted",
+    # TimeTracker
+    "session_started", "session_paused", "session_resumed", "session_ended", "sessions_imported",
+    # NotesManager
+    "note_added", "note_deleted", "last_position_changed",
+    # GoalTracker
+    "goal_added", "goal_updated",
+)
+
+ChangeEvent = namedtuple("ChangeEvent", ["type", "subject", "item"])
+
+class EventBus:
+    """Publish/subscribe hub for ChangeEvents.
+    
+    Emitted events are queued until the next flush, and repeats of the same
+    (type, subject, item) collapse into one. A scheduler such as Tk's after_idle
+    decides when the flush runs, so a burst of changes reaches each subscriber as a
+    single batch per idle cycle. Without a scheduler every event is delivered as it
+    is emitted.
+    """
+    
+    def __init__(self, scheduler=None):
+        self.scheduler = scheduler  # scheduler(callback), e.g. widget.after_idle
+        self._subscribers = []  # (event types or None for all, callback)
+        self._pending = {}  # (type, subject, item) -> ChangeEvent, in emit order
+        self._flush_scheduled = False
+    
+    def subscribe(self, callback, types=None):
+        """Call `callback(events)` with each batch of events of the given types"""
+        self._subscribers.append((set(types) if types else None, callback))
+        return callback
+    
+    def unsubscribe(self, callback):
+        """Stop delivering events to a callback"""
+        self._subscribers = [(types, cb) for types, cb in self._subscribers if cb != callback]
+    
+    def emit(self, event_type, subject=None, item=None):
+        """Queue a change event and make sure a flush is scheduled"""
+        event = ChangeEvent(event_type, subject, item)
+        self._pending[event] = event
+        if self.scheduler is None:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            try:
+                self.scheduler(self.flush)
+            except:
+                # Scheduler gone (window closed) - deliver right away instead
+                self.flush()
+    
+    def flush(self):
+        """Deliver the queued events to their subscribers"""
+        self._flush_scheduled = False
+        events = list(self._pending.values())
+        self._pending = {}
+        if not events:
+            return
+        for types, callback in list(self._subscribers):
+            batch = events if types is None else [event for event in events if event.type in types]
+            if batch:
+                try:
+                    callback(batch)
+                except Exception as e:
+                    print(f"Event handler error: {e}")
@@ -26,11 +26,12 @@ except ImportError:
 class ExportManager:
     """Manages data export in various formats"""
     
-    def __init__(self, data_manager, time_tracker, notes_manager, goal_tracker):
+    def __init__(self, data_manager, time_tracker, notes_manager, goal_tracker, analytics=None):
         self.data_manager = data_manager
         self.time_tracker = time_tracker
         self.notes_manager = notes_manager
         self.goal_tracker = goal_tracker
+        self.analytics = analytics
     
     def export_to_json(self, file_path):
         """Export all data to JSON"""
@@ -39,6 +40,8 @@ class ExportManager:
             "study_sessions": self.time_tracker.sessions,
             "notes": self.notes_manager.notes,
             "goals": self.goal_tracker.goals,
+            "forecast": self.analytics.get_completion_forecasts() if self.analytics else {},
+            "productivity_history": self.analytics.get_productivity_history() if self.analytics else [],
             "export_date": datetime.datetime.now().isoformat(),
             "version": "1.0.0"
         }
@@ -101,6 +104,24 @@ class ExportManager:
                 if goals_data:
                     df_goals = pd.DataFrame(goals_data)
                     df_goals.to_excel(writer, sheet_name='Goals', index=False)
+                
+                # Forecast sheet
+                if self.analytics:
+                    forecasts = self.analytics.get_completion_forecasts()
+                    forecast_data = []
+                    for subject, forecast in forecasts["subjects"].items():
+                        forecast_data.append(self._forecast_row(subject, forecast))
+                    forecast_data.append(self._forecast_row("Overall", forecasts["overall"]))
+                    
+                    df_forecast = pd.DataFrame(forecast_data)
+                    df_forecast.to_excel(writer, sheet_name='Forecast', index=False)
+                    
+                    # Productivity sheet
+                    df_productivity = pd.DataFrame([
+                        {"Date": point["date"], "Productivity Score": point["score"]}
+                        for point in self.analytics.get_productivity_history()
+                    ])
+                    df_productivity.to_excel(writer, sheet_name='Productivity', index=False)
             
             return True, "Export successful"
         except Exception as e:
@@ -179,8 +200,101 @@ class ExportManager:
             ]))
             story.append(subject_table)
             
+            # Subject performance (computed in one batch)
+            if self.analytics:
+                story.append(Spacer(1, 0.3*inch))
+                story.append(Paragraph("Subject Performance", styles['Heading2']))
+                performance_data = [['Subject', 'Time (h, 30d)', 'Efficiency (q/h)', 'Consistency %', 'Median Session (min)']]
+                for subject, performance in self.analytics.get_all_subject_performance().items():
+                    performance_data.append([
+                        subject,
+                        f"{performance['total_time_hours']}",
+                        f"{performance['efficiency']}",
+                        f"{performance['consistency_score']}",
+                        f"{performance['median_session_time']}"
+                    ])
+                
+                performance_table = Table(performance_data)
+                performance_table.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTSIZE', (0, 0), (-1, 0), 10),
+                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ]))
+                story.append(performance_table)
+            
+            # Completion forecast
+            if self.analytics:
+                story.append(Spacer(1, 0.3*inch))
+                story.append(Paragraph("Completion Forecast", styles['Heading2']))
+                forecasts = self.analytics.get_completion_forecasts()
+                forecast_data = [['Subject', 'Rate/day', 'ETA', 'Range', 'Deadline']]
+                rows = list(forecasts["subjects"].items()) + [("Overall", forecasts["overall"])]
+                for subject, forecast in rows:
+                    deadline = forecast.get('deadline') or '-'
+                    if forecast.get('will_miss_deadline'):
+                        deadline = f"{deadline} (at risk)"
+                    forecast_data.append([
+                        subject,
+                        f"{forecast['daily_rate']}",
+                        forecast['eta'] or '-',
+                        f"{forecast['eta_early'] or '-'} / {forecast['eta_late'] or '-'}",
+                        deadline
+                    ])
+                
+                forecast_table = Table(forecast_data)
+                forecast_table.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTSIZE', (0, 0), (-1, 0), 10),
+                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ]))
+                story.append(forecast_table)
+                
+                # Productivity, last two weeks
+                story.append(Spacer(1, 0.3*inch))
+                story.append(Paragraph("Productivity Score (last 14 days)", styles['Heading2']))
+                productivity_data = [['Date', 'Score']]
+                for point in self.analytics.get_productivity_history()[-14:]:
+                    productivity_data.append([point["date"], f"{point['score']}"])
+                
+                productivity_table = Table(productivity_data)
+                productivity_table.setStyle(TableStyle([
+                    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                    ('FONTSIZE', (0, 0), (-1, 0), 10),
+                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+                    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+                ]))
+                story.append(productivity_table)
+            
             doc.build(story)
             return True, "PDF export successful"
         except Exception as e:
             return False, str(e)
+    
+    def _forecast_row(self, subject, forecast):
+        """Flatten a forecast into an export row"""
+        return {
+            "Subject": subject,
+            "Solved": forecast.get('solved', 0),
+            "Target": forecast.get('target', 0),
+            "Daily Rate": forecast.get('daily_rate', 0),
+            "ETA": forecast.get('eta') or '',
+            "ETA (early)": forecast.get('eta_early') or '',
+            "ETA (late)": forecast.get('eta_late') or '',
+            "Deadline": forecast.get('deadline') or '',
+            "Misses Deadline": forecast.get('will_miss_deadline', False)
+        }
 
@@ -0,0 +1,170 @@
+"""
+Forecasting Module
+Forecasts completion dates for question targets from recent daily history
+"""
+
+import datetime
+import math
+import numpy as np
+from ..config.constants import FORECAST_SETTINGS
+from .caching import detached
+
+class CompletionForecaster:
+    """Forecasts when each subject (and the overall target) will be completed"""
+    
+    def __init__(self, data_manager, time_tracker):
+        self.data_manager = data_manager
+        self.time_tracker = time_tracker
+        self.window_days = FORECAST_SETTINGS.get("window_days", 28)
+        self.confidence_z = FORECAST_SETTINGS.get("confidence_z", 1.96)
+        self.min_fit_days = FORECAST_SETTINGS.get("min_fit_days", 7)
+        
+        # Per-subject cache: subject -> (version key, forecast)
+        self._cache = {}
+        self._overall = (None, None)
+    
+    def _subject_key(self, subject_name, today):
+        """Cache key that changes whenever the subject's questions or sessions change"""
+        return (
+            self.data_manager.get_subject_version(subject_name),
+            self.time_tracker.get_subject_version(subject_name),
+            today
+        )
+    
+    def _daily_history(self, subject_names, days):
+        """Build a (subjects x days) matrix of questions solved per day from the question log"""
+        index = {name: i for i, name in enumerate(subject_names)}
+        history = np.zeros((len(subject_names), len(days)))
+        
+        for col, day in enumerate(days):
+            for subject_name, count in self.data_manager.daily_questions.get(day.isoformat(), {}).items():
+                row = index.get(subject_name)
+                if row is not None:
+                    history[row, col] += count
+        
+        return history
+    
+    def _fit_rates(self, history):
+        """Least-squares fit of cumulative solved questions over time, one row per series.
+        
+        Each row is fitted from its first active day in the window (but over at least
+        `min_fit_days` days), so a subject picked up recently isn't diluted by idle days.
+        Returns the fitted daily rate (slope) and its standard error for every row.
+        """
+        n = history.shape[1]
+        cumulative = np.cumsum(history, axis=1)
+        t = np.arange(n, dtype=float)
+        
+        first_active = np.where(history.any(axis=1), np.argmax(history > 0, axis=1), 0)
+        first_active = np.minimum(first_active, max(n - self.min_fit_days, 0))
+        weights = (t >= first_active[:, None]).astype(float)
+        
+        count = weights.sum(axis=1)
+        t_mean = (weights * t).sum(axis=1) / count
+        y_mean = (weights * cumulative).sum(axis=1) / count
+        t_centered = weights * (t - t_mean[:, None])
+        sxx = np.maximum((t_centered * t_centered).sum(axis=1), 1e-9)
+        slope = (t_centered * (cumulative - y_mean[:, None])).sum(axis=1) / sxx
+        
+        residuals = weights * (cumulative - y_mean[:, None] - slope[:, None] * (t - t_mean[:, None]))
+        ssr = np.einsum("ij,ij->i", residuals, residuals)
+        std_error = np.sqrt(ssr / np.maximum(count - 2, 1) / sxx)
+        
+        return slope, std_error
+    
+    def _build_forecast(self, solved, target, rate, std_error, deadline, today):
+        """Turn a fitted rate into ETA dates with a confidence band"""
+        remaining = max(target - solved, 0)
+        rate = float(rate)
+        std_error = float(std_error)
+        rate_low = max(rate - self.confidence_z * std_error, 0.0)
+        rate_high = max(rate + self.confidence_z * std_error, 0.0)
+        
+        def eta_for(daily_rate):
+            if remaining == 0:
+                return today.isoformat()
+            if daily_rate <= 0:
+                return None
+            days = remaining / daily_rate
+            # A rate this close to zero puts the ETA past the last representable date
+            if not math.isfinite(days) or days > (datetime.date.max - today).days:
+                return None
+            return (today + datetime.timedelta(days=math.ceil(days))).isoformat()
+        
+        eta = eta_for(rate)
+        will_miss_deadline = False
+        if deadline and remaining > 0:
+            try:
+                datetime.date.fromisoformat(deadline)
+                will_miss_deadline = eta is None or eta > deadline
+            except ValueError:
+                pass
+        
+        return {
+            "solved": solved,
+            "target": target,
+            "remaining": remaining,
+            "completed": remaining == 0,
+            "daily_rate": round(max(rate, 0.0), 2),
+            "rate_low": round(rate_low, 2),
+            "rate_high": round(rate_high, 2),
+            "eta": eta,
+            "eta_early": eta_for(rate_high),
+            "eta_late": eta_for(rate_low),
+            "deadline": deadline,
+            "will_miss_deadline": will_miss_deadline
+        }
+    
+    def get_forecasts(self):
+        """Get forecasts for every subject plus the overall target.
+        
+        Only subjects whose data changed since the last call are refitted. Callers get
+        copies, so changing a returned forecast never changes the cache.
+        """
+        today = datetime.date.today()
+        subjects = self.data_manager.data
+        
+        # Drop forecasts for removed subjects
+        for name in list(self._cache):
+            if name not in subjects:
+                del self._cache[name]
+        
+        stale = [
+            name for name in subjects
+            if name not in self._cache or self._cache[name][0] != self._subject_key(name, today)
+        ]
+        overall_key = (self.data_manager.version, self.time_tracker.version, today)
+        
+        if stale or self._overall[0] != overall_key:
+            days = [today - datetime.timedelta(days=i) for i in range(self.window_days - 1, -1, -1)]
+            names = list(subjects)
+            rows = {name: i for i, name in enumerate(names)}
+            history = self._daily_history(names, days)
+            
+            # Fit the stale subjects and the overall series in one vectorized pass
+            stale_rows = [rows[name] for name in stale]
+            series = np.vstack([history[stale_rows], history.sum(axis=0, keepdims=True)])
+            rates, errors = self._fit_rates(series)
+            
+            for i, name in enumerate(stale):
+                data = subjects[name]
+                forecast = self._build_forecast(
+                    data.get('cozulen_soru', 0), data.get('hedef_soru', 0),
+                    rates[i], errors[i], data.get('deadline', ''), today
+                )
+                self._cache[name] = (self._subject_key(name, today), forecast)
+            
+            stats = self.data_manager.get_statistics()
+            overall = self._build_forecast(
+                stats["total_solved"], stats["total_target"], rates[-1], errors[-1], "", today
+            )
+            self._overall = (overall_key, overall)
+        
+        return detached({
+            "subjects": {name: self._cache[name][1] for name in subjects},
+            "overall": self._overall[1]
+        })
+    
+    def get_forecast(self, subject_name):
+        """Get the forecast for a single subject"""
+        return self.get_forecasts()["subjects"].get(subject_name)
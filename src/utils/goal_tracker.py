@@ -7,14 +7,25 @@ import json
 import os
 import datetime
 from ..config.constants import get_data_dir
+from .ids import new_id, deduplicate_ids
+from .events import EventBus
 
 class GoalTracker:
     """Tracks study goals and milestones"""
     
-    def __init__(self):
+    def __init__(self, events=None):
         # Always get fresh path in case we're running from EXE
         self.goals_file = os.path.join(get_data_dir(), "goals.json")
+        # Version counter - bumped by every mutator so callers can cache derived results
+        self.version = 0
+        # Change events for the UI; may be shared with the other managers
+        self.events = events or EventBus()
         self.goals = self.load_goals()
+        
+        # Goals created within the same second used to share an ID
+        seen = set()
+        if sum(deduplicate_ids(subject_goals, seen) for subject_goals in self.goals.values()):
+            self.save_goals()
     
     def load_goals(self):
         """Load goals"""
@@ -36,9 +47,13 @@ class GoalTracker:
         except:
             return False
     
+    def _bump_version(self):
+        """Mark goals as changed"""
+        self.version += 1
+    
     def add_goal(self, subject_name, goal_type, target_value, target_date=None, description=""):
         """Add a new goal"""
-        goal_id = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+        goal_id = new_id()
         
         goal = {
             "id": goal_id,
@@ -57,6 +72,8 @@ class GoalTracker:
             self.goals[subject_name] = []
         
         self.goals[subject_name].append(goal)
+        self._bump_version()
+        self.events.emit("goal_added", subject_name, goal_id)
         self.save_goals()
         return goal
     
@@ -69,6 +86,8 @@ class GoalTracker:
                     if current_value >= goal["target_value"]:
                         goal["completed"] = True
                         goal["completed_date"] = datetime.date.today().isoformat()
+            self._bump_version()
+            self.events.emit("goal_updated", subject_name)
             self.save_goals()
     
     def get_goals(self, subject_name=None, include_completed=False):
@@ -83,7 +102,7 @@ class GoalTracker:
         if not include_completed:
             goals = [g for g in goals if not g.get("completed", False)]
         
-        return sorted(goals, key=lambda x: x.get("target_date", ""))
+        return sorted(goals, key=lambda x: x.get("target_date") or "")
     
     def get_upcoming_goals(self, days=7):
         """Get upcoming goals within specified days"""
@@ -96,5 +115,5 @@ class GoalTracker:
                     if goal["target_date"] <= cutoff_date:
                         upcoming.append(goal)
         
-        return sorted(upcoming, key=lambda x: x.get("target_date", ""))
+        return sorted(upcoming, key=lambda x: x.get("target_date") or "")
 
@@ -0,0 +1,89 @@
+"""
+ID Generator Module
+Collision-free, sortable IDs for sessions, notes and goals
+"""
+
+import os
+import threading
+import time
+
+# Crockford base32 alphabet (no I, L, O, U), as used by ULIDs
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+def _encode(value):
+    """Encode a 128-bit integer as 26 base32 characters"""
+    chars = []
+    for _ in range(26):
+        chars.append(_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+class IdGenerator:
+    """ULID-style generator: 48-bit millisecond timestamp followed by an 80-bit counter.
+    
+    The counter starts at a random value each new millisecond and is incremented for
+    every further ID within it, so IDs never collide and sort in creation order even
+    when thousands are created per second (or the wall clock steps back).
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._counter = 0
+    
+    def _random_counter(self):
+        # Top bit clear leaves room for 2**79 increments within one millisecond
+        return int.from_bytes(os.urandom(10), "big") >> 1
+    
+    def new_id(self):
+        """Create a new unique ID"""
+        with self._lock:
+            ms = time.time_ns() // 1_000_000
+            if ms > self._last_ms:
+                self._counter = self._random_counter()
+            else:
+                # Same millisecond, or the clock went backwards: stay monotonic
+                ms = self._last_ms
+                self._counter += 1
+                if self._counter >> 80:
+                    ms += 1
+                    self._counter = self._random_counter()
+            self._last_ms = ms
+            return _encode((ms << 80) | self._counter)
+
+_generator = IdGenerator()
+
+def new_id():
+    """Create a new unique, sortable ID from the shared generator"""
+    return _generator.new_id()
+
+def deduplicate_ids(records, seen=None):
+    """Give each record whose "id" was already used a fresh ID.
+    
+    `seen` collects the IDs in use and can be shared across several calls.
+    Returns the number of records that were renumbered.
+    """
+    seen = set() if seen is None else seen
+    changed = 0
+    for record in records:
+        if record.get("id") in seen:
+            record["id"] = new_id()
+            changed += 1
+        seen.add(record.get("id"))
+    return changed
+
+def unique_keys_hook(pairs, renamed=None):
+    """json.load object_pairs_hook that keeps records stored under a repeated key.
+    
+    Plain json.load silently keeps only the last of them; here later duplicates get
+    a fresh ID as their key instead (appended to `renamed` if given). Repeated keys
+    with non-record values keep the default last-one-wins behaviour.
+    """
+    result = {}
+    for key, value in pairs:
+        if key in result and isinstance(value, dict) and isinstance(result[key], dict):
+            key = new_id()
+            if renamed is not None:
+                renamed.append(key)
+        result[key] = value
+    return result
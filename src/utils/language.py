@@ -12,24 +12,44 @@ class LanguageManager:
     def __init__(self, language="tr"):
         self.language = language
         self.translations = {}
+        self.catalogs = {}  # language code -> loaded locale file
+        self.preload_catalogs()
         self.load_translations()
     
+    def preload_catalogs(self):
+        """Load every locale file up front so switching language needs no file IO"""
+        if not os.path.isdir(LOCALES_DIR):
+            return
+        for file_name in sorted(os.listdir(LOCALES_DIR)):
+            if file_name.endswith(".json"):
+                catalog = self._read_locale(os.path.join(LOCALES_DIR, file_name))
+                if catalog is not None:
+                    self.catalogs[file_name[:-5]] = catalog
+    
+    def _read_locale(self, locale_file):
+        try:
+            with open(locale_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Translation load error: {e}")
+            return None
+    
     def load_translations(self):
         """Load translations from locale files"""
-        locale_file = os.path.join(LOCALES_DIR, f"{self.language}.json")
+        if self.language in self.catalogs:
+            self.translations = self.catalogs[self.language]
+            return
         
-        if os.path.exists(locale_file):
-            try:
-                with open(locale_file, 'r', encoding='utf-8') as f:
-                    self.translations = json.load(f)
-            except Exception as e:
-                print(f"Translation load error: {e}")
-                self.translations = self._get_default_translations()
+        locale_file = os.path.join(LOCALES_DIR, f"{self.language}.json")
+        catalog = self._read_locale(locale_file) if os.path.exists(locale_file) else None
+        if catalog is not None:
+            self.catalogs[self.language] = catalog
+            self.translations = catalog
         else:
             self.translations = self._get_default_translations()
     
     def set_language(self, language):
-        """Change language"""
+        """Change language (uses the preloaded catalog when there is one)"""
         self.language = language
         self.load_translations()
     
@@ -7,14 +7,30 @@ import json
 import os
 import datetime
 from ..config.constants import get_data_dir
+from .ids import new_id, deduplicate_ids
+from .events import EventBus
 
 class NotesManager:
     """Manages notes and comments"""
     
-    def __init__(self):
+    def __init__(self, events=None):
         # Always get fresh path in case we're running from EXE
         self.notes_file = os.path.join(get_data_dir(), "notes.json")
+        # Version counters - bumped by every mutator so callers can cache derived results
+        self.version = 0
+        self.subject_versions = {}
+        # Change events for the UI; may be shared with the other managers
+        self.events = events or EventBus()
         self.notes = self.load_notes()
+        
+        # Notes created within the same second used to share an ID
+        seen = set()
+        if sum(
+            deduplicate_ids(notes_list, seen)
+            for key, notes_list in self.notes.items()
+            if not key.endswith(":__LAST_POSITION__")
+        ):
+            self.save_notes()
     
     def load_notes(self):
         """Load notes"""
@@ -36,6 +52,16 @@ class NotesManager:
         except:
             return False
     
+    def _bump_version(self, *subject_names):
+        """Mark notes as changed, optionally for specific subjects"""
+        self.version += 1
+        for subject_name in subject_names:
+            self.subject_versions[subject_name] = self.version
+    
+    def get_subject_version(self, subject_name):
+        """Get the notes version of the last change to a subject"""
+        return self.subject_versions.get(subject_name, 0)
+    
     def add_note(self, subject_name, topic_name=None, note_text=""):
         """Add a note to subject or topic"""
         key = f"{subject_name}:{topic_name}" if topic_name else f"{subject_name}:"
@@ -44,7 +70,7 @@ class NotesManager:
             self.notes[key] = []
         
         note = {
-            "id": datetime.datetime.now().strftime("%Y%m%d%H%M%S"),
+            "id": new_id(),
             "text": note_text,
             "date": datetime.datetime.now().isoformat(),
             "subject": subject_name,
@@ -52,6 +78,8 @@ class NotesManager:
         }
         
         self.notes[key].append(note)
+        self._bump_version(subject_name)
+        self.events.emit("note_added", subject_name, note["id"])
         self.save_notes()
         return note
     
@@ -65,6 +93,8 @@ class NotesManager:
         key = f"{subject_name}:{topic_name}" if topic_name else f"{subject_name}:"
         if key in self.notes:
             self.notes[key] = [n for n in self.notes[key] if n.get("id") != note_id]
+            self._bump_version(subject_name)
+            self.events.emit("note_deleted", subject_name, note_id)
             self.save_notes()
             return True
         return False
@@ -90,6 +120,8 @@ class NotesManager:
         }
         
         self.notes[key] = [position]
+        self._bump_version(subject_name)
+        self.events.emit("last_position_changed", subject_name)
         self.save_notes()
         return position
     
@@ -105,6 +137,8 @@ class NotesManager:
         key = f"{subject_name}:__LAST_POSITION__"
         if key in self.notes:
             del self.notes[key]
+            self._bump_version(subject_name)
+            self.events.emit("last_position_changed", subject_name)
             self.save_notes()
             return True
         return False
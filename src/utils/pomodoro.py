@@ -0,0 +1,166 @@
+"""
+Pomodoro Module
+Work/break interval scheduling on top of study sessions
+"""
+
+import json
+import os
+import time
+from ..config.constants import get_data_dir, POMODORO_SETTINGS
+
+PHASES = ("work", "short_break", "long_break")
+
+class PomodoroScheduler:
+    """Runs a Pomodoro cadence as a single study session.
+    
+    Work intervals are the session's active segments and breaks are pauses, so the
+    time tracker logs exactly the work time. The schedule (phase, its wall-clock end
+    and the number of finished work intervals) is saved on every change so a run
+    can be picked up again after a restart.
+    """
+    
+    def __init__(self, time_tracker, settings=None):
+        self.time_tracker = time_tracker
+        self.settings = dict(POMODORO_SETTINGS, **(settings or {}))
+        # Always get fresh path in case we're running from EXE
+        self.state_file = os.path.join(get_data_dir(), "pomodoro_state.json")
+        self.state = None  # {"subject", "session_id", "phase", "phase_end", "completed"}
+        self.restore()
+    
+    def load_state(self):
+        """Load the saved schedule, if any"""
+        if os.path.exists(self.state_file):
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    state = json.load(f)
+                if state.get("phase") in PHASES and state.get("subject"):
+                    return state
+            except:
+                pass
+        return None
+    
+    def save_state(self):
+        """Save the schedule, or remove the file when no run is active"""
+        try:
+            if self.state is None:
+                if os.path.exists(self.state_file):
+                    os.remove(self.state_file)
+                return True
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f)
+            return True
+        except:
+            return False
+    
+    def is_active(self):
+        """Check whether a Pomodoro run is in progress"""
+        return self.state is not None
+    
+    @property
+    def session_id(self):
+        return self.state["session_id"] if self.state else None
+    
+    @property
+    def phase(self):
+        return self.state["phase"] if self.state else None
+    
+    @property
+    def phase_end(self):
+        """time.time() timestamp at which the current phase ends"""
+        return self.state["phase_end"] if self.state else None
+    
+    def phase_length(self, phase):
+        """Length of a phase in seconds"""
+        return self.settings[f"{phase}_minutes"] * 60
+    
+    def remaining_seconds(self, now=None):
+        """Seconds left in the current phase"""
+        if not self.state:
+            return 0
+        now = time.time() if now is None else now
+        return max(self.state["phase_end"] - now, 0)
+    
+    def _next_phase(self):
+        """Phase that follows the current one, counting finished work intervals"""
+        if self.state["phase"] != "work":
+            return "work"
+        self.state["completed"] += 1
+        every = max(int(self.settings.get("long_break_every", 4)), 1)
+        return "long_break" if self.state["completed"] % every == 0 else "short_break"
+    
+    def start(self, subject_name, now=None):
+        """Start a run with a work interval; returns the new session's id"""
+        now = time.time() if now is None else now
+        self.state = {
+            "subject": subject_name,
+            "session_id": self.time_tracker.start_session(subject_name),
+            "phase": "work",
+            "phase_end": now + self.phase_length("work"),
+            "completed": 0
+        }
+        self.save_state()
+        return self.state["session_id"]
+    
+    def advance(self, now=None, log=True):
+        """Move past every phase that has ended by `now`; returns the phases entered.
+        
+        Each boundary pauses or resumes the session at the moment the phase ended,
+        not at the moment this runs, so a late tick doesn't skew the logged time.
+        """
+        if not self.state:
+            return []
+        now = time.time() if now is None else now
+        entered = []
+        while now >= self.state["phase_end"]:
+            boundary = self.state["phase_end"]
+            phase = self._next_phase()
+            if log and self.state["session_id"]:
+                offset = self.time_tracker.get_offset_at(self.state["session_id"], boundary)
+                if phase == "work":
+                    self.time_tracker.resume_session(self.state["session_id"], offset)
+                else:
+                    self.time_tracker.pause_session(self.state["session_id"], offset)
+            self.state["phase"] = phase
+            self.state["phase_end"] = boundary + self.phase_length(phase)
+            entered.append(phase)
+        if entered:
+            self.save_state()
+        return entered
+    
+    def skip(self, now=None):
+        """End the current phase now"""
+        if not self.state:
+            return []
+        now = time.time() if now is None else now
+        self.state["phase_end"] = now
+        return self.advance(now)
+    
+    def stop(self):
+        """Forget the run; the session itself is ended by the caller"""
+        self.state = None
+        self.save_state()
+    
+    def restore(self, now=None):
+        """Pick up a saved run.
+        
+        Its session was ended when the app closed (or by crash recovery), so phases
+        that passed while the app was closed are skipped without logging and a new session continues the
+        run: active if it is in a work interval, paused during a break.
+        """
+        state = self.load_state()
+        if state is None:
+            return False
+        now = time.time() if now is None else now
+        if now - state["phase_end"] > self.settings.get("resume_within_minutes", 60) * 60:
+            self.state = None
+            self.save_state()
+            return False
+        
+        self.state = state
+        self.advance(now, log=False)
+        self.state["session_id"] = self.time_tracker.start_session(state["subject"])
+        if self.state["phase"] != "work":
+            self.time_tracker.pause_session(self.state["session_id"])
+        self.save_state()
+        return True
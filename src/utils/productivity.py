@@ -0,0 +1,144 @@
+"""
+Productivity Module
+Daily productivity score time series, materialized to disk
+"""
+
+import datetime
+import json
+import os
+import numpy as np
+from ..config.constants import get_data_dir
+
+def productivity_scores(week_minutes, solved, target, completed_topics, total_topics):
+    """Weighted productivity score (0-100); accepts scalars or NumPy arrays"""
+    time_factor = np.minimum(np.asarray(week_minutes, dtype=float) / (7 * 60), 1.0)  # Normalize to 7 hours/day
+    questions_factor = np.minimum(np.asarray(solved, dtype=float) / 1000, 1.0)  # Normalize to 1000 questions
+    progress_factor = np.asarray(solved, dtype=float) / target if target > 0 else 0.0
+    completion_factor = np.asarray(completed_topics, dtype=float) / max(total_topics, 1)
+    
+    score = (
+        time_factor * 0.25 +
+        questions_factor * 0.25 +
+        progress_factor * 0.25 +
+        completion_factor * 0.25
+    ) * 100
+    
+    return np.round(score, 1)
+
+class ProductivityHistory:
+    """Keeps one productivity score per past day.
+    
+    Missing history is backfilled in a single vectorized pass; afterwards only the
+    days since the last stored one are computed. Stored days are never recomputed.
+    """
+    
+    def __init__(self, data_manager, time_tracker):
+        self.data_manager = data_manager
+        self.time_tracker = time_tracker
+        # Always get fresh path in case we're running from EXE
+        self.history_file = os.path.join(get_data_dir(), "productivity_history.json")
+        self.start, self.scores = self.load_history()
+    
+    def load_history(self):
+        """Load the stored series as (first date, scores)"""
+        if os.path.exists(self.history_file):
+            try:
+                with open(self.history_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                return datetime.date.fromisoformat(data["start"]), list(data.get("scores", []))
+            except:
+                pass
+        return None, []
+    
+    def save_history(self):
+        """Save the series"""
+        try:
+            os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
+            with open(self.history_file, 'w', encoding='utf-8') as f:
+                json.dump({"start": self.start.isoformat(), "scores": self.scores}, f)
+            return True
+        except:
+            return False
+    
+    def _first_activity(self):
+        """Earliest day with a session or a completed topic"""
+        dates = [s.get("start_time", "")[:10] for s in self.time_tracker.sessions.values() if s.get("start_time")]
+        for subject in self.data_manager.data.values():
+            dates.extend(
+                t.get('bitirme_tarihi') for t in subject.get('konular', [])
+                if t.get('durum') == 'Tamamlandı' and t.get('bitirme_tarihi', '-') != '-'
+            )
+        try:
+            return datetime.date.fromisoformat(min(dates)) if dates else None
+        except ValueError:
+            return None
+    
+    def compute_scores(self, start, end):
+        """Compute the scores of days start..end in one vectorized pass.
+        
+        Totals on a past day are reconstructed from today's totals minus whatever was
+        logged after that day; study time is summed over the day's calendar week.
+        """
+        today = datetime.date.today()
+        range_start = start - datetime.timedelta(days=start.weekday())  # Monday of start's week
+        n = (today - range_start).days + 1
+        day_index = {(range_start + datetime.timedelta(days=i)).isoformat(): i for i in range(n)}
+        
+        minutes = np.zeros(n)
+        questions = np.zeros(n)
+        completions = np.zeros(n)
+        for day, i in day_index.items():
+            minutes[i] = self.time_tracker.get_daily_minutes(day)
+        for day, count in self.data_manager.get_daily_questions().items():
+            i = day_index.get(day)
+            if i is not None:
+                questions[i] += count
+        for subject in self.data_manager.data.values():
+            for topic in subject.get('konular', []):
+                if topic.get('durum') == 'Tamamlandı':
+                    i = day_index.get(topic.get('bitirme_tarihi', '-'))
+                    if i is not None:
+                        completions[i] += 1
+        
+        stats = self.data_manager.get_statistics()
+        cumulative_questions = np.cumsum(questions)
+        solved = np.maximum(stats["total_solved"] - (cumulative_questions[-1] - cumulative_questions), 0)
+        cumulative_completions = np.cumsum(completions)
+        completed = np.maximum(stats["completed_topics"] - (cumulative_completions[-1] - cumulative_completions), 0)
+        
+        # Minutes from each day's Monday up to that day (range_start is a Monday)
+        cumulative_minutes = np.cumsum(minutes)
+        monday = np.arange(n) - np.arange(n) % 7
+        week_minutes = cumulative_minutes - np.where(monday > 0, cumulative_minutes[monday - 1], 0)
+        
+        scores = productivity_scores(
+            week_minutes, solved, stats["total_target"], completed, stats["total_topics"]
+        )
+        first = (start - range_start).days
+        return scores[first:first + (end - start).days + 1].tolist()
+    
+    def extend(self):
+        """Materialize every finished day that isn't stored yet"""
+        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+        if self.start is None:
+            self.start = self._first_activity()
+            if self.start is None or self.start > yesterday:
+                self.start = None
+                return
+        
+        next_day = self.start + datetime.timedelta(days=len(self.scores))
+        if next_day <= yesterday:
+            self.scores.extend(self.compute_scores(next_day, yesterday))
+            self.save_history()
+    
+    def get_series(self, today_score):
+        """Get the series as [{"date", "score"}], ending with today's live score"""
+        self.extend()
+        series = []
+        if self.start is not None:
+            series = [
+                {"date": (self.start + datetime.timedelta(days=i)).isoformat(), "score": score}
+                for i, score in enumerate(self.scores)
+            ]
+        series.append({"date": datetime.date.today().isoformat(), "score": today_score})
+        return series
@@ -0,0 +1,125 @@
+"""
+Quantile Sketch Module
+Compact, mergeable streaming quantile estimates (merging t-digest)
+"""
+
+import math
+
+class QuantileSketch:
+    """Streaming quantile sketch with a bounded number of centroids.
+    
+    Values are clustered into weighted centroids whose size limit shrinks towards
+    the tails (t-digest scale), so extreme quantiles stay accurate while memory
+    stays below `compression` centroids however many values are added.
+    """
+    
+    def __init__(self, compression=100):
+        self.compression = compression
+        self.centroids = []  # sorted [mean, weight] pairs
+        self.count = 0
+        self.min = None
+        self.max = None
+        self._buffer = []
+    
+    def add(self, value, weight=1):
+        """Add a value to the sketch"""
+        value = float(value)
+        self._buffer.append([value, weight])
+        self.count += weight
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if len(self._buffer) >= self.compression:
+            self._compress()
+    
+    def merge(self, other):
+        """Merge another sketch into this one"""
+        other._compress()
+        if not other.count:
+            return self
+        self._buffer.extend([mean, weight] for mean, weight in other.centroids)
+        self.count += other.count
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self._compress()
+        return self
+    
+    def _scale(self, q):
+        """t-digest k1 scale function; each centroid spans at most one unit of k"""
+        return self.compression / (2 * math.pi) * math.asin(2 * min(max(q, 0.0), 1.0) - 1)
+    
+    def _compress(self):
+        """Fold buffered values into the centroid list"""
+        if not self._buffer:
+            return
+        points = sorted(self.centroids + self._buffer)
+        self._buffer = []
+        total = sum(weight for _, weight in points)
+        
+        merged = []
+        cumulative = 0
+        mean, weight = points[0]
+        k_limit = self._scale(0) + 1
+        for next_mean, next_weight in points[1:]:
+            if self._scale((cumulative + weight + next_weight) / total) <= k_limit:
+                weight += next_weight
+                mean += (next_mean - mean) * next_weight / weight
+            else:
+                merged.append([mean, weight])
+                cumulative += weight
+                k_limit = self._scale(cumulative / total) + 1
+                mean, weight = next_mean, next_weight
+        merged.append([mean, weight])
+        self.centroids = merged
+    
+    def quantile(self, q):
+        """Estimate the value at quantile q (0..1)"""
+        self._compress()
+        if not self.centroids:
+            return 0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+        
+        target = q * self.count
+        cumulative = 0
+        previous_center = None
+        previous_mean = self.min
+        for mean, weight in self.centroids:
+            center = cumulative + weight / 2
+            if target < center:
+                if previous_center is None:
+                    # Between the minimum and the first centroid
+                    fraction = target / center if center else 0
+                else:
+                    fraction = (target - previous_center) / (center - previous_center)
+                return previous_mean + (mean - previous_mean) * fraction
+            previous_center = center
+            previous_mean = mean
+            cumulative += weight
+        
+        # Between the last centroid and the maximum
+        span = self.count - previous_center
+        fraction = (target - previous_center) / span if span else 1
+        return previous_mean + (self.max - previous_mean) * fraction
+    
+    def to_dict(self):
+        """Serialize the sketch to a JSON-friendly dict"""
+        self._compress()
+        return {
+            "compression": self.compression,
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "centroids": [[round(mean, 4), weight] for mean, weight in self.centroids]
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Restore a sketch from to_dict() output"""
+        sketch = cls(data.get("compression", 100))
+        sketch.count = data.get("count", 0)
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        sketch.centroids = [list(centroid) for centroid in data.get("centroids", [])]
+        return sketch
@@ -0,0 +1,184 @@
+"""
+Recommendations Module
+Declarative study recommendation rules, evaluated incrementally
+"""
+
+import datetime
+from collections import namedtuple
+from ..config.constants import RECOMMENDATION_SETTINGS
+from .caching import detached
+
+# A rule names the stores it reads; it only re-runs when one of their versions changes
+Rule = namedtuple("Rule", ["name", "depends_on", "evaluate"])
+
+RULES = []
+
+PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+def rule(name, *depends_on):
+    """Register a recommendation rule that reads the given stores"""
+    def decorator(func):
+        RULES.append(Rule(name, depends_on, func))
+        return func
+    return decorator
+
+def recommendation(rec_type, priority, message_key, subject=None, **params):
+    """Build a recommendation; the message is translated when it is displayed"""
+    rec = {
+        "type": rec_type,
+        "priority": priority,
+        "message_key": message_key,
+        "params": params
+    }
+    if subject is not None:
+        rec["subject"] = subject
+    return rec
+
+def _days_since(date_str, today):
+    """Days between an ISO date string and today, or None if it isn't a date"""
+    try:
+        return (today - datetime.date.fromisoformat(date_str[:10])).days
+    except (TypeError, ValueError):
+        return None
+
+@rule("low_weekly_time", "time_tracker")
+def low_weekly_time(engine, today):
+    """Warn when this week's study time is below the weekly minimum"""
+    minimum = engine.settings.get("min_weekly_minutes", 300)
+    week_minutes = engine.time_tracker.get_week_stats()["total_time_minutes"]
+    if week_minutes >= minimum:
+        return []
+    return [recommendation(
+        "warning", "high", "recommendations.low_weekly_time",
+        minutes=int(week_minutes), target_hours=round(minimum / 60, 1)
+    )]
+
+@rule("stalled_subject", "data_manager", "time_tracker")
+def stalled_subject(engine, today):
+    """Flag unfinished subjects that haven't been studied for a while"""
+    stalled_days = engine.settings.get("stalled_subject_days", 7)
+    results = []
+    for subject_name, subject_data in engine.data_manager.data.items():
+        if subject_data.get('cozulen_soru', 0) >= subject_data.get('hedef_soru', 0):
+            continue
+        
+        activity = [subject_data.get('son_calisma_tarihi', '')]
+        study_days = engine.time_tracker.get_study_days(subject_name)
+        if study_days:
+            activity.append(max(study_days))
+        last_activity = max(activity)
+        if not last_activity:
+            continue  # Never started - nothing has stalled yet
+        
+        idle_days = _days_since(last_activity, today)
+        if idle_days is not None and idle_days >= stalled_days:
+            results.append(recommendation(
+                "warning", "medium", "recommendations.stalled_subject",
+                subject=subject_name, days=idle_days
+            ))
+    return results
+
+@rule("deadline_risk", "data_manager", "time_tracker")
+def deadline_risk(engine, today):
+    """Flag subjects whose forecast completion date is past their deadline"""
+    results = []
+    for subject_name, forecast in engine.forecaster.get_forecasts()["subjects"].items():
+        if not forecast.get("will_miss_deadline"):
+            continue
+        if forecast.get("eta"):
+            results.append(recommendation(
+                "error", "high", "recommendations.deadline_risk",
+                subject=subject_name, deadline=forecast["deadline"], eta=forecast["eta"]
+            ))
+        else:
+            results.append(recommendation(
+                "error", "high", "recommendations.deadline_risk_no_pace",
+                subject=subject_name, deadline=forecast["deadline"]
+            ))
+    return results
+
+@rule("goal_at_risk", "goal_tracker")
+def goal_at_risk(engine, today):
+    """Flag open goals that are due soon and behind a linear pace"""
+    warning_days = engine.settings.get("goal_warning_days", 7)
+    results = []
+    for goal in engine.goal_tracker.get_goals():
+        days_left = _days_since(goal.get("target_date") or "", today)
+        if days_left is None:
+            continue
+        days_left = -days_left
+        if days_left > warning_days:
+            continue
+        
+        target = goal.get("target_value", 0) or 0
+        progress = (goal.get("current_value", 0) / target * 100) if target > 0 else 100
+        if days_left < 0:
+            results.append(recommendation(
+                "error", "high", "recommendations.goal_overdue",
+                subject=goal.get("subject"), date=goal["target_date"], progress=round(progress)
+            ))
+            continue
+        
+        # Share of the goal's time span already used up
+        total_days = _days_since(goal.get("created_date") or "", datetime.date.fromisoformat(goal["target_date"][:10]))
+        elapsed = 100 - (days_left / total_days * 100) if total_days else 100
+        if progress < elapsed:
+            results.append(recommendation(
+                "warning", "medium", "recommendations.goal_at_risk",
+                subject=goal.get("subject"), date=goal["target_date"], progress=round(progress), days=days_left
+            ))
+    return results
+
+@rule("neglected_topic", "data_manager")
+def neglected_topic(engine, today):
+    """Flag topics that have been in progress for too long"""
+    neglected_days = engine.settings.get("neglected_topic_days", 14)
+    results = []
+    for subject_name, subject_data in engine.data_manager.data.items():
+        for topic in subject_data.get('konular', []):
+            if topic.get('durum') != 'Devam Ediyor':
+                continue
+            days = _days_since(topic.get('baslangic_tarihi', '-'), today)
+            if days is not None and days >= neglected_days:
+                results.append(recommendation(
+                    "suggestion", "low", "recommendations.neglected_topic",
+                    subject=subject_name, topic=topic.get('ad', ''), days=days
+                ))
+    return results
+
+class RecommendationEngine:
+    """Evaluates the registered rules, re-running only those whose inputs changed"""
+    
+    def __init__(self, data_manager, time_tracker, goal_tracker, forecaster, rules=None):
+        self.data_manager = data_manager
+        self.time_tracker = time_tracker
+        self.goal_tracker = goal_tracker
+        self.forecaster = forecaster
+        self.rules = list(rules if rules is not None else RULES)
+        self.settings = RECOMMENDATION_SETTINGS
+        
+        # rule name -> (input versions, recommendations)
+        self._results = {}
+    
+    def _input_key(self, rule, today):
+        """Versions of the stores a rule depends on; rules are also date relative"""
+        return tuple(getattr(self, store).version for store in rule.depends_on) + (today,)
+    
+    def evaluate(self):
+        """Get all current recommendations, most important first"""
+        today = datetime.date.today()
+        recommendations = []
+        for rule in self.rules:
+            key = self._input_key(rule, today)
+            cached = self._results.get(rule.name)
+            if cached is None or cached[0] != key:
+                cached = (key, rule.evaluate(self, today))
+                self._results[rule.name] = cached
+            recommendations.extend(dict(detached(rec), rule=rule.name) for rec in cached[1])
+        
+        return sorted(recommendations, key=lambda rec: PRIORITY_ORDER.get(rec["priority"], len(PRIORITY_ORDER)))
+    
+    @staticmethod
+    def format(rec, lang_manager):
+        """Translate a recommendation's message"""
+        return lang_manager.translate(rec["message_key"], **rec["params"], subject=rec.get("subject", ""))
@@ -3,25 +3,156 @@ Time Tracking Module
 Tracks study time and session duration
 """
 
+import csv
 import datetime
+import functools
+import itertools
 import json
+import math
 import os
+import time
 from ..config.constants import get_data_dir
+from .quantile_sketch import QuantileSketch
+from .ids import new_id, unique_keys_hook
+from .events import EventBus
+
+def split_by_hour(start, end):
+    """Split a time interval at hour boundaries into (hour_start, minutes) pieces"""
+    pieces = []
+    current = start
+    while current < end:
+        hour_start = current.replace(minute=0, second=0, microsecond=0)
+        next_hour = hour_start + datetime.timedelta(hours=1)
+        piece_end = min(next_hour, end)
+        pieces.append((hour_start, (piece_end - current).total_seconds() / 60))
+        current = piece_end
+    return pieces
+
+def session_intervals(session):
+    """Get a session's active (start, end) datetime intervals.
+    
+    Sessions with pause support store "segments" as a flat list of second offsets
+    from start_time: [start, end, start, end, ...]; an odd length means the last
+    segment is still running and it is left out here.
+    """
+    try:
+        start = datetime.datetime.fromisoformat(session["start_time"])
+    except (KeyError, TypeError, ValueError):
+        return []
+    
+    segments = session.get("segments")
+    if segments is None:
+        try:
+            return [(start, datetime.datetime.fromisoformat(session["end_time"]))]
+        except (KeyError, TypeError, ValueError):
+            return []
+    
+    return [
+        (start + datetime.timedelta(seconds=segments[i]), start + datetime.timedelta(seconds=segments[i + 1]))
+        for i in range(0, len(segments) - 1, 2)
+    ]
+
+# Accepted column names for imported sessions, first match wins
+IMPORT_FIELDS = {
+    "subject": ("subject", "ders"),
+    "start_time": ("start_time", "start", "baslangic"),
+    "end_time": ("end_time", "end", "bitis"),
+    "duration_minutes": ("duration_minutes", "duration", "sure"),
+    "questions_solved": ("questions_solved", "questions", "soru"),
+    "notes": ("notes", "notlar")
+}
+
+# Day-first formats common in spreadsheet exports; ISO 8601 is tried first
+_TIMESTAMP_FORMATS = ("%d.%m.%Y %H:%M:%S", "%d.%m.%Y %H:%M", "%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M")
+
+def parse_timestamp(value):
+    """Parse an imported timestamp into a naive local datetime.
+    
+    Accepts ISO 8601 (with "T" or a space, optionally with "Z" or an offset, which
+    are converted to local time), epoch seconds, and day-first spreadsheet formats.
+    Raises ValueError for anything else.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        try:
+            return datetime.datetime.fromtimestamp(value)
+        except (ValueError, OverflowError, OSError):
+            raise ValueError(f"invalid timestamp: {value}")
+    text = str(value or "").strip()
+    if not text:
+        raise ValueError("missing timestamp")
+    try:
+        return datetime.datetime.fromtimestamp(float(text))
+    except (ValueError, OverflowError, OSError):
+        pass
+    
+    iso = text[:-1] + "+00:00" if text.endswith(("Z", "z")) else text
+    try:
+        parsed = datetime.datetime.fromisoformat(iso)
+    except ValueError:
+        for fmt in _TIMESTAMP_FORMATS:
+            try:
+                return datetime.datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+        raise ValueError(f"invalid timestamp: {text}")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+def _empty_histogram():
+    """Create empty hour-of-day and weekday buckets"""
+    return {
+        "hour_minutes": [0.0] * 24,
+        "hour_questions": [0.0] * 24,
+        "weekday_minutes": [0.0] * 7,
+        "weekday_questions": [0.0] * 7
+    }
 
 class TimeTracker:
     """Tracks study time and sessions"""
     
-    def __init__(self):
+    def __init__(self, events=None):
         # Always get fresh path in case we're running from EXE
         self.sessions_file = os.path.join(get_data_dir(), "study_sessions.json")
+        self.sketches_file = os.path.join(get_data_dir(), "session_sketches.json")
+        self.checkpoints_file = os.path.join(get_data_dir(), "session_checkpoints.log")
+        # Version counters - bumped by every mutator so callers can cache derived results
+        self.version = 0
+        self.subject_versions = {}
+        # Change events for the UI; may be shared with the other managers
+        self.events = events or EventBus()
+        # Monotonic clock readings for sessions started in this run: session id -> start
+        self._monotonic_starts = {}
         self.sessions = self.load_sessions()
+        
+        # Close sessions left open by a crash, using their last checkpoint
+        self.recovered_sessions = self.recover_open_sessions()
+        
+        # Derived indexes, built once here and then updated as sessions end
+        self._histograms = {}  # subject -> hour/weekday buckets
+        self._study_days = {}  # subject -> set of ISO dates with study time
+        self._daily_minutes = {}  # ISO date -> {subject: minutes}, split at midnight
+        for session in self.sessions.values():
+            self._index_session(session)
+        
+        # Per-subject quantile sketches of session length and questions/hour
+        self._sketches = self.load_sketches()
     
     def load_sessions(self):
-        """Load study sessions"""
+        """Load study sessions.
+        
+        Sessions saved under a repeated ID (old second-resolution IDs) are kept under
+        fresh IDs instead of being dropped, and the file is rewritten once.
+        """
         if os.path.exists(self.sessions_file):
             try:
+                renamed = []
                 with open(self.sessions_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                    sessions = json.load(f, object_pairs_hook=functools.partial(unique_keys_hook, renamed=renamed))
+                if renamed:
+                    self.sessions = sessions
+                    self.save_sessions()
+                return sessions
             except:
                 return {}
         return {}
@@ -36,38 +167,554 @@ class TimeTracker:
         except:
             return False
     
+    def _bump_version(self, *subject_names):
+        """Mark sessions as changed, optionally for specific subjects"""
+        self.version += 1
+        for subject_name in subject_names:
+            self.subject_versions[subject_name] = self.version
+    
+    def get_subject_version(self, subject_name):
+        """Get the sessions version of the last change to a subject"""
+        return self.subject_versions.get(subject_name, 0)
+    
+    def _read_checkpoints(self):
+        """Read the last checkpointed elapsed seconds of each session"""
+        checkpoints = {}
+        if os.path.exists(self.checkpoints_file):
+            try:
+                with open(self.checkpoints_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        parts = line.split()
+                        if len(parts) == 2 and parts[1].isdigit():
+                            checkpoints[parts[0]] = int(parts[1])
+            except:
+                pass
+        return checkpoints
+    
+    def _clear_checkpoints(self):
+        """Remove the checkpoint log once no session needs it"""
+        try:
+            if os.path.exists(self.checkpoints_file):
+                os.remove(self.checkpoints_file)
+        except:
+            pass
+    
+    def checkpoint(self, session_id):
+        """Record an active session's elapsed time with a tiny append write"""
+        if session_id not in self.sessions or self.sessions[session_id].get("end_time"):
+            return False
+        try:
+            with open(self.checkpoints_file, 'a', encoding='utf-8') as f:
+                f.write(f"{session_id} {int(self.get_elapsed_seconds(session_id))}\n")
+            return True
+        except:
+            return False
+    
+    def recover_open_sessions(self):
+        """Close sessions that were never ended, at their last checkpoint (or zero length)"""
+        checkpoints = self._read_checkpoints()
+        recovered = []
+        for session_id, session in self.sessions.items():
+            if session.get("end_time") or not session.get("start_time"):
+                continue
+            active = checkpoints.get(session_id, 0)
+            segments = session.get("segments")
+            if segments is None:
+                end_offset = active
+            else:
+                if len(segments) % 2:
+                    # Close the running segment so the active total matches the checkpoint
+                    closed = sum(segments[i + 1] - segments[i] for i in range(0, len(segments) - 1, 2))
+                    segments.append(segments[-1] + max(active - closed, 0))
+                active = sum(segments[i + 1] - segments[i] for i in range(0, len(segments), 2))
+                end_offset = segments[-1] if segments else 0
+            start_time = datetime.datetime.fromisoformat(session["start_time"])
+            session["end_time"] = (start_time + datetime.timedelta(seconds=end_offset)).isoformat()
+            session["duration_minutes"] = round(active / 60, 2)
+            session["recovered"] = True
+            recovered.append(session_id)
+        
+        if recovered:
+            self.save_sessions()
+        self._clear_checkpoints()
+        return recovered
+    
+    def _offset_now(self, session_id):
+        """Seconds since a session's start_time.
+        
+        Sessions started in this run use the monotonic clock, so wall clock changes
+        don't affect the measured length.
+        """
+        if session_id in self._monotonic_starts:
+            return time.monotonic() - self._monotonic_starts[session_id]
+        start_time = datetime.datetime.fromisoformat(self.sessions[session_id]["start_time"])
+        return max((datetime.datetime.now() - start_time).total_seconds(), 0)
+    
+    def get_offset_at(self, session_id, timestamp):
+        """Convert a time.time() timestamp into a session's second offset"""
+        offset = self._offset_now(session_id) - (time.time() - timestamp)
+        return max(round(offset), 0)
+    
+    def get_elapsed_seconds(self, session_id):
+        """Get a running session's active study time in seconds (pauses excluded)"""
+        session = self.sessions.get(session_id)
+        if not session:
+            return 0
+        now = self._offset_now(session_id)
+        segments = session.get("segments")
+        if segments is None:
+            return now
+        
+        active = sum(segments[i + 1] - segments[i] for i in range(0, len(segments) - 1, 2))
+        if len(segments) % 2:
+            active += max(now - segments[-1], 0)
+        return active
+    
+    def is_paused(self, session_id):
+        """Check whether an open session is paused"""
+        session = self.sessions.get(session_id)
+        return bool(session and not session.get("end_time") and len(session.get("segments", [0])) % 2 == 0)
+    
+    def pause_session(self, session_id, offset=None):
+        """Pause a running session, closing its current segment.
+        
+        `offset` (seconds since start_time) pauses at an earlier moment than now.
+        """
+        session = self.sessions.get(session_id)
+        if not session or session.get("end_time") or self.is_paused(session_id):
+            return False
+        segments = session.setdefault("segments", [0])
+        offset = self._offset_now(session_id) if offset is None else offset
+        segments.append(max(int(offset), segments[-1]))
+        self._bump_version(session.get("subject"))
+        self.events.emit("session_paused", session.get("subject"), session_id)
+        self.save_sessions()
+        return True
+    
+    def resume_session(self, session_id, offset=None):
+        """Resume a paused session, opening a new segment (optionally at an earlier offset)"""
+        if not self.is_paused(session_id):
+            return False
+        session = self.sessions[session_id]
+        offset = self._offset_now(session_id) if offset is None else offset
+        session["segments"].append(max(int(offset), session["segments"][-1]))
+        self._bump_version(session.get("subject"))
+        self.events.emit("session_resumed", session.get("subject"), session_id)
+        self.save_sessions()
+        return True
+    
+    def load_sketches(self):
+        """Load persisted session sketches, rebuilding them if they are out of date"""
+        finished = sum(1 for s in self.sessions.values() if s.get("end_time"))
+        if os.path.exists(self.sketches_file):
+            try:
+                with open(self.sketches_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("session_count") == finished:
+                    return {
+                        subject: {name: QuantileSketch.from_dict(sketch) for name, sketch in sketches.items()}
+                        for subject, sketches in data.get("subjects", {}).items()
+                    }
+            except:
+                pass
+        
+        # One-time backfill from session history
+        self._sketches = {}
+        for session in self.sessions.values():
+            if session.get("end_time"):
+                self._add_to_sketches(session)
+        self.save_sketches()
+        return self._sketches
+    
+    def save_sketches(self):
+        """Save session sketches"""
+        try:
+            os.makedirs(os.path.dirname(self.sketches_file), exist_ok=True)
+            data = {
+                "session_count": sum(1 for s in self.sessions.values() if s.get("end_time")),
+                "subjects": {
+                    subject: {name: sketch.to_dict() for name, sketch in sketches.items()}
+                    for subject, sketches in self._sketches.items()
+                }
+            }
+            with open(self.sketches_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            return True
+        except:
+            return False
+    
+    def _add_to_sketches(self, session, target=None):
+        """Add a finished session's length and questions/hour to its subject's sketches"""
+        duration = session.get("duration_minutes", 0)
+        if duration <= 0:
+            return
+        target = self._sketches if target is None else target
+        sketches = target.setdefault(session.get("subject", "Unknown"), {
+            "duration": QuantileSketch(),
+            "questions_per_hour": QuantileSketch()
+        })
+        sketches["duration"].add(duration)
+        sketches["questions_per_hour"].add(session.get("questions_solved", 0) / (duration / 60))
+    
+    def get_session_distribution(self, subject_name=None):
+        """Get median/p90/max session length and questions/hour for a subject.
+        
+        Without a subject name, the sketches of all subjects are merged.
+        """
+        if subject_name is not None:
+            sketches = self._sketches.get(subject_name, {})
+            duration = sketches.get("duration", QuantileSketch())
+            qph = sketches.get("questions_per_hour", QuantileSketch())
+        else:
+            duration = QuantileSketch()
+            qph = QuantileSketch()
+            for sketches in self._sketches.values():
+                duration.merge(sketches["duration"])
+                qph.merge(sketches["questions_per_hour"])
+        
+        return {
+            "sessions": duration.count,
+            "median_minutes": round(duration.quantile(0.5), 2),
+            "p90_minutes": round(duration.quantile(0.9), 2),
+            "max_minutes": round(duration.max or 0, 2),
+            "median_questions_per_hour": round(qph.quantile(0.5), 2),
+            "p90_questions_per_hour": round(qph.quantile(0.9), 2),
+            "max_questions_per_hour": round(qph.max or 0, 2)
+        }
+    
+    def _index_session(self, session, indexes=None):
+        """Add a finished session to the histogram, study-day and daily-minute indexes.
+        
+        `indexes` is an optional (histograms, study_days, daily_minutes) triple to
+        update instead of the live ones.
+        """
+        if not session.get("start_time") or not session.get("end_time"):
+            return
+        intervals = session_intervals(session)
+        if not intervals:
+            return
+        start = intervals[0][0]
+        histograms, study_days, daily_minutes = indexes or (self._histograms, self._study_days, self._daily_minutes)
+        
+        subject = session.get("subject", "Unknown")
+        histogram = histograms.setdefault(subject, _empty_histogram())
+        days = study_days.setdefault(subject, set())
+        
+        # Hour pieces never cross midnight, so they also bucket minutes by date
+        pieces = [piece for interval in intervals for piece in split_by_hour(*interval)]
+        total_minutes = sum(minutes for _, minutes in pieces)
+        questions = session.get("questions_solved", 0)
+        
+        if total_minutes <= 0:
+            # Questions logged in an instant session still belong to its start hour
+            histogram["hour_questions"][start.hour] += questions
+            histogram["weekday_questions"][start.weekday()] += questions
+            return
+        
+        for hour_start, minutes in pieces:
+            share = questions * minutes / total_minutes
+            histogram["hour_minutes"][hour_start.hour] += minutes
+            histogram["hour_questions"][hour_start.hour] += share
+            histogram["weekday_minutes"][hour_start.weekday()] += minutes
+            histogram["weekday_questions"][hour_start.weekday()] += share
+            day = hour_start.date().isoformat()
+            days.add(day)
+            day_minutes = daily_minutes.setdefault(day, {})
+            day_minutes[subject] = day_minutes.get(subject, 0) + minutes
+    
+    def get_time_histograms(self, subject_name=None):
+        """Get study minutes and questions bucketed by hour of day and weekday.
+        
+        Without a subject name, the buckets of all subjects are summed.
+        """
+        if subject_name is not None:
+            histogram = self._histograms.get(subject_name, _empty_histogram())
+            return {key: list(values) for key, values in histogram.items()}
+        
+        total = _empty_histogram()
+        for histogram in self._histograms.values():
+            for key, values in histogram.items():
+                total[key] = [a + b for a, b in zip(total[key], values)]
+        return total
+    
+    def get_daily_minutes(self, day, subject_name=None):
+        """Get minutes studied on an ISO date (sessions crossing midnight are split)"""
+        day_minutes = self._daily_minutes.get(day, {})
+        if subject_name is not None:
+            return day_minutes.get(subject_name, 0)
+        return sum(day_minutes.values())
+    
+    def get_daily_minutes_by_subject(self, day):
+        """Get {subject: minutes} studied on an ISO date"""
+        return dict(self._daily_minutes.get(day, {}))
+    
+    def get_study_days(self, subject_name):
+        """Get the set of ISO dates on which a subject was studied"""
+        return self._study_days.get(subject_name, set())
+    
     def start_session(self, subject_name):
         """Start a study session"""
-        session_id = datetime.datetime.now().strftime("%Y%m%d%H%M%S")
+        session_id = new_id()
         session = {
             "subject": subject_name,
             "start_time": datetime.datetime.now().isoformat(),
             "end_time": None,
+            "segments": [0],  # Flat [start, end, ...] second offsets of active segments
             "duration_minutes": 0,
             "questions_solved": 0,
             "notes": ""
         }
         self.sessions[session_id] = session
+        self._monotonic_starts[session_id] = time.monotonic()
+        self._bump_version(subject_name)
+        self.events.emit("session_started", subject_name, session_id)
         self.save_sessions()
         return session_id
     
     def end_session(self, session_id, questions_solved=0, notes=""):
-        """End a study session"""
-        if session_id in self.sessions:
+        """End a study session; returns None if it is unknown or already ended"""
+        if session_id in self.sessions and not self.sessions[session_id].get("end_time"):
             session = self.sessions[session_id]
-            end_time = datetime.datetime.now()
+            elapsed = self.get_elapsed_seconds(session_id)
             start_time = datetime.datetime.fromisoformat(session["start_time"])
-            duration = (end_time - start_time).total_seconds() / 60  # minutes
+            segments = session.get("segments")
+            if segments is None:
+                end_offset = elapsed
+            else:
+                if len(segments) % 2:
+                    segments.append(max(int(round(self._offset_now(session_id))), segments[-1]))
+                    elapsed = sum(segments[i + 1] - segments[i] for i in range(0, len(segments), 2))
+                end_offset = segments[-1]
+            end_time = start_time + datetime.timedelta(seconds=end_offset)
+            duration = elapsed / 60  # minutes
             
             session["end_time"] = end_time.isoformat()
             session["duration_minutes"] = round(duration, 2)
             session["questions_solved"] = questions_solved
             session["notes"] = notes
             
+            self._index_session(session)
+            self._add_to_sketches(session)
+            self._bump_version(session.get("subject"))
+            self.events.emit("session_ended", session.get("subject"), session_id)
             self.save_sessions()
+            self.save_sketches()
+            
+            self._monotonic_starts.pop(session_id, None)
+            if not any(s.get("end_time") is None for s in self.sessions.values()):
+                self._clear_checkpoints()
             return session
         return None
     
+    def _iter_import_rows(self, lines, file_format=None):
+        """Yield (row number, record) pairs from CSV or NDJSON lines, or from dicts.
+        
+        Unparseable rows are yielded as their ValueError instead of a record.
+        """
+        lines = iter(lines)
+        first = next(lines, None)
+        while isinstance(first, str) and not first.strip():
+            first = next(lines, None)
+        if first is None:
+            return
+        lines = itertools.chain([first], lines)
+        
+        if isinstance(first, dict):
+            yield from enumerate(lines, 1)
+            return
+        
+        if file_format is None:
+            file_format = "ndjson" if first.lstrip("\ufeff").lstrip().startswith("{") else "csv"
+        
+        if file_format == "csv":
+            reader = csv.DictReader(line.lstrip("\ufeff") if i == 0 else line for i, line in enumerate(lines))
+            for row in reader:
+                # reader.line_num counts the header, so it matches the line in the file
+                yield reader.line_num, row
+            return
+        
+        for row_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield row_number, ValueError(f"invalid JSON: {e}")
+                continue
+            if not isinstance(record, dict):
+                record = ValueError("expected a JSON object")
+            yield row_number, record
+    
+    @staticmethod
+    def _import_field(record, name):
+        """Get a field of an imported record by any of its accepted column names"""
+        for key in IMPORT_FIELDS[name]:
+            value = record.get(key)
+            if value not in (None, ""):
+                return value
+        return None
+    
+    def _normalize_import(self, record, resolve_subject):
+        """Turn an imported record into a finished session dict, or raise ValueError"""
+        subject = resolve_subject(str(self._import_field(record, "subject") or "").strip())
+        if not subject:
+            raise ValueError("missing subject")
+        
+        start = parse_timestamp(self._import_field(record, "start_time"))
+        end = self._import_field(record, "end_time")
+        end = parse_timestamp(end) if end is not None else None
+        duration = self._import_field(record, "duration_minutes")
+        try:
+            duration = float(duration) if duration is not None else None
+            questions = float(self._import_field(record, "questions_solved") or 0)
+        except (TypeError, ValueError):
+            raise ValueError("invalid number")
+        # "inf" and "nan" parse as floats but would overflow or poison every total
+        if not math.isfinite(questions) or (duration is not None and not math.isfinite(duration)):
+            raise ValueError("invalid number")
+        questions = int(questions)
+        
+        if end is None and duration is None:
+            raise ValueError("missing end time or duration")
+        if duration is not None and duration < 0:
+            raise ValueError("negative duration")
+        if questions < 0:
+            raise ValueError("negative question count")
+        if end is None:
+            try:
+                end = start + datetime.timedelta(minutes=duration)
+            except OverflowError:
+                raise ValueError("duration out of range")
+        if end < start:
+            raise ValueError("end time before start time")
+        
+        span = (end - start).total_seconds() / 60
+        # A shorter stated duration means the session had pauses; never exceed the span
+        duration = span if duration is None else min(duration, span)
+        
+        return {
+            "subject": subject,
+            "start_time": start.isoformat(),
+            "end_time": end.isoformat(),
+            "duration_minutes": round(duration, 2),
+            "questions_solved": questions,
+            "notes": str(self._import_field(record, "notes") or ""),
+            "imported": True
+        }
+    
+    def prepare_import(self, source, subjects=None, progress_callback=None, chunk_size=1000, file_format=None):
+        """Parse and validate sessions from a CSV/NDJSON file path, or an iterable of lines or dicts.
+        
+        Rows are handled in chunks of `chunk_size`; after each chunk
+        `progress_callback(processed, imported, skipped)` is called. Subject names are
+        matched case-insensitively against `subjects` when given, and rows naming any
+        other subject are skipped as "unknown subject" errors, so every imported
+        session and question count belongs to an existing subject. Nothing is changed
+        here - the new sessions are indexed on their own, so this is safe to run on a
+        worker thread; pass the returned batch to commit_import() to apply it.
+        
+        The batch holds "imported", "skipped", "errors" ([(row, reason)], first 100)
+        and "questions" ([(day, subject, count)]) for the question log.
+        """
+        if subjects is None:
+            resolve_subject = lambda name: name
+        else:
+            known = {name.casefold(): name for name in subjects}
+            
+            def resolve_subject(name):
+                if name and name.casefold() not in known:
+                    raise ValueError("unknown subject")
+                return known.get(name.casefold(), name)
+        
+        if isinstance(source, (str, os.PathLike)):
+            if file_format is None and str(source).lower().endswith(".csv"):
+                file_format = "csv"
+            elif file_format is None and str(source).lower().endswith((".ndjson", ".jsonl")):
+                file_format = "ndjson"
+            with open(source, 'r', encoding='utf-8-sig', newline='') as f:
+                return self._prepare_rows(self._iter_import_rows(f, file_format), resolve_subject, progress_callback, chunk_size)
+        return self._prepare_rows(self._iter_import_rows(source, file_format), resolve_subject, progress_callback, chunk_size)
+    
+    def _prepare_rows(self, rows, resolve_subject, progress_callback, chunk_size):
+        """Validate rows chunk by chunk and index the valid ones into fresh containers"""
+        sessions = {}
+        indexes = ({}, {}, {})  # histograms, study days, daily minutes of the new sessions only
+        sketches = {}
+        questions = {}
+        errors = []
+        processed = skipped = 0
+        while True:
+            chunk = list(itertools.islice(rows, chunk_size))
+            if not chunk:
+                break
+            for row_number, record in chunk:
+                processed += 1
+                try:
+                    if isinstance(record, Exception):
+                        raise record
+                    session = self._normalize_import(record, resolve_subject)
+                except (ValueError, OverflowError, OSError) as e:
+                    # A bad row becomes a row error, it never aborts the import
+                    skipped += 1
+                    if len(errors) < 100:
+                        errors.append((row_number, str(e)))
+                    continue
+                sessions[new_id()] = session
+                self._index_session(session, indexes)
+                self._add_to_sketches(session, sketches)
+                if session["questions_solved"] > 0:
+                    key = (session["start_time"][:10], session["subject"])
+                    questions[key] = questions.get(key, 0) + session["questions_solved"]
+            if progress_callback:
+                progress_callback(processed, len(sessions), skipped)
+        
+        return {
+            "imported": len(sessions),
+            "skipped": skipped,
+            "errors": errors,
+            "questions": sorted((day, subject, count) for (day, subject), count in questions.items()),
+            "sessions": sessions,
+            "indexes": indexes,
+            "sketches": sketches
+        }
+    
+    def commit_import(self, batch):
+        """Apply a prepared import: merge its indexes once and write the sessions once"""
+        if not batch["sessions"]:
+            return False
+        histograms, study_days, daily_minutes = batch["indexes"]
+        for subject, histogram in histograms.items():
+            total = self._histograms.setdefault(subject, _empty_histogram())
+            for key, values in histogram.items():
+                total[key] = [a + b for a, b in zip(total[key], values)]
+        for subject, days in study_days.items():
+            self._study_days.setdefault(subject, set()).update(days)
+        for day, minutes in daily_minutes.items():
+            day_minutes = self._daily_minutes.setdefault(day, {})
+            for subject, value in minutes.items():
+                day_minutes[subject] = day_minutes.get(subject, 0) + value
+        for subject, sketches in batch["sketches"].items():
+            if subject in self._sketches:
+                for name, sketch in sketches.items():
+                    self._sketches[subject][name].merge(sketch)
+            else:
+                self._sketches[subject] = sketches
+        
+        self.sessions.update(batch["sessions"])
+        subjects = {session["subject"] for session in batch["sessions"].values()}
+        self._bump_version(*subjects)
+        for subject in subjects:
+            self.events.emit("sessions_imported", subject)
+        self.save_sessions()
+        self.save_sketches()
+        return True
+    
+    def import_sessions(self, source, subjects=None, progress_callback=None, chunk_size=1000, file_format=None):
+        """Import finished sessions in one batch; see prepare_import() for the arguments"""
+        batch = self.prepare_import(source, subjects, progress_callback, chunk_size, file_format)
+        self.commit_import(batch)
+        return batch
+    
     def get_today_stats(self):
         """Get today's study statistics"""
         today = datetime.date.today().isoformat()
@@ -76,7 +723,7 @@ class TimeTracker:
             if s.get("start_time", "").startswith(today)
         ]
         
-        total_time = sum(s.get("duration_minutes", 0) for s in today_sessions)
+        total_time = self.get_daily_minutes(today)
         total_questions = sum(s.get("questions_solved", 0) for s in today_sessions)
         session_count = len(today_sessions)
         
@@ -100,7 +747,6 @@ class TimeTracker:
                 if session_date >= week_start:
                     week_sessions.append(session)
         
-        total_time = sum(s.get("duration_minutes", 0) for s in week_sessions)
         total_questions = sum(s.get("questions_solved", 0) for s in week_sessions)
         
         # Group by subject
@@ -113,10 +759,18 @@ class TimeTracker:
                     "questions": 0,
                     "sessions": 0
                 }
-            by_subject[subject]["time"] += session.get("duration_minutes", 0)
             by_subject[subject]["questions"] += session.get("questions_solved", 0)
             by_subject[subject]["sessions"] += 1
         
+        # Study time from the date buckets, so minutes after midnight land on the right day
+        total_time = 0
+        for offset in range(today.weekday() + 1):
+            day = (week_start + datetime.timedelta(days=offset)).isoformat()
+            for subject, minutes in self._daily_minutes.get(day, {}).items():
+                by_subject.setdefault(subject, {"time": 0, "questions": 0, "sessions": 0})
+                by_subject[subject]["time"] += minutes
+                total_time += minutes
+        
         return {
             "total_time_minutes": total_time,
             "total_questions": total_questions,
@@ -130,7 +784,7 @@ class TimeTracker:
         
         subject_sessions = [
             s for s in self.sessions.values()
-            if s.get("subject") == subject_name and s.get("start_time", "").startswith(cutoff_date[:10])
+            if s.get("subject") == subject_name and s.get("start_time", "")[:10] >= cutoff_date
         ]
         
         total_time = sum(s.get("duration_minutes", 0) for s in subject_sessions)
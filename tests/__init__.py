@@ -0,0 +1,4 @@
+"""
+Tests
+Run with: python -m unittest discover -s tests -t .
+"""
@@ -0,0 +1,26 @@
+"""
+Tests for the shared cache helpers
+"""
+
+import unittest
+from types import MappingProxyType
+from src.utils.caching import detached
+
+class DetachedTests(unittest.TestCase):
+    def test_mutating_copy_leaves_original(self):
+        cached = {"subjects": ["A", "B"], "rates": {"A": [1, 2]}}
+        result = detached(cached)
+        result["subjects"].append("C")
+        result["rates"]["A"].sort(reverse=True)
+        result.pop("rates")
+        self.assertEqual(cached, {"subjects": ["A", "B"], "rates": {"A": [1, 2]}})
+    
+    def test_immutable_parts_are_shared(self):
+        view = MappingProxyType({"x": 1})
+        pair = (1, 2)
+        result = detached({"view": view, "pair": pair})
+        self.assertIs(result["view"], view)
+        self.assertIs(result["pair"], pair)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""
+Tests for completion forecasts
+"""
+
+import datetime
+import unittest
+from src.utils.forecasting import CompletionForecaster
+
+class BuildForecastTests(unittest.TestCase):
+    def setUp(self):
+        # _build_forecast doesn't touch the stores
+        self.forecaster = CompletionForecaster(None, None)
+        self.today = datetime.date(2026, 10, 19)
+    
+    def test_tiny_rate_has_no_eta_instead_of_overflowing(self):
+        for rate in (1e-3, 1e-9, 5e-324):
+            forecast = self.forecaster._build_forecast(0, 100000, rate, rate, "2026-12-31", self.today)
+            self.assertIsNone(forecast["eta"])
+            self.assertIsNone(forecast["eta_late"])
+            self.assertTrue(forecast["will_miss_deadline"])
+    
+    def test_small_rate_low_keeps_far_eta(self):
+        forecast = self.forecaster._build_forecast(0, 2000, 10.0, 5.1, "", self.today)
+        self.assertEqual(forecast["eta"], "2027-05-07")
+        self.assertGreater(forecast["eta_late"], "3000-01-01")
+    
+    def test_rate_low_clamped_to_zero_has_no_late_eta(self):
+        forecast = self.forecaster._build_forecast(0, 2000, 10.0, 6.0, "", self.today)
+        self.assertEqual(forecast["eta"], "2027-05-07")
+        self.assertIsNone(forecast["eta_late"])
+    
+    def test_eta_at_last_representable_day(self):
+        days_left = (datetime.date.max - self.today).days
+        forecast = self.forecaster._build_forecast(0, days_left, 1.0, 0.0, "", self.today)
+        self.assertEqual(forecast["eta"], datetime.date.max.isoformat())
+        forecast = self.forecaster._build_forecast(0, days_left + 1, 1.0, 0.0, "", self.today)
+        self.assertIsNone(forecast["eta"])
+    
+    def test_completed_target(self):
+        forecast = self.forecaster._build_forecast(50, 50, 0.0, 0.0, "", self.today)
+        self.assertEqual(forecast["eta"], self.today.isoformat())
+        self.assertTrue(forecast["completed"])
+
+if __name__ == "__main__":
+    unittest.main()
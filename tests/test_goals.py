@@ -0,0 +1,38 @@
+"""
+Tests for goals and the goal recommendation rule
+"""
+
+import datetime
+import tempfile
+import unittest
+from unittest import mock
+from src.utils import goal_tracker
+from src.utils.recommendations import goal_at_risk
+
+class GoalsWithoutDateTests(unittest.TestCase):
+    def setUp(self):
+        data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(data_dir.cleanup)
+        with mock.patch.object(goal_tracker, "get_data_dir", lambda: data_dir.name):
+            self.goals = goal_tracker.GoalTracker()
+        self.today = datetime.date.today()
+        self.goals.add_goal("Matematik", "questions", 100, None)
+        self.goals.add_goal("Fizik", "questions", 100, (self.today - datetime.timedelta(days=1)).isoformat())
+        self.goals.add_goal("Kimya", "questions", 100, "")
+    
+    def test_get_goals_sorts_mixed_dates(self):
+        subjects = [goal["subject"] for goal in self.goals.get_goals()]
+        self.assertEqual(sorted(subjects), ["Fizik", "Kimya", "Matematik"])
+        self.assertEqual(subjects[-1], "Fizik")  # Undated goals sort first
+    
+    def test_upcoming_goals_skip_undated(self):
+        self.assertEqual([goal["subject"] for goal in self.goals.get_upcoming_goals()], ["Fizik"])
+    
+    def test_goal_at_risk_ignores_undated_goals(self):
+        engine = mock.Mock(goal_tracker=self.goals, settings={"goal_warning_days": 7})
+        results = goal_at_risk(engine, self.today)
+        self.assertEqual([(rec["subject"], rec["message_key"]) for rec in results],
+                         [("Fizik", "recommendations.goal_overdue")])
+
+if __name__ == "__main__":
+    unittest.main()
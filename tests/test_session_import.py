@@ -0,0 +1,66 @@
+"""
+Tests for validating imported study sessions
+"""
+
+import math
+import tempfile
+import unittest
+from unittest import mock
+from src.utils import time_tracker
+
+class SessionImportTests(unittest.TestCase):
+    def setUp(self):
+        data_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(data_dir.cleanup)
+        patcher = mock.patch.object(time_tracker, "get_data_dir", lambda: data_dir.name)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tracker = time_tracker.TimeTracker()
+    
+    def prepare(self, **fields):
+        record = {"subject": "Matematik", "start_time": "2026-10-01T10:00:00", "duration_minutes": 30}
+        record.update(fields)
+        return self.tracker.prepare_import([record], ["Matematik"])
+    
+    def assertRowRejected(self, **fields):
+        batch = self.prepare(**fields)
+        self.assertEqual((batch["imported"], batch["skipped"]), (0, 1), fields)
+        self.assertEqual(len(batch["errors"]), 1)
+    
+    def test_valid_row(self):
+        batch = self.prepare(questions_solved="4")
+        self.assertEqual(batch["imported"], 1)
+        self.assertEqual(batch["questions"], [("2026-10-01", "Matematik", 4)])
+    
+    def test_non_finite_numbers_are_row_errors(self):
+        self.assertRowRejected(duration_minutes="inf")
+        self.assertRowRejected(duration_minutes="-inf")
+        self.assertRowRejected(questions_solved="inf")
+        self.assertRowRejected(questions_solved="nan")
+    
+    def test_nan_duration_with_end_time_is_rejected(self):
+        self.assertRowRejected(duration_minutes="nan", end_time="2026-10-01T11:00:00")
+    
+    def test_out_of_range_values_are_row_errors(self):
+        self.assertRowRejected(duration_minutes="1e12")
+        self.assertRowRejected(start_time=1e20)
+        self.assertRowRejected(start_time="1e20")
+        self.assertRowRejected(start_time=float("nan"))
+    
+    def test_bad_row_does_not_abort_the_batch(self):
+        rows = [
+            {"subject": "Matematik", "start_time": 1e20, "duration_minutes": 30},
+            {"subject": "Matematik", "start_time": "2026-10-01T10:00:00", "duration_minutes": "1e12"},
+            {"subject": "Matematik", "start_time": "2026-10-01T10:00:00", "duration_minutes": 30}
+        ]
+        batch = self.tracker.prepare_import(rows, ["Matematik"])
+        self.assertEqual((batch["imported"], batch["skipped"]), (1, 2))
+        for session in batch["sessions"].values():
+            self.assertTrue(math.isfinite(session["duration_minutes"]))
+    
+    def test_unknown_subject_is_rejected(self):
+        batch = self.prepare(subject="Tarih")
+        self.assertEqual(batch["errors"], [(1, "unknown subject")])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests for the cached dashboard and subject views of the main window
+"""
+
+import tkinter
+import types
+import unittest
+
+try:
+    import customtkinter as ctk
+    from src.ui.main_window import MainWindow
+except ImportError:  # GUI dependencies not installed
+    ctk = None
+
+class ViewCacheTests(unittest.TestCase):
+    def setUp(self):
+        if ctk is None:
+            self.skipTest("customtkinter is not installed")
+        try:
+            self.root = ctk.CTk()
+        except tkinter.TclError:
+            self.skipTest("no display")
+        self.addCleanup(self.root.destroy)
+        
+        main_content = ctk.CTkFrame(self.root)
+        main_content.grid(row=0, column=0, sticky="nsew")
+        # Cached views are built the way MainWindow builds them: a scroll frame inside
+        # the container that is hidden and re-shown
+        self.window = types.SimpleNamespace(
+            main_content=main_content,
+            _dashboard_view=self._cached_view(main_content),
+            _subject_views={"Matematik": {"frame": self._cached_view(main_content)}},
+            _cancel_subject_render=lambda: None
+        )
+    
+    @staticmethod
+    def _cached_view(parent):
+        container = ctk.CTkFrame(parent, fg_color="transparent")
+        container.grid(row=0, column=0, sticky="nsew")
+        ctk.CTkScrollableFrame(container).pack(fill="both", expand=True)
+        return container
+    
+    def test_views_survive_repeated_clears(self):
+        transient = ctk.CTkLabel(self.window.main_content, text="error")
+        transient.grid(row=0, column=0)
+        
+        MainWindow._clear_main_content(self.window)
+        MainWindow._clear_main_content(self.window)
+        
+        self.assertFalse(transient.winfo_exists())
+        for view in (self.window._dashboard_view, self.window._subject_views["Matematik"]["frame"]):
+            self.assertTrue(view.winfo_exists())
+            view.grid()  # Re-showing a cached view must not raise TclError
+            self.assertTrue(view.winfo_manager())
+            MainWindow._clear_main_content(self.window)
+            self.assertTrue(view.winfo_exists())
+
+if __name__ == "__main__":
+    unittest.main()